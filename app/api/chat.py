@@ -1,29 +1,153 @@
-from fastapi import APIRouter, HTTPException, Request
-from app.models.schemas import ChatCompletionRequest, ChatCompletionResponse, ChatCompletionChoice, ChatMessage
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from app.models.schemas import (
+    ChatCompletionRequest,
+    ChatCompletionResponse,
+    ChatCompletionChoice,
+    ChatCompletionChunk,
+    ChatCompletionChunkChoice,
+    ChatCompletionChunkDelta,
+    ChatMessage,
+    RequestTrace,
+    WordTimestamp
+)
 from app.services.sign_language_service import get_sign_language_service
-from app.services.llm_service import LLMService
+from app.services.llm_service import get_llm_service
+from app.services.structured_log import get_logger
+from app.services.tracing import current_trace, request_trace, span
+from typing import AsyncIterator, Optional
+import asyncio
+import json
 import time
 
 router = APIRouter()
 
 # Initialize services
 sign_service = get_sign_language_service()
-llm_service = LLMService()
+llm_service = get_llm_service()
+log = get_logger(__name__)
+
+async def normalize_user_input(request: ChatCompletionRequest, last_user_message: str) -> Optional[str]:
+    """Convert the user's input to ASL format for suggestion, if requested"""
+    if not request.include_user_input_asl:
+        return None
+    return await asyncio.to_thread(sign_service.normalize_text, last_user_message)
+
+
+def _sse(payload: str) -> str:
+    """Format one server-sent event"""
+    return f"data: {payload}\n\n"
+
+
+async def stream_chat_completion(request: ChatCompletionRequest, last_user_message: str) -> AsyncIterator[str]:
+    """
+    Stream a chat completion as OpenAI-style server-sent events.
+
+    Text deltas are forwarded as the LLM produces them. The same deltas feed
+    the incremental sign pipeline, which resolves each finished word while
+    generation continues; resolved words are sent as video_urls chunks as
+    soon as they are ready, so playback can start before the reply ends.
+
+    Headers are sent before any work is timed, so a traced stream returns
+    its timing breakdown in the last chunk's debug field instead of a
+    Server-Timing header.
+    """
+    with request_trace(request.debug):
+        async for event in _stream_events(request, last_user_message):
+            yield event
+
+
+async def _stream_events(request: ChatCompletionRequest, last_user_message: str) -> AsyncIterator[str]:
+    """Produce the server-sent events of stream_chat_completion."""
+    completion_id = f"chatcmpl-{int(time.time())}"
+    created = int(time.time())
+    events: asyncio.Queue = asyncio.Queue()
+
+    def chunk(debug: Optional[RequestTrace] = None, **choice) -> str:
+        return _sse(ChatCompletionChunk(
+            id=completion_id,
+            created=created,
+            model=request.model,
+            choices=[ChatCompletionChunkChoice(**choice)],
+            debug=debug
+        ).model_dump_json(exclude_none=True))
+
+    async def text_deltas() -> AsyncIterator[str]:
+        async for delta in llm_service.generate_response_stream(request.messages, temperature=request.temperature):
+            events.put_nowait(("text", delta))
+            yield delta
+
+    async def pipeline() -> None:
+        try:
+            async for token, url in sign_service.generate_video_stream(text_deltas(), format=request.format):
+                events.put_nowait(("video", token, url))
+        except Exception as e:
+            events.put_nowait(("error", e))
+        finally:
+            events.put_nowait(None)
+
+    yield chunk(delta=ChatCompletionChunkDelta(role="assistant"))
+
+    user_input = asyncio.ensure_future(normalize_user_input(request, last_user_message))
+    worker = asyncio.ensure_future(pipeline())
+    try:
+        finished = False
+        while not finished:
+            batch = [await events.get()]
+            while not events.empty():
+                batch.append(events.get_nowait())
+
+            # Consecutive resolved words go out in one chunk
+            video_urls, missing_words = [], []
+            for event in batch + [("flush",)]:
+                if event is not None and event[0] == "video":
+                    _, token, url = event
+                    if url:
+                        video_urls.append(url)
+                    else:
+                        missing_words.append(token)
+                    continue
+                if video_urls or missing_words:
+                    yield chunk(video_urls=video_urls, missing_videos=missing_words or None)
+                    video_urls, missing_words = [], []
+                if event is None:
+                    finished = True
+                elif event[0] == "error":
+                    raise event[1]
+                elif event[0] == "text":
+                    yield chunk(delta=ChatCompletionChunkDelta(content=event[1]))
+
+        user_input_asl = await user_input
+        trace = current_trace()
+        debug = RequestTrace(**trace.to_dict()) if trace is not None and request.debug else None
+        yield chunk(finish_reason="stop", user_input_asl=user_input_asl, debug=debug)
+    except Exception as e:
+        log.error("Streaming chat completion failed", error=str(e))
+        yield _sse(json.dumps({
+            "error": {
+                "message": f"Error generating sign language response: {str(e)}",
+                "type": "server_error"
+            }
+        }))
+    finally:
+        worker.cancel()
+        user_input.cancel()
+
+    yield _sse("[DONE]")
 
 
 @router.post("/v1/chat/completions", response_model=ChatCompletionResponse)
-async def create_chat_completion(request: ChatCompletionRequest, http_request: Request):
+async def create_chat_completion(request: ChatCompletionRequest, http_request: Request, http_response: Response):
     """
     OpenAI-compatible chat completion endpoint.
 
     This endpoint mimics OpenAI's chat API but responds with sign language videos.
     The assistant's text response is also converted to a sign language video.
+    With stream=true the response is sent as server-sent events.
+    With debug=true the response carries a timing breakdown (debug field and
+    Server-Timing header).
     """
     try:
-        # Validate request
-        if request.stream:
-            raise HTTPException(status_code=400, detail="Streaming is not supported")
-
         # Extract the last user message
         user_messages = [msg for msg in request.messages if msg.role == "user"]
         if not user_messages:
@@ -31,56 +155,80 @@ async def create_chat_completion(request: ChatCompletionRequest, http_request: R
 
         last_user_message = user_messages[-1].content
 
-        # Generate text response using LLM service
-        assistant_response = llm_service.generate_response(request.messages)
-
-        # Lookup sign language videos for the assistant's response
-        video_urls, missing_words, normalized_text = sign_service.generate_video(
-            assistant_response,
-            format=request.format
-        )
-
-        # Video URLs from SignASL API are already absolute, no need to prepend base_url
-        absolute_video_urls = video_urls
-
-        # Convert user's input to ASL format for suggestion
-        _, _, user_input_asl = sign_service.generate_video(
-            last_user_message,
-            format=request.format
-        )
-
-        # Calculate token counts (approximate - based on words in normalized text)
-        prompt_tokens = sum(len(msg.content.split()) for msg in request.messages)
-        completion_tokens = len(normalized_text.split())
-
-        # Create choice with video URLs
-        choice = ChatCompletionChoice(
-            index=0,
-            message=ChatMessage(
-                role="assistant",
-                content=assistant_response
-            ),
-            finish_reason="stop",
-            video_urls=absolute_video_urls,
-            user_input_asl=user_input_asl
-        )
-
-        # Add missing_videos if there are any
-        if missing_words:
-            choice.missing_videos = missing_words
-
-        # Create response in OpenAI format
-        response = ChatCompletionResponse(
-            id=f"chatcmpl-{int(time.time())}",
-            created=int(time.time()),
-            model=request.model,
-            choices=[choice],
-            usage={
-                "prompt_tokens": prompt_tokens,
-                "completion_tokens": completion_tokens,
-                "total_tokens": prompt_tokens + completion_tokens
-            }
-        )
+        if request.stream:
+            return StreamingResponse(
+                stream_chat_completion(request, last_user_message),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+            )
+
+        with request_trace(request.debug) as trace:
+            # Generate text response using LLM service, normalizing the user's
+            # input for the ASL suggestion meanwhile (no video lookups needed)
+            assistant_response, user_input_asl = await asyncio.gather(
+                llm_service.generate_response_async(request.messages, temperature=request.temperature),
+                normalize_user_input(request, last_user_message)
+            )
+
+            # Lookup sign language videos for the assistant's response, signing
+            # synonyms for words without a video (VOCAB_MODE=rewrite)
+            video_urls, missing_words, normalized_text = await sign_service.generate_video_async(
+                assistant_response,
+                format=request.format,
+                rewrite=True
+            )
+
+            # Optionally stitch the clips into a single video
+            composition = None
+            if request.compose:
+                with span("compose"):
+                    composition = await sign_service.compose_video_async(normalized_text, format=request.format)
+
+            with span("build"):
+                # Video URLs from SignASL API are already absolute, no need to prepend base_url
+                absolute_video_urls = video_urls
+
+                # Calculate token counts (approximate - based on words in normalized text)
+                prompt_tokens = sum(len(msg.content.split()) for msg in request.messages)
+                completion_tokens = len(normalized_text.split())
+
+                # Create choice with video URLs
+                choice = ChatCompletionChoice(
+                    index=0,
+                    message=ChatMessage(
+                        role="assistant",
+                        content=assistant_response
+                    ),
+                    finish_reason="stop",
+                    video_urls=absolute_video_urls,
+                    user_input_asl=user_input_asl
+                )
+
+                # Add missing_videos if there are any
+                if missing_words:
+                    choice.missing_videos = missing_words
+
+                if composition:
+                    choice.video_url = composition.url
+                    choice.timestamps = [WordTimestamp(**t) for t in composition.timestamps]
+
+                # Create response in OpenAI format
+                response = ChatCompletionResponse(
+                    id=f"chatcmpl-{int(time.time())}",
+                    created=int(time.time()),
+                    model=request.model,
+                    choices=[choice],
+                    usage={
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens
+                    }
+                )
+
+            if trace is not None:
+                http_response.headers["Server-Timing"] = trace.server_timing()
+                if request.debug:
+                    response.debug = RequestTrace(**trace.to_dict())
 
         return response
 
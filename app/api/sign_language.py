@@ -1,59 +1,75 @@
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 from app.models.schemas import (
     SignLanguageRequest,
     SignLanguageResponse,
     ErrorResponse,
     VideoListResponse,
     VideoLookupResponse,
-    VideoInfo
+    VideoInfo,
+    NegativeCacheEntry,
+    NegativeCacheResponse,
+    RequestTrace,
+    WordTimestamp
 )
+from datetime import datetime
 from app.services.sign_language_service import get_sign_language_service
+from app.services.tracing import request_trace, span
 
 router = APIRouter()
 sign_service = get_sign_language_service()
 
 
 @router.post("/generate", response_model=SignLanguageResponse)
-async def generate_sign_language(request: SignLanguageRequest, http_request: Request):
+async def generate_sign_language(request: SignLanguageRequest, http_request: Request, http_response: Response):
     """
     Direct endpoint to convert text to sign language videos.
 
     This endpoint bypasses the LLM and directly converts provided text to sign language
-    by looking up videos from the repository.
+    by looking up videos from the repository. With debug=true the response carries
+    a timing breakdown (debug field and Server-Timing header).
 
     Returns:
         - 200: Success with video URLs
         - 404: Some or all words not found in repository
     """
     try:
-        # Lookup sign language videos
-        video_urls, missing_words, normalized_text = sign_service.generate_video(
-            request.text,
-            format=request.format
-        )
-
-        # Video URLs from SignASL API are already absolute, no need to prepend base_url
-        absolute_video_urls = video_urls
-
-        # If there are missing words, return 404 with partial results
-        if missing_words:
-            return SignLanguageResponse(
-                success=False,
-                video_urls=absolute_video_urls,
-                text=request.text,
-                normalized_text=normalized_text,
-                format=request.format,
-                missing_videos=missing_words
+        with request_trace(request.debug) as trace:
+            # Lookup sign language videos
+            video_urls, missing_words, normalized_text = await sign_service.generate_video_async(
+                request.text,
+                format=request.format
             )
 
-        # Success - all words found
-        response = SignLanguageResponse(
-            success=True,
-            video_urls=absolute_video_urls,
-            text=request.text,
-            normalized_text=normalized_text,
-            format=request.format
-        )
+            # Video URLs from SignASL API are already absolute, no need to prepend base_url
+            absolute_video_urls = video_urls
+
+            # Optionally stitch the clips into a single video
+            composition = None
+            if request.compose:
+                with span("compose"):
+                    composition = await sign_service.compose_video_async(normalized_text, format=request.format)
+
+            with span("build"):
+                composed = {
+                    "video_url": composition.url,
+                    "timestamps": [WordTimestamp(**t) for t in composition.timestamps],
+                } if composition else {}
+
+                # Missing words are reported with partial results (success=false)
+                response = SignLanguageResponse(
+                    success=not missing_words,
+                    video_urls=absolute_video_urls,
+                    text=request.text,
+                    normalized_text=normalized_text,
+                    format=request.format,
+                    missing_videos=missing_words or None,
+                    **composed
+                )
+
+            if trace is not None:
+                http_response.headers["Server-Timing"] = trace.server_timing()
+                if request.debug:
+                    response.debug = RequestTrace(**trace.to_dict())
 
         return response
 
@@ -97,6 +113,37 @@ async def list_available_videos():
         )
 
 
+@router.get("/videos/missing", response_model=NegativeCacheResponse)
+async def list_missing_videos():
+    """
+    List words known to have no sign language video (negative cache).
+
+    These words are not looked up again until their entry expires.
+    """
+    try:
+        negative_words = sign_service.repository.get_negative_words()
+
+        words = [
+            NegativeCacheEntry(
+                word=word,
+                retry_at=datetime.utcfromtimestamp(expires_at)
+            )
+            for word, expires_at in sorted(negative_words.items())
+        ]
+
+        return NegativeCacheResponse(
+            success=True,
+            total_words=len(words),
+            words=words
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error retrieving missing video list: {str(e)}"
+        )
+
+
 @router.get("/videos/lookup/{word}")
 async def lookup_word_video(word: str, http_request: Request):
     """
@@ -110,7 +157,7 @@ async def lookup_word_video(word: str, http_request: Request):
         - 404: Video not found
     """
     try:
-        video_url = sign_service.repository.lookup_word(word)
+        video_url = await sign_service.repository.lookup_word_async(word)
 
         if video_url is None:
             return ErrorResponse(
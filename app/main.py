@@ -1,9 +1,17 @@
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import chat, sign_language
 from app.models.schemas import HealthResponse
 from app.services.video_repository import get_video_repository
+from app.services.signasl_client import get_signasl_client
+from app.services.cache_warmup import get_cache_warmer
+from app.services.sign_language_service import get_sign_language_service
+from app.services.llm_service import close_llm_http_client, get_llm_service
+from app.services.fingerspelling import get_fingerspelling_index
+from app.services.video_composer import get_video_composer
+from app.services.video_files import VideoFiles
+from app.services.phrase_cache import get_phrase_cache, read_seed_phrases
+from app.services.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, get_metrics
 import os
 from datetime import datetime
 from dotenv import load_dotenv
@@ -33,14 +41,48 @@ app.add_middleware(
 os.makedirs("output/videos", exist_ok=True)
 os.makedirs("static/videos", exist_ok=True)
 
-# Mount static files for video serving
-app.mount("/videos", StaticFiles(directory="output/videos"), name="videos")
+# Mount video files (ETag/304, Range/206, immutable caching for hashed clips)
+video_files = VideoFiles(
+    directory="output/videos",
+    immutable_dirs=("mirror", "composed", "phrases"),
+    max_age=int(os.getenv("VIDEO_HTTP_MAX_AGE", "3600"))
+)
+app.mount("/videos", video_files, name="videos")
 
 # Include routers
 app.include_router(chat.router, tags=["Chat Completion (OpenAI-compatible)"])
 app.include_router(sign_language.router, prefix="/api/sign-language", tags=["Sign Language"])
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Warm the video cache, fingerspelling index and phrase cache in the background"""
+    if os.getenv("VIDEO_WARMUP_ENABLED", "false").lower() == "true":
+        get_cache_warmer().start()
+    get_fingerspelling_index().start()
+    phrase_cache = get_phrase_cache()
+    if phrase_cache.enabled:
+        seeds = read_seed_phrases(os.getenv("PHRASE_CACHE_SEED_FILE", ""))
+        llm_service = get_llm_service()
+        if llm_service.provider == "placeholder":
+            seeds += list(llm_service.responses.values())
+        phrase_cache.seed(seeds)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled upstream connections and flush buffered cache writes"""
+    await get_cache_warmer().stop()
+    await get_fingerspelling_index().stop()
+    await get_phrase_cache().stop()
+    await get_signasl_client().aclose()
+    await get_llm_service().aclose()
+    await close_llm_http_client()
+    await get_video_repository().mirror.aclose()
+    get_video_repository().flush()
+    get_video_composer().shutdown()
+
+
 @app.get("/", response_model=HealthResponse)
 async def root():
     """Root endpoint - health check"""
@@ -49,12 +91,49 @@ async def root():
         status="healthy",
         version=os.getenv("API_VERSION", "1.0.0"),
         llm_provider=os.getenv("LLM_PROVIDER", "placeholder"),
-        video_repository="local",
+        video_repository=video_repo.get_cache_backend_name(),
         total_videos=video_repo.get_total_videos(),
         timestamp=datetime.utcnow()
     )
 
 
+def register_cache_gauges() -> None:
+    """Expose cache sizes at /metrics (read only when scraped)."""
+    metrics = get_metrics()
+    video_repo = get_video_repository()
+    sign_service = get_sign_language_service()
+    llm_service = get_llm_service()
+    phrase_cache = get_phrase_cache()
+    metrics.gauge("gesturegpt_video_cache_entries", "Words with a cached video URL", video_repo.get_total_videos)
+    metrics.gauge("gesturegpt_video_negative_cache_entries", "Words known to have no video", video_repo.get_total_negative)
+    metrics.gauge("gesturegpt_sign_memo_entries", "Memoized text-to-video results", lambda: len(sign_service.memo))
+    metrics.gauge(
+        "gesturegpt_llm_completion_cache_entries", "Cached LLM completions",
+        lambda: len(llm_service.completion_cache.entries) if llm_service.completion_cache else None
+    )
+    metrics.gauge(
+        "gesturegpt_clip_mirror_bytes", "Disk used by mirrored clips",
+        lambda: video_repo.mirror.total_bytes if video_repo.mirror.enabled else None
+    )
+    metrics.gauge(
+        "gesturegpt_phrase_cache_bytes", "Disk used by pre-rendered phrases",
+        lambda: phrase_cache.total_bytes if phrase_cache.enabled else None
+    )
+
+
+if get_metrics().enabled:
+    register_cache_gauges()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    """Prometheus metrics (METRICS_ENABLED=true)"""
+    metrics = get_metrics()
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled (set METRICS_ENABLED=true)")
+    return Response(content=metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
@@ -63,8 +142,18 @@ async def health_check():
         status="healthy",
         version=os.getenv("API_VERSION", "1.0.0"),
         llm_provider=os.getenv("LLM_PROVIDER", "placeholder"),
-        video_repository="local",
+        video_repository=video_repo.get_cache_backend_name(),
         total_videos=video_repo.get_total_videos(),
+        warmup=get_cache_warmer().get_status(),
+        memo=get_sign_language_service().get_memo_stats(),
+        llm_cache=get_llm_service().get_cache_stats(),
+        llm_scheduler=get_llm_service().get_scheduler_stats(),
+        vocabulary=get_sign_language_service().get_vocabulary_stats(),
+        fingerspelling=get_fingerspelling_index().get_stats(),
+        composer=get_video_composer().get_stats(),
+        phrases=get_sign_language_service().get_phrase_stats(),
+        mirror=video_repo.mirror.get_stats(),
+        video_files=video_files.get_stats(),
         timestamp=datetime.utcnow()
     )
 
@@ -3,6 +3,28 @@ from typing import Optional, Literal, List, Dict, Any
 from datetime import datetime
 
 
+class WordTimestamp(BaseModel):
+    """When a word plays in a composed video"""
+    word: str = Field(..., description="Word token")
+    start: float = Field(..., description="Start time in seconds")
+    end: float = Field(..., description="End time in seconds")
+
+
+class TraceSpan(BaseModel):
+    """One timed step of a traced request"""
+    name: str = Field(..., description="Step (llm, normalize, lookup, compose, build)")
+    start_ms: float = Field(..., description="Start, in milliseconds since the request began")
+    duration_ms: float = Field(..., description="Duration in milliseconds")
+    attributes: Optional[Dict[str, Any]] = Field(None, description="Step details (e.g. provider, word, result)")
+
+
+class RequestTrace(BaseModel):
+    """Timing breakdown of a request (debug=true)"""
+    trace_id: str = Field(..., description="Trace ID, also logged with the request's log lines")
+    total_ms: float = Field(..., description="Time from the start of the trace to when it was returned")
+    spans: List[TraceSpan] = Field(default_factory=list, description="Timed steps, in the order they finished")
+
+
 # OpenAI-compatible schemas
 class ChatMessage(BaseModel):
     """Chat message in OpenAI format"""
@@ -14,10 +36,13 @@ class ChatCompletionRequest(BaseModel):
     """OpenAI-compatible chat completion request"""
     model: str = Field(default="gesturegpt-v1", description="Model identifier")
     messages: List[ChatMessage] = Field(..., min_length=1, description="List of messages in the conversation")
-    temperature: Optional[float] = Field(default=1.0, ge=0, le=2, description="Sampling temperature (ignored)")
+    temperature: Optional[float] = Field(default=None, ge=0, le=2, description="Sampling temperature (omitted: provider default); only 0 makes the reply cacheable unless LLM_CACHE_FORCE is set")
     max_tokens: Optional[int] = Field(default=None, description="Maximum tokens (ignored)")
-    stream: bool = Field(default=False, description="Stream response (not supported)")
+    stream: bool = Field(default=False, description="Stream the response as server-sent events")
     format: Literal["mp4", "gif"] = Field(default="mp4", description="Video format for sign language response")
+    compose: bool = Field(default=False, description="Also stitch the clips into one video (video_url + timestamps); not applied when streaming")
+    include_user_input_asl: bool = Field(default=True, description="Return the user's last message normalized to ASL (user_input_asl)")
+    debug: bool = Field(default=False, description="Return a timing breakdown (debug) and a Server-Timing header")
 
     class Config:
         json_schema_extra = {
@@ -38,6 +63,8 @@ class ChatCompletionChoice(BaseModel):
     finish_reason: str = Field(default="stop", description="Reason for completion finish")
     video_urls: List[str] = Field(default_factory=list, description="URLs to sign language videos")
     missing_videos: Optional[List[str]] = Field(None, description="Words without available videos")
+    video_url: Optional[str] = Field(None, description="Single composed video of all clips (compose=true)")
+    timestamps: Optional[List[WordTimestamp]] = Field(None, description="Start/end of each word in the composed video")
     user_input_asl: Optional[str] = Field(None, description="User's input converted to ASL format (text suggestion)")
 
 
@@ -56,6 +83,7 @@ class ChatCompletionResponse(BaseModel):
     model: str = Field(..., description="Model used")
     choices: List[ChatCompletionChoice] = Field(..., description="List of completion choices")
     usage: ChatCompletionUsage = Field(default_factory=ChatCompletionUsage, description="Token usage stats")
+    debug: Optional[RequestTrace] = Field(None, description="Timing breakdown (debug=true)")
 
     class Config:
         json_schema_extra = {
@@ -87,12 +115,40 @@ class ChatCompletionResponse(BaseModel):
         }
 
 
+class ChatCompletionChunkDelta(BaseModel):
+    """Incremental message content in a streamed chunk"""
+    role: Optional[Literal["assistant"]] = Field(None, description="Set on the first chunk")
+    content: Optional[str] = Field(None, description="Text generated since the previous chunk")
+
+
+class ChatCompletionChunkChoice(BaseModel):
+    """Choice in a streamed chat completion chunk"""
+    index: int = Field(default=0, description="Choice index")
+    delta: ChatCompletionChunkDelta = Field(default_factory=ChatCompletionChunkDelta, description="Message delta")
+    finish_reason: Optional[str] = Field(None, description="Set on the last chunk")
+    video_urls: Optional[List[str]] = Field(None, description="Sign language videos for the words finished since the previous video chunk")
+    missing_videos: Optional[List[str]] = Field(None, description="Words in this chunk without available videos")
+    user_input_asl: Optional[str] = Field(None, description="User's input converted to ASL format (last chunk)")
+
+
+class ChatCompletionChunk(BaseModel):
+    """OpenAI-compatible streamed chat completion chunk"""
+    id: str = Field(..., description="Completion ID, shared by all chunks")
+    object: str = Field(default="chat.completion.chunk", description="Object type")
+    created: int = Field(..., description="Unix timestamp of creation")
+    model: str = Field(..., description="Model used")
+    choices: List[ChatCompletionChunkChoice] = Field(..., description="Chunk choices")
+    debug: Optional[RequestTrace] = Field(None, description="Timing breakdown (debug=true, last chunk)")
+
+
 # Direct sign language endpoint schemas
 class SignLanguageRequest(BaseModel):
     """Request model for sign language video generation"""
     text: str = Field(..., min_length=1, max_length=500, description="Text to convert to sign language")
     format: Literal["mp4", "gif"] = Field(default="mp4", description="Output video format")
+    compose: bool = Field(default=False, description="Also stitch the clips into one video (video_url + timestamps)")
     include_subtitles: bool = Field(default=True, description="Include text subtitles in response")
+    debug: bool = Field(default=False, description="Return a timing breakdown (debug) and a Server-Timing header")
 
     class Config:
         json_schema_extra = {
@@ -112,7 +168,10 @@ class SignLanguageResponse(BaseModel):
     normalized_text: str = Field(..., description="Normalized text (uppercase tokens)")
     format: str = Field(..., description="Video format (mp4 or gif)")
     missing_videos: Optional[List[str]] = Field(None, description="Words without available videos")
+    video_url: Optional[str] = Field(None, description="Single composed video of all clips (compose=true)")
+    timestamps: Optional[List[WordTimestamp]] = Field(None, description="Start/end of each word in the composed video")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Generation timestamp")
+    debug: Optional[RequestTrace] = Field(None, description="Timing breakdown (debug=true)")
 
     class Config:
         json_schema_extra = {
@@ -146,6 +205,16 @@ class HealthResponse(BaseModel):
     llm_provider: Optional[str] = Field(None, description="LLM provider being used")
     video_repository: str = Field(default="local", description="Video repository type")
     total_videos: int = Field(default=0, description="Total videos available")
+    warmup: Optional[Dict[str, Any]] = Field(None, description="Cache warm-up progress")
+    memo: Optional[Dict[str, Any]] = Field(None, description="Text-to-video result memo hit-rate statistics")
+    llm_cache: Optional[Dict[str, Any]] = Field(None, description="LLM completion cache hit-rate statistics")
+    vocabulary: Optional[Dict[str, Any]] = Field(None, description="Vocabulary constraint mode and synonym substitutions")
+    video_files: Optional[Dict[str, Any]] = Field(None, description="/videos conditional (304) and partial (206) response counters")
+    mirror: Optional[Dict[str, Any]] = Field(None, description="Local clip mirror size and download counters")
+    phrases: Optional[Dict[str, Any]] = Field(None, description="Pre-rendered phrase cache hit rate and disk usage")
+    composer: Optional[Dict[str, Any]] = Field(None, description="Video composition counters")
+    fingerspelling: Optional[Dict[str, Any]] = Field(None, description="Fingerspelling fallback coverage and usage")
+    llm_scheduler: Optional[Dict[str, Any]] = Field(None, description="LLM request coalescing and micro-batching statistics")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Current timestamp")
 
 
@@ -176,6 +245,30 @@ class VideoListResponse(BaseModel):
         }
 
 
+class NegativeCacheEntry(BaseModel):
+    """A word known to have no video"""
+    word: str = Field(..., description="The word SignASL has no video for")
+    retry_at: datetime = Field(..., description="When the word will be looked up again")
+
+
+class NegativeCacheResponse(BaseModel):
+    """Response for listing words without videos (negative cache)"""
+    success: bool = Field(default=True, description="Whether the request was successful")
+    total_words: int = Field(..., description="Number of words in the negative cache")
+    words: List[NegativeCacheEntry] = Field(..., description="Words without available videos")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "success": True,
+                "total_words": 1,
+                "words": [
+                    {"word": "GESTUREGPT", "retry_at": "2024-01-16T10:30:00"}
+                ]
+            }
+        }
+
+
 class VideoLookupResponse(BaseModel):
     """Response for single word video lookup"""
     success: bool = Field(default=True, description="Whether the request was successful")
@@ -0,0 +1,556 @@
+"""
+Cache Backends
+In-memory lookup tier of the video cache (word -> video URL).
+
+The persistent store (see cache_store.py) keeps the cache across restarts;
+the backend is what lookups read on every request. A shared backend lets
+every uvicorn/gunicorn worker see words resolved by any other worker.
+
+Backends (VIDEO_CACHE_SHARED_BACKEND):
+- local: process-local dict (default)
+- mmap: fixed-size hash table in a memory-mapped file, shared by all
+  workers on one host
+- redis: Redis hash, shared by all workers that reach the server
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.services.structured_log import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks
+    fcntl = None
+
+log = get_logger(__name__)
+
+
+class CacheBackend(MutableMapping):
+    """
+    Interface for the word -> URL lookup tier.
+
+    Backends behave like a dict of str to str.
+    """
+
+    name = "base"
+    # Whether other processes see this backend's entries
+    shared = False
+    # Whether reads may wait on the network (async callers use get_many
+    # in a worker thread first, so later reads hit a local copy)
+    blocking = False
+
+    def get_many(self, keys: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Read several keys at once.
+
+        Args:
+            keys: Keys to read
+
+        Returns:
+            Mapping of key to value (None when absent)
+        """
+        return {key: self.get(key) for key in keys}
+
+    def load(self, entries: Dict[str, str]) -> None:
+        """
+        Seed the backend from the persistent store.
+        Process-local backends are replaced; shared backends are merged into,
+        since other workers may already have added entries.
+        """
+        if not self.shared:
+            self.clear()
+        self.update(entries)
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+    def stats(self) -> Dict[str, object]:
+        """Backend statistics for diagnostics."""
+        return {"backend": self.name, "entries": len(self)}
+
+
+class LocalCacheBackend(CacheBackend):
+    """Process-local dict."""
+
+    name = "local"
+
+    def __init__(self):
+        self._data: Dict[str, str] = {}
+
+    def __getitem__(self, key: str) -> str:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self._data.get(key, default)
+
+    def items(self):
+        return list(self._data.items())
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class MmapCacheBackend(CacheBackend):
+    """
+    Open-addressing hash table in a memory-mapped file.
+
+    Layout: a 64-byte header (magic, version, slot count, entry count)
+    followed by fixed-size slots of
+    [state:1][key_len:2][value_len:2][key:MAX_KEY][value:rest].
+    Keys are hashed with CRC32 (stable across processes) and probed
+    linearly; deletes leave tombstones. Readers take a shared flock and
+    writers an exclusive one, so torn reads are impossible across workers.
+
+    Entries too large for a slot (or added once the table is full) are kept
+    in a process-local overflow dict. clear() bumps a generation counter in
+    the header, and every worker drops its overflow when it sees the
+    counter change, so a clear reaches all of them.
+    """
+
+    name = "mmap"
+    shared = True
+
+    MAGIC = b"GGVCACHE"
+    VERSION = 1
+    HEADER = struct.Struct("<8sIII")
+    HEADER_SIZE = 64
+    # Bumped by clear(); stored in the header's spare bytes (zero in older files)
+    GENERATION = struct.Struct("<I")
+    GENERATION_OFFSET = HEADER.size
+    SLOT_HEADER = struct.Struct("<BHH")
+    SLOT_SIZE = 512
+    MAX_KEY = 64
+    MAX_VALUE = SLOT_SIZE - SLOT_HEADER.size - MAX_KEY
+
+    EMPTY, USED, DELETED = 0, 1, 2
+
+    # Stop inserting past this fill ratio to keep probe chains short
+    MAX_LOAD = 0.85
+
+    def __init__(self, path: str, slots: int = 16384):
+        """
+        Args:
+            path: File backing the table (use /dev/shm for a RAM-only table)
+            slots: Number of slots when creating a new table
+        """
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._overflow: Dict[str, str] = {}
+        self._overflow_generation = 0
+        self._full_warned = False
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._flock(exclusive=True)
+        try:
+            size = os.fstat(self._fd).st_size
+            if size < self.HEADER_SIZE:
+                os.ftruncate(self._fd, self.HEADER_SIZE + slots * self.SLOT_SIZE)
+                self._mm = mmap.mmap(self._fd, 0)
+                self.HEADER.pack_into(self._mm, 0, self.MAGIC, self.VERSION, slots, 0)
+            else:
+                self._mm = mmap.mmap(self._fd, 0)
+                magic, version, _, _ = self.HEADER.unpack_from(self._mm, 0)
+                if magic != self.MAGIC or version != self.VERSION:
+                    raise ValueError(f"{path} is not a GestureGPT cache table")
+            self.slots = self.HEADER.unpack_from(self._mm, 0)[2]
+            self._overflow_generation = self._generation()
+        finally:
+            self._funlock()
+
+    def _flock(self, exclusive: bool) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+    def _funlock(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """Hold the thread lock and the cross-process file lock."""
+        with self._thread_lock:
+            self._flock(exclusive)
+            try:
+                yield
+            finally:
+                self._funlock()
+
+    def _generation(self) -> int:
+        return self.GENERATION.unpack_from(self._mm, self.GENERATION_OFFSET)[0]
+
+    def _sync_overflow(self) -> None:
+        """Drop overflow entries if another worker cleared the table since they were added."""
+        generation = self._generation()
+        if generation != self._overflow_generation:
+            self._overflow.clear()
+            self._overflow_generation = generation
+
+    def _count(self) -> int:
+        return self.HEADER.unpack_from(self._mm, 0)[3]
+
+    def _set_count(self, count: int) -> None:
+        struct.pack_into("<I", self._mm, self.HEADER.size - 4, count)
+
+    def _slot_offset(self, index: int) -> int:
+        return self.HEADER_SIZE + index * self.SLOT_SIZE
+
+    def _read_slot(self, index: int) -> Tuple[int, bytes, bytes]:
+        offset = self._slot_offset(index)
+        state, key_len, value_len = self.SLOT_HEADER.unpack_from(self._mm, offset)
+        if state != self.USED:
+            return state, b"", b""
+        key_start = offset + self.SLOT_HEADER.size
+        value_start = key_start + self.MAX_KEY
+        return (
+            state,
+            self._mm[key_start:key_start + key_len],
+            self._mm[value_start:value_start + value_len]
+        )
+
+    def _probe(self, key: bytes) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Find a key's slot.
+
+        Returns:
+            Tuple of (slot holding the key, first free slot on its probe chain)
+        """
+        start = zlib.crc32(key) % self.slots
+        free = None
+        for step in range(self.slots):
+            index = (start + step) % self.slots
+            state, slot_key, _ = self._read_slot(index)
+            if state == self.EMPTY:
+                return None, free if free is not None else index
+            if state == self.DELETED:
+                if free is None:
+                    free = index
+            elif slot_key == key:
+                return index, free
+        return None, free
+
+    def __getitem__(self, key: str) -> str:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        encoded = key.encode()
+        self._sync_overflow()
+        if len(encoded) > self.MAX_KEY:
+            return self._overflow.get(key, default)
+        with self._locked(exclusive=False):
+            index, _ = self._probe(encoded)
+            if index is None:
+                return self._overflow.get(key, default)
+            return self._read_slot(index)[2].decode()
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+    def __setitem__(self, key: str, value: str) -> None:
+        encoded_key = key.encode()
+        encoded_value = value.encode()
+        self._sync_overflow()
+        if len(encoded_key) > self.MAX_KEY or len(encoded_value) > self.MAX_VALUE:
+            self._overflow[key] = value
+            return
+
+        with self._locked(exclusive=True):
+            index, free = self._probe(encoded_key)
+            if index is None:
+                if free is None or self._count() + 1 > self.MAX_LOAD * self.slots:
+                    if not self._full_warned:
+                        log.warning("Shared video cache is full, keeping new entries per worker", path=self.path)
+                        self._full_warned = True
+                    self._overflow[key] = value
+                    return
+                index = free
+                self._set_count(self._count() + 1)
+
+            offset = self._slot_offset(index)
+            key_start = offset + self.SLOT_HEADER.size
+            value_start = key_start + self.MAX_KEY
+            self._mm[key_start:key_start + len(encoded_key)] = encoded_key
+            self._mm[value_start:value_start + len(encoded_value)] = encoded_value
+            # Header last: the slot only becomes visible once complete
+            self.SLOT_HEADER.pack_into(self._mm, offset, self.USED, len(encoded_key), len(encoded_value))
+
+    def __delitem__(self, key: str) -> None:
+        self._sync_overflow()
+        if self._overflow.pop(key, None) is not None:
+            return
+        with self._locked(exclusive=True):
+            index, _ = self._probe(key.encode())
+            if index is None:
+                raise KeyError(key)
+            self.SLOT_HEADER.pack_into(self._mm, self._slot_offset(index), self.DELETED, 0, 0)
+            self._set_count(self._count() - 1)
+
+    def items(self):
+        entries = []
+        self._sync_overflow()
+        with self._locked(exclusive=False):
+            for index in range(self.slots):
+                state, key, value = self._read_slot(index)
+                if state == self.USED:
+                    entries.append((key.decode(), value.decode()))
+        entries.extend(self._overflow.items())
+        return entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([key for key, _ in self.items()])
+
+    def __len__(self) -> int:
+        self._sync_overflow()
+        return self._count() + len(self._overflow)
+
+    def clear(self) -> None:
+        with self._locked(exclusive=True):
+            self._mm[self.HEADER_SIZE:] = bytes(self.slots * self.SLOT_SIZE)
+            self._set_count(0)
+            self.GENERATION.pack_into(
+                self._mm, self.GENERATION_OFFSET, (self._generation() + 1) & 0xFFFFFFFF
+            )
+            self._sync_overflow()
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "backend": self.name,
+            "entries": len(self),
+            "slots": self.slots,
+            "load_factor": round(self._count() / self.slots, 4),
+            "overflow_entries": len(self._overflow),
+            "path": self.path,
+        }
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis hash shared by all workers.
+
+    Video URLs never change once resolved, so hits are kept in a
+    process-local near cache; misses are remembered for near_ttl seconds,
+    so a word checked repeatedly in one request (or by many) costs one
+    round trip. clear() and deletes bump a generation counter in Redis;
+    each worker checks it at most every near_ttl seconds and drops its
+    near cache when it has changed, so cleared entries stop being served
+    everywhere within near_ttl.
+
+    The client is synchronous: async request paths call get_many() in a
+    worker thread before reading, and write through update() the same way.
+    """
+
+    name = "redis"
+    shared = True
+    blocking = True
+
+    def __init__(self, url: str, key: str = "gesturegpt:video_cache", client=None, near_ttl: float = 5.0):
+        """
+        Args:
+            url: Redis URL (redis://host:port/db)
+            key: Name of the Redis hash holding the cache
+            client: Pre-built Redis client (mainly for tests)
+            near_ttl: Max seconds near-cache hits are served without checking
+                for a clear by another worker
+        """
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url, decode_responses=True)
+        self.client = client
+        self.url = url
+        self.key = key
+        self.generation_key = f"{key}:generation"
+        self.near_ttl = near_ttl
+        self._near: Dict[str, str] = {}
+        # key -> time.monotonic() until which it is known to be absent
+        self._near_missing: Dict[str, float] = {}
+        self._generation = self.client.get(self.generation_key)
+        self._checked_at = time.monotonic()
+
+    def _check_generation(self) -> None:
+        """Drop the near cache if the hash was cleared since it was last checked."""
+        now = time.monotonic()
+        if now - self._checked_at < self.near_ttl:
+            return
+        self._checked_at = now
+        self._near_missing = {key: until for key, until in self._near_missing.items() if until > now}
+        generation = self.client.get(self.generation_key)
+        if generation != self._generation:
+            self._near.clear()
+            self._near_missing.clear()
+            self._generation = generation
+
+    def _known_missing(self, key: str) -> bool:
+        until = self._near_missing.get(key)
+        return until is not None and until > time.monotonic()
+
+    def _remember(self, key: str, value: Optional[str]) -> None:
+        if value is None:
+            self._near_missing[key] = time.monotonic() + self.near_ttl
+        else:
+            self._near[key] = value
+
+    def _bump_generation(self) -> None:
+        self._generation = self.client.incr(self.generation_key)
+        self._checked_at = time.monotonic()
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        self._check_generation()
+        value = self._near.get(key)
+        if value is not None:
+            return value
+        if self._known_missing(key):
+            return default
+        value = self.client.hget(self.key, key)
+        self._remember(key, value)
+        return default if value is None else value
+
+    def get_many(self, keys: List[str]) -> Dict[str, Optional[str]]:
+        self._check_generation()
+        result: Dict[str, Optional[str]] = {}
+        remote = []
+        for key in dict.fromkeys(keys):
+            if key in self._near:
+                result[key] = self._near[key]
+            elif self._known_missing(key):
+                result[key] = None
+            else:
+                remote.append(key)
+        if remote:
+            for key, value in zip(remote, self.client.hmget(self.key, remote)):
+                self._remember(key, value)
+                result[key] = value
+        return result
+
+    def __getitem__(self, key: str) -> str:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self.client.hset(self.key, key, value)
+        self._near[key] = value
+        self._near_missing.pop(key, None)
+
+    def __delitem__(self, key: str) -> None:
+        self._near.pop(key, None)
+        if not self.client.hdel(self.key, key):
+            raise KeyError(key)
+        self._bump_generation()
+
+    def update(self, other=(), **kwargs) -> None:
+        entries = dict(other, **kwargs)
+        if entries:
+            self.client.hset(self.key, mapping=entries)
+            self._near.update(entries)
+            for key in entries:
+                self._near_missing.pop(key, None)
+
+    def items(self):
+        return list(self.client.hgetall(self.key).items())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.client.hkeys(self.key))
+
+    def __len__(self) -> int:
+        return self.client.hlen(self.key)
+
+    def clear(self) -> None:
+        self._near.clear()
+        self._near_missing.clear()
+        self.client.delete(self.key)
+        self._bump_generation()
+
+    def close(self) -> None:
+        self.client.close()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "backend": self.name,
+            "entries": len(self),
+            "near_cache_entries": len(self._near),
+            "near_cache_misses": len(self._near_missing),
+            "url": self.url,
+        }
+
+
+def _default_mmap_path() -> str:
+    if os.path.isdir("/dev/shm"):
+        return "/dev/shm/gesturegpt_video_cache"
+    return "data/video_cache.mmap"
+
+
+def create_cache_backend(backend: Optional[str] = None) -> CacheBackend:
+    """
+    Create the video cache lookup tier.
+
+    Falls back to a process-local backend if the shared one cannot be set up.
+
+    Args:
+        backend: "local", "mmap" or "redis" (defaults to VIDEO_CACHE_SHARED_BACKEND)
+
+    Returns:
+        CacheBackend instance
+    """
+    backend = (backend or os.getenv("VIDEO_CACHE_SHARED_BACKEND", "local")).lower()
+
+    if backend == "mmap":
+        try:
+            return MmapCacheBackend(
+                path=os.getenv("VIDEO_CACHE_MMAP_PATH", _default_mmap_path()),
+                slots=int(os.getenv("VIDEO_CACHE_MMAP_SLOTS", "16384"))
+            )
+        except Exception as e:
+            log.warning("Shared mmap video cache unavailable", error=str(e))
+
+    elif backend == "redis":
+        try:
+            client = RedisCacheBackend(
+                url=os.getenv("VIDEO_CACHE_REDIS_URL", "redis://localhost:6379/0"),
+                key=os.getenv("VIDEO_CACHE_REDIS_KEY", "gesturegpt:video_cache"),
+                near_ttl=float(os.getenv("VIDEO_CACHE_REDIS_NEAR_TTL", "5"))
+            )
+            client.client.ping()
+            return client
+        except ImportError:
+            log.warning("Redis package not installed. Install with: pip install redis")
+        except Exception as e:
+            log.warning("Redis video cache unavailable", error=str(e))
+
+    elif backend != "local":
+        log.warning("Unknown VIDEO_CACHE_SHARED_BACKEND, using local", backend=backend)
+
+    return LocalCacheBackend()
@@ -0,0 +1,434 @@
+"""
+Cache Store
+Persistent key-value stores backing the video caches.
+
+Writes are buffered in memory and flushed in batches by a background
+thread, so a cold cache warming up under load does not rewrite the whole
+file for every new word. Every backend writes atomically.
+
+Several workers may share a store. The file backends (log, json) take an
+exclusive lock on <path>.lock for every write and merge with the file's
+current contents before rewriting it, so one worker never drops entries
+written by another (without fcntl, e.g. on Windows, they are
+single-writer; use sqlite with several workers there).
+
+Backends (VIDEO_CACHE_BACKEND):
+- sqlite: SQLite database in WAL mode (default)
+- log: append-only JSON-lines log with periodic compaction
+- json: single JSON file, rewritten atomically on each flush
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from app.services.metrics import get_metrics
+from app.services.structured_log import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks
+    fcntl = None
+
+log = get_logger(__name__)
+
+# Marker for buffered deletes
+_DELETED = object()
+
+# File extension per backend
+BACKEND_EXTENSIONS = {
+    "json": ".json",
+    "log": ".log",
+    "sqlite": ".db",
+}
+
+
+class CacheStore(ABC):
+    """
+    Base class for persistent key-value cache stores.
+
+    Subclasses implement _read_all, _write_batch and _write_all; this class
+    handles buffering, batched background flushes and shutdown.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0, flush_batch_size: int = 100):
+        """
+        Args:
+            path: File backing the store
+            flush_interval: Max seconds a buffered write waits before being flushed
+            flush_batch_size: Number of buffered writes that triggers an immediate flush
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self._pending: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = False
+        atexit.register(self.close)
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Read every entry from disk.
+
+        Returns:
+            Mapping of key to value
+        """
+        with self._io_lock:
+            return self._read_all()
+
+    def set(self, key: str, value: Any) -> None:
+        """Buffer a write; it is persisted by the next flush."""
+        self._buffer(key, value)
+
+    def delete(self, key: str) -> None:
+        """Buffer a delete; it is persisted by the next flush."""
+        self._buffer(key, _DELETED)
+
+    def replace_all(self, data: Dict[str, Any]) -> None:
+        """Atomically replace the whole store (discarding buffered writes)."""
+        with self._lock:
+            self._pending = {}
+        with self._io_lock:
+            self._write_all(dict(data))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self.replace_all({})
+
+    def flush(self) -> None:
+        """Persist all buffered writes now."""
+        with self._lock:
+            if not self._pending:
+                return
+            batch = self._pending
+            self._pending = {}
+        metrics = get_metrics()
+        store = os.path.basename(self.path)
+        with self._io_lock, metrics.cache_flush_latency.time(store=store):
+            self._write_batch(batch)
+        metrics.cache_flush_entries.inc(len(batch), store=store)
+
+    def close(self) -> None:
+        """Flush buffered writes and stop the background flusher."""
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify_all()
+        try:
+            self.flush()
+        except Exception as e:
+            log.error("Error flushing cache store", path=self.path, error=str(e))
+
+    def _buffer(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._pending[key] = value
+            if self._flusher is None or not self._flusher.is_alive():
+                self._closed = False
+                self._flusher = threading.Thread(
+                    target=self._flush_loop,
+                    name=f"cache-store-flush:{os.path.basename(self.path)}",
+                    daemon=True
+                )
+                self._flusher.start()
+            else:
+                self._wakeup.notify()
+
+    def _flush_loop(self) -> None:
+        """Flush buffered writes flush_interval after they arrive, or sooner when a batch fills up."""
+        while True:
+            with self._lock:
+                while not self._closed and not self._pending:
+                    self._wakeup.wait()
+                deadline = time.monotonic() + self.flush_interval
+                while not self._closed and len(self._pending) < self.flush_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wakeup.wait(remaining)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception as e:
+                log.error("Error flushing cache store", path=self.path, error=str(e))
+
+    def _ensure_dir(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock shared by every process writing this store.
+
+        The lock lives in a separate file because rewrites replace the
+        store's file (and a lock on the old inode would not exclude
+        writers opening the new one).
+        """
+        if fcntl is None:
+            yield
+            return
+        self._ensure_dir()
+        fd = os.open(self.path + ".lock", os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def _atomic_write(self, content: str) -> None:
+        """Write a file via a temp file and rename, so readers never see a partial file."""
+        self._ensure_dir()
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self.path) or ".",
+            prefix=f".{os.path.basename(self.path)}.",
+            suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @abstractmethod
+    def _read_all(self) -> Dict[str, Any]:
+        """Read every entry from the backing file."""
+
+    @abstractmethod
+    def _write_batch(self, batch: Dict[str, Any]) -> None:
+        """Apply buffered writes (_DELETED values are deletes)."""
+
+    @abstractmethod
+    def _write_all(self, data: Dict[str, Any]) -> None:
+        """Replace every entry."""
+
+
+class JSONFileStore(CacheStore):
+    """Single JSON file, rewritten atomically (temp file + rename) on each flush."""
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(path, **kwargs)
+        self._data: Dict[str, Any] = {}
+
+    def _read_all(self) -> Dict[str, Any]:
+        if not os.path.exists(self.path):
+            self._data = {}
+        else:
+            with open(self.path, 'r') as f:
+                self._data = json.load(f)
+        return dict(self._data)
+
+    def _write_batch(self, batch: Dict[str, Any]) -> None:
+        with self._file_lock():
+            # Start from the file, which may hold other workers' writes
+            self._read_all()
+            for key, value in batch.items():
+                if value is _DELETED:
+                    self._data.pop(key, None)
+                else:
+                    self._data[key] = value
+            self._atomic_write(json.dumps(self._data, indent=2))
+
+    def _write_all(self, data: Dict[str, Any]) -> None:
+        with self._file_lock():
+            self._data = data
+            self._atomic_write(json.dumps(self._data, indent=2))
+
+
+class AppendLogStore(CacheStore):
+    """
+    Append-only JSON-lines log.
+
+    Each flush appends one line per changed key ({"k": key, "v": value} or
+    {"k": key, "d": true} for deletes). When the log holds many more records
+    than live keys it is compacted by atomically rewriting it from the
+    log's current contents, under the same lock appends take, so records
+    appended by other workers survive.
+    """
+
+    def __init__(self, path: str, compact_min_records: int = 1000, compact_ratio: float = 2.0, **kwargs):
+        super().__init__(path, **kwargs)
+        self.compact_min_records = compact_min_records
+        self.compact_ratio = compact_ratio
+        self._data: Dict[str, Any] = {}
+        self._records = 0
+
+    def _read_all(self) -> Dict[str, Any]:
+        self._data = {}
+        self._records = 0
+        if not os.path.exists(self.path):
+            return {}
+
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn trailing write from a crash; later records are still valid
+                    continue
+                self._records += 1
+                if record.get("d"):
+                    self._data.pop(record["k"], None)
+                else:
+                    self._data[record["k"]] = record["v"]
+        return dict(self._data)
+
+    def _compact_locked(self) -> None:
+        """Rewrite the log from its current contents (caller holds the file lock)."""
+        self._read_all()
+        self._atomic_write("".join(
+            json.dumps({"k": key, "v": value}) + "\n" for key, value in self._data.items()
+        ))
+        self._records = len(self._data)
+
+    def _write_batch(self, batch: Dict[str, Any]) -> None:
+        lines = []
+        for key, value in batch.items():
+            if value is _DELETED:
+                self._data.pop(key, None)
+                lines.append(json.dumps({"k": key, "d": True}))
+            else:
+                self._data[key] = value
+                lines.append(json.dumps({"k": key, "v": value}))
+
+        with self._file_lock():
+            # Opened under the lock, so a concurrent compaction cannot
+            # swap the file between open and write
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, ("\n".join(lines) + "\n").encode())
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._records += len(lines)
+
+            if self._records > max(self.compact_min_records, self.compact_ratio * len(self._data)):
+                self._compact_locked()
+
+    def _write_all(self, data: Dict[str, Any]) -> None:
+        with self._file_lock():
+            self._data = data
+            self._atomic_write("".join(
+                json.dumps({"k": key, "v": value}) + "\n" for key, value in data.items()
+            ))
+            self._records = len(data)
+
+    def compact(self) -> None:
+        """Rewrite the log with one record per live key."""
+        self.flush()
+        with self._io_lock, self._file_lock():
+            self._compact_locked()
+
+
+class SQLiteStore(CacheStore):
+    """SQLite key-value table in WAL mode; each flush is one transaction."""
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(path, **kwargs)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._ensure_dir()
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _read_all(self) -> Dict[str, Any]:
+        rows = self._connect().execute("SELECT key, value FROM cache").fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def _write_batch(self, batch: Dict[str, Any]) -> None:
+        upserts = [(key, json.dumps(value)) for key, value in batch.items() if value is not _DELETED]
+        deletes = [(key,) for key, value in batch.items() if value is _DELETED]
+        conn = self._connect()
+        with conn:
+            if upserts:
+                conn.executemany(
+                    "INSERT INTO cache (key, value) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                    upserts
+                )
+            if deletes:
+                conn.executemany("DELETE FROM cache WHERE key = ?", deletes)
+
+    def _write_all(self, data: Dict[str, Any]) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM cache")
+            conn.executemany(
+                "INSERT INTO cache (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in data.items()]
+            )
+
+    def close(self) -> None:
+        super().close()
+        with self._io_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def create_cache_store(path: str, backend: Optional[str] = None) -> CacheStore:
+    """
+    Create a cache store for a cache file path.
+
+    The path's extension is swapped for the backend's own (e.g.
+    data/video_cache.json -> data/video_cache.db for sqlite). When a
+    non-JSON backend starts empty and the legacy JSON file exists, the
+    JSON entries are imported once.
+
+    Args:
+        path: Cache file path (usually ending in .json)
+        backend: "sqlite", "log" or "json" (defaults to VIDEO_CACHE_BACKEND)
+
+    Returns:
+        CacheStore instance
+    """
+    backend = (backend or os.getenv("VIDEO_CACHE_BACKEND", "sqlite")).lower()
+    if backend not in BACKEND_EXTENSIONS:
+        log.warning("Unknown VIDEO_CACHE_BACKEND, using sqlite", backend=backend)
+        backend = "sqlite"
+
+    options = {
+        "flush_interval": float(os.getenv("VIDEO_CACHE_FLUSH_INTERVAL", "1.0")),
+        "flush_batch_size": int(os.getenv("VIDEO_CACHE_FLUSH_BATCH", "100")),
+    }
+    store_path = os.path.splitext(path)[0] + BACKEND_EXTENSIONS[backend]
+
+    if backend == "json":
+        return JSONFileStore(store_path, **options)
+
+    is_new = not os.path.exists(store_path)
+    if backend == "log":
+        store: CacheStore = AppendLogStore(store_path, **options)
+    else:
+        store = SQLiteStore(store_path, **options)
+
+    if is_new and path.endswith(".json") and os.path.exists(path):
+        try:
+            with open(path, 'r') as f:
+                legacy = json.load(f)
+            store.replace_all(legacy)
+            log.info("Imported legacy cache entries", entries=len(legacy), source=path, path=store_path)
+        except Exception as e:
+            log.warning("Could not import legacy cache", path=path, error=str(e))
+
+    return store
@@ -0,0 +1,254 @@
+"""
+Cache Warm-up Service
+Seeds the video repository at startup so a fresh container does not
+start cold.
+
+Warm-up runs in two stages:
+1. Seed: entries from the bundled index (data/video_index.json) are added
+   without any lookup when they point to a remote URL or to a file that
+   exists under output/videos (e.g. rendered by scripts/make_fixture_clips.py).
+2. Prefetch: the index words that could not be seeded, then the top
+   words of the configured word-frequency lists, up to top-K words not
+   cached yet, are resolved through the repository (bulk + concurrent
+   SignASL lookups) in the background. With several workers only the one
+   holding the warm-up lock prefetches, so SignASL sees the load once.
+
+Progress is reported by get_status() and surfaced in /health.
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks
+    fcntl = None
+
+from app.services.structured_log import get_logger
+from app.services.video_repository import VideoRepository, get_video_repository
+
+log = get_logger(__name__)
+
+
+class CacheWarmer:
+    """Seeds and prefetches the video repository in the background."""
+
+    def __init__(
+        self,
+        repository: VideoRepository,
+        index_file: str = "data/video_index.json",
+        word_lists: Optional[List[str]] = None,
+        top_k: int = 200,
+        batch_size: int = 50,
+        videos_dir: str = "output/videos",
+        lock_file: Optional[str] = "data/video_warmup.lock"
+    ):
+        """
+        Args:
+            repository: Repository to warm
+            index_file: Bundled word -> /videos/... index
+            word_lists: Word-frequency files (one word per line, optional count column)
+            top_k: Max number of words to prefetch
+            batch_size: Words resolved per repository batch
+            videos_dir: Directory served at /videos
+            lock_file: Lock held by the one worker that prefetches (None:
+                always prefetch)
+        """
+        self.repository = repository
+        self.index_file = index_file
+        self.word_lists = word_lists or []
+        self.top_k = top_k
+        self.batch_size = max(1, batch_size)
+        self.videos_dir = videos_dir
+        self.lock_file = lock_file
+        self._lock_fd: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self.status: Dict[str, object] = {
+            "state": "idle",
+            "seeded": 0,
+            "prefetch_total": 0,
+            "prefetch_done": 0,
+            "resolved": 0,
+            "missing": 0,
+            "started_at": None,
+            "finished_at": None,
+            "error": None,
+        }
+
+    def _load_index(self) -> Dict[str, str]:
+        """Load the bundled index, or an empty mapping if it is unavailable."""
+        if not os.path.exists(self.index_file):
+            return {}
+        try:
+            with open(self.index_file, 'r') as f:
+                return {word.upper(): url for word, url in json.load(f).items()}
+        except Exception as e:
+            log.warning("Could not read video index", path=self.index_file, error=str(e))
+            return {}
+
+    def _video_available(self, url: str) -> bool:
+        """Check whether a URL is remote or a /videos/... file that exists under videos_dir."""
+        if url.startswith(("http://", "https://")):
+            return True
+        if not url.startswith("/videos/"):
+            return False
+        return os.path.isfile(os.path.join(self.videos_dir, url[len("/videos/"):]))
+
+    def _load_word_lists(self) -> List[str]:
+        """
+        Load words from the word-frequency lists, most frequent first.
+
+        Lines are "WORD" or "WORD COUNT"; blank lines and # comments are
+        skipped. Words with counts are ranked by count, others keep file
+        order after them.
+        """
+        counts: Dict[str, float] = {}
+        order: Dict[str, int] = {}
+        for path in self.word_lists:
+            if not os.path.exists(path):
+                log.warning("Warm-up word list not found", path=path)
+                continue
+            with open(path, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    parts = line.split()
+                    word = parts[0].upper()
+                    order.setdefault(word, len(order))
+                    if len(parts) > 1:
+                        try:
+                            counts[word] = counts.get(word, 0) + float(parts[1])
+                        except ValueError:
+                            pass
+        return sorted(order, key=lambda word: (-counts.get(word, 0), order[word]))
+
+    def seed(self) -> int:
+        """
+        Add bundled index entries whose video is available.
+
+        Returns:
+            Number of entries seeded
+        """
+        available = {
+            word: url for word, url in self._load_index().items()
+            if self._video_available(url)
+        }
+        self.repository.add_videos(available)
+        self.status["seeded"] = len(available)
+        return len(available)
+
+    def get_prefetch_candidates(self) -> List[str]:
+        """Get the top-K words worth prefetching (not cached or negative-cached yet)."""
+        candidates = []
+        seen = set()
+        # Index words not seeded first: they are the bundled vocabulary
+        for word in list(self._load_index()) + self._load_word_lists():
+            if word in seen:
+                continue
+            seen.add(word)
+            if self.repository.word_exists(word) or self.repository.is_negative(word):
+                continue
+            candidates.append(word)
+            if len(candidates) >= self.top_k:
+                break
+        return candidates
+
+    async def prefetch(self, words: List[str]) -> None:
+        """Resolve words through the repository in batches, updating progress."""
+        self.status["prefetch_total"] = len(words)
+        for start in range(0, len(words), self.batch_size):
+            batch = words[start:start + self.batch_size]
+            await self.repository.lookup_words_async(batch)
+            # Counted per word: fingerspelled words are not resolved
+            resolved = sum(1 for word in batch if self.repository.word_exists(word))
+            self.status["prefetch_done"] += len(batch)
+            self.status["resolved"] += resolved
+            self.status["missing"] += len(batch) - resolved
+
+    async def run(self) -> None:
+        """Run both warm-up stages."""
+        self.status["state"] = "running"
+        self.status["started_at"] = time.time()
+        try:
+            seeded = self.seed()
+            if not self._acquire_lock():
+                self.status["state"] = "skipped"
+                log.info("Cache warm-up seeded; another worker is prefetching", seeded=seeded)
+                return
+            words = self.get_prefetch_candidates()
+            log.info("Cache warm-up started", seeded=seeded, prefetching=len(words))
+            await self.prefetch(words)
+            self.status["state"] = "done"
+            log.info("Cache warm-up finished", resolved=self.status["resolved"], missing=self.status["missing"])
+        except asyncio.CancelledError:
+            self.status["state"] = "cancelled"
+            raise
+        except Exception as e:
+            self.status["state"] = "failed"
+            self.status["error"] = str(e)
+            log.error("Cache warm-up failed", error=str(e))
+        finally:
+            self._release_lock()
+            self.status["finished_at"] = time.time()
+
+    def _acquire_lock(self) -> bool:
+        """Take the prefetch lock without waiting; False if another worker holds it."""
+        if self.lock_file is None or fcntl is None:
+            return True
+        os.makedirs(os.path.dirname(self.lock_file) or ".", exist_ok=True)
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._lock_fd = fd
+        return True
+
+    def _release_lock(self) -> None:
+        if self._lock_fd is not None:
+            # Closing the descriptor releases the lock
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def start(self) -> asyncio.Task:
+        """Start warm-up as a background task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Cancel a running warm-up."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def get_status(self) -> Dict[str, object]:
+        """Get warm-up progress."""
+        return dict(self.status)
+
+
+# Singleton instance
+_warmer = None
+
+
+def get_cache_warmer() -> CacheWarmer:
+    """Get singleton instance of CacheWarmer."""
+    global _warmer
+    if _warmer is None:
+        word_lists = os.getenv("VIDEO_WARMUP_WORDLISTS", "data/common_words.txt")
+        _warmer = CacheWarmer(
+            repository=get_video_repository(),
+            index_file=os.getenv("VIDEO_WARMUP_INDEX", "data/video_index.json"),
+            word_lists=[path.strip() for path in word_lists.split(",") if path.strip()],
+            top_k=int(os.getenv("VIDEO_WARMUP_TOP_K", "200")),
+            batch_size=int(os.getenv("VIDEO_WARMUP_BATCH", "50"))
+        )
+    return _warmer
@@ -0,0 +1,370 @@
+"""
+Clip Mirror
+Optional local copy of the remote clips SignASL resolves to, so clients
+(and the composer) read them from our /videos mount instead of a
+third-party host on every play.
+
+Clips are downloaded in the background after a URL is first returned and
+stored content-addressed under output/videos/mirror/<hh>/<sha256>.<ext>:
+identical media behind different URLs is kept once. Total size is capped
+by a byte budget with least-recently-used eviction. Until a clip is
+mirrored, its original URL is returned unchanged.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Set
+
+import httpx
+
+from app.services.cache_store import create_cache_store
+from app.services.structured_log import get_logger
+
+log = get_logger(__name__)
+
+# Bytes buffered before each write, so a download costs few thread hops
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Content types worth mirroring, with the extension they are stored under
+MEDIA_TYPES = {
+    "video/mp4": ".mp4",
+    "video/webm": ".webm",
+    "video/quicktime": ".mov",
+    "image/gif": ".gif",
+}
+
+
+class ClipMirror:
+    """Content-addressed, size-bounded local mirror of remote clips."""
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        videos_dir: str = "output/videos",
+        subdir: str = "mirror",
+        index_file: str = "data/video_mirror.json",
+        max_bytes: int = 1024 ** 3,
+        concurrency: int = 4,
+        queue_size: int = 1000,
+        timeout: float = 30,
+        on_change: Optional[Callable[[], None]] = None
+    ):
+        """
+        Args:
+            enabled: Whether clips are mirrored
+            videos_dir: Directory served at /videos
+            subdir: Subdirectory of videos_dir holding mirrored clips
+            index_file: Path persisting the source URL -> content hash index
+            max_bytes: Disk budget for mirrored clips
+            concurrency: Max concurrent downloads
+            queue_size: Max URLs waiting to be downloaded (more are skipped)
+            timeout: Seconds per download
+            on_change: Called after a clip is mirrored or evicted (URLs change)
+        """
+        self.enabled = enabled
+        self.videos_dir = videos_dir
+        self.subdir = subdir
+        self.root = os.path.join(videos_dir, subdir)
+        self.max_bytes = max_bytes
+        self.concurrency = max(1, concurrency)
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.on_change = on_change
+
+        # source URL -> content name ("<sha256><ext>")
+        self.index: Dict[str, str] = {}
+        # content name -> size in bytes, least recently used first
+        self.files: "OrderedDict[str, int]" = OrderedDict()
+        self.total_bytes = 0
+        self._pending: Set[str] = set()
+        self._unmirrorable: Set[str] = set()
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers = []
+        self._client: Optional[httpx.AsyncClient] = None
+
+        self.downloads = 0
+        self.deduplicated = 0
+        self.evictions = 0
+        self.failures = 0
+        self.skipped = 0
+
+        self.store = None
+        if self.enabled:
+            self.store = create_cache_store(index_file)
+            self._load()
+
+    def _content_path(self, name: str) -> str:
+        return os.path.join(self.root, name[:2], name)
+
+    def _content_url(self, name: str) -> str:
+        return f"/videos/{self.subdir}/{name[:2]}/{name}"
+
+    def _load(self) -> None:
+        """Load the index, dropping entries whose file is gone; oldest files are evicted first."""
+        try:
+            stored = self.store.load()
+        except Exception as e:
+            log.error("Error loading clip mirror index", error=str(e))
+            return
+
+        present: Dict[str, float] = {}
+        for url, name in stored.items():
+            path = self._content_path(name)
+            if name not in present:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    self.store.delete(url)
+                    continue
+                present[name] = stat.st_mtime
+                self.files[name] = stat.st_size
+            self.index[url] = name
+
+        for name in sorted(self.files, key=present.get):
+            self.files.move_to_end(name)
+        self.total_bytes = sum(self.files.values())
+        if self.index:
+            log.info("Loaded mirrored clips", files=len(self.files), bytes=self.total_bytes, path=self.root)
+
+    def rewrite(self, url: str) -> str:
+        """
+        Get the local URL of a mirrored clip, scheduling unmirrored ones.
+
+        Args:
+            url: Clip URL as returned by SignASL
+
+        Returns:
+            /videos/mirror/... once mirrored, otherwise url unchanged
+        """
+        if not self.enabled or not url.startswith(("http://", "https://")):
+            return url
+        name = self.index.get(url)
+        if name is not None and name in self.files:
+            # Workers share the files but evict on their own, so another
+            # worker may have removed this one
+            if os.path.isfile(self._content_path(name)):
+                self.files.move_to_end(name)
+                return self._content_url(name)
+            self._forget(name)
+        self._schedule(url)
+        return url
+
+    def _forget(self, name: str) -> None:
+        """Drop a clip whose file is gone from the index."""
+        self.total_bytes -= self.files.pop(name, 0)
+        for url in [url for url, indexed in self.index.items() if indexed == name]:
+            del self.index[url]
+            self.store.delete(url)
+
+    def _schedule(self, url: str) -> None:
+        """Queue a download on the mirror's event loop (callable from any thread)."""
+        if url in self._pending or url in self._unmirrorable:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if self._loop is None or self._loop.is_closed():
+            if running is None:
+                # No event loop to download on yet
+                return
+            self._start(running)
+        if running is self._loop:
+            self._enqueue(url)
+        else:
+            self._loop.call_soon_threadsafe(self._enqueue, url)
+
+    def _enqueue(self, url: str) -> None:
+        if url in self._pending:
+            return
+        if self._queue.qsize() >= self.queue_size:
+            self.skipped += 1
+            return
+        self._pending.add(url)
+        self._queue.put_nowait(url)
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the download workers on an event loop."""
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
+        self._workers = [loop.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def _worker(self) -> None:
+        while True:
+            url = await self._queue.get()
+            try:
+                await self._download(url)
+            except asyncio.CancelledError:
+                raise
+            except httpx.HTTPStatusError as e:
+                # Client errors will not go away on retry
+                if e.response.status_code < 500:
+                    self._unmirrorable.add(url)
+                self.failures += 1
+                log.warning("Could not mirror clip", url=url, status=e.response.status_code)
+            except Exception as e:
+                self.failures += 1
+                log.warning("Could not mirror clip", url=url, error=str(e))
+            finally:
+                self._pending.discard(url)
+
+    async def _download(self, url: str) -> None:
+        """
+        Download a clip, store it under its content hash and index it.
+
+        File I/O (and hashing) runs in worker threads so large clips do not
+        stall the event loop.
+        """
+        async with self._client.stream("GET", url) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+            extension = MEDIA_TYPES.get(content_type)
+            if extension is None:
+                # e.g. an HTML sign page rather than the media itself
+                self._unmirrorable.add(url)
+                return
+
+            digest = hashlib.sha256()
+            fd, partial = await asyncio.to_thread(self._create_partial)
+            try:
+                buffered, buffered_size = [], 0
+                async for chunk in response.aiter_bytes():
+                    buffered.append(chunk)
+                    buffered_size += len(chunk)
+                    if buffered_size >= WRITE_BUFFER_SIZE:
+                        await asyncio.to_thread(self._write, fd, b"".join(buffered), digest)
+                        buffered, buffered_size = [], 0
+                if buffered:
+                    await asyncio.to_thread(self._write, fd, b"".join(buffered), digest)
+                await asyncio.to_thread(os.close, fd)
+                fd = None
+
+                name = digest.hexdigest() + extension
+                if name in self.files:
+                    self.deduplicated += 1
+                    await asyncio.to_thread(os.remove, partial)
+                else:
+                    size = await asyncio.to_thread(self._publish, partial, self._content_path(name))
+                    self.files[name] = size
+                    self.total_bytes += size
+                    self.downloads += 1
+                partial = None
+            finally:
+                # Failure or cancellation only
+                if fd is not None:
+                    os.close(fd)
+                if partial is not None and os.path.exists(partial):
+                    os.remove(partial)
+
+        self.files.move_to_end(name)
+        self.index[url] = name
+        self.store.set(url, name)
+        evicted = self._evict()
+        if evicted:
+            await asyncio.to_thread(self._remove_files, evicted)
+        if self.on_change:
+            self.on_change()
+
+    def _create_partial(self):
+        """Create the temp file a download is written to."""
+        os.makedirs(self.root, exist_ok=True)
+        return tempfile.mkstemp(dir=self.root, suffix=".part")
+
+    @staticmethod
+    def _write(fd: int, data: bytes, digest) -> None:
+        digest.update(data)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+    @staticmethod
+    def _publish(partial: str, path: str) -> int:
+        """Move a finished download to its content path and return its size."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(partial, path)
+        return os.path.getsize(path)
+
+    def _remove_files(self, names: Set[str]) -> None:
+        for name in names:
+            # Skip clips mirrored again while this removal was pending
+            if name in self.files:
+                continue
+            try:
+                os.remove(self._content_path(name))
+            except OSError:
+                pass
+
+    def _evict(self) -> Set[str]:
+        """
+        Drop least recently used clips from the index until the mirror fits
+        its budget.
+
+        Returns:
+            Names of the evicted files, for the caller to delete
+        """
+        evicted = set()
+        while self.total_bytes > self.max_bytes and len(self.files) > 1:
+            name, size = self.files.popitem(last=False)
+            self.total_bytes -= size
+            evicted.add(name)
+            self.evictions += 1
+        if evicted:
+            for url in [url for url, name in self.index.items() if name in evicted]:
+                del self.index[url]
+                self.store.delete(url)
+        return evicted
+
+    async def aclose(self) -> None:
+        """Stop the download workers and persist the index."""
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._loop = None
+        if self.store is not None:
+            self.store.flush()
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get mirror size and download counters."""
+        return {
+            "enabled": self.enabled,
+            "files": len(self.files),
+            "urls": len(self.index),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "pending": len(self._pending),
+            "downloads": self.downloads,
+            "deduplicated": self.deduplicated,
+            "evictions": self.evictions,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "unmirrorable": len(self._unmirrorable),
+        }
+
+
+def create_clip_mirror(on_change: Optional[Callable[[], None]] = None) -> ClipMirror:
+    """
+    Create the clip mirror configured by VIDEO_MIRROR_* environment variables.
+
+    Args:
+        on_change: Called after a clip is mirrored or evicted
+
+    Returns:
+        ClipMirror instance (disabled unless VIDEO_MIRROR_ENABLED=true)
+    """
+    return ClipMirror(
+        enabled=os.getenv("VIDEO_MIRROR_ENABLED", "false").lower() == "true",
+        max_bytes=int(float(os.getenv("VIDEO_MIRROR_MAX_MB", "1024")) * 1024 * 1024),
+        concurrency=int(os.getenv("VIDEO_MIRROR_CONCURRENCY", "4")),
+        timeout=float(os.getenv("VIDEO_MIRROR_TIMEOUT", "30")),
+        on_change=on_change
+    )
@@ -0,0 +1,146 @@
+"""
+Completion Cache
+Opt-in cache of LLM replies for deterministic requests, so repeated short
+conversations ("hi", "thank you") skip the provider round trip.
+
+Entries live in a bounded in-memory LRU with a TTL and are persisted
+through a cache store (same backends as the video cache), so they survive
+restarts.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+from app.services.cache_store import create_cache_store
+from app.services.lru_cache import LRUCache
+from app.services.structured_log import get_logger
+
+log = get_logger(__name__)
+
+
+class CompletionCache:
+    """
+    LRU + TTL cache of LLM completions keyed on the effective request.
+
+    Only requests with an explicit temperature 0 are cached, since sampled
+    replies (including the provider default) are meant to vary;
+    LLM_CACHE_FORCE caches them anyway.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        Args:
+            cache_file: Path for persisting completions (defaults to LLM_CACHE_FILE)
+        """
+        self.enabled = os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true"
+        self.force = os.getenv("LLM_CACHE_FORCE", "false").lower() == "true"
+        self.ttl = float(os.getenv("LLM_CACHE_TTL", "3600"))
+        self.cache_file = cache_file or os.getenv("LLM_CACHE_FILE", "data/llm_cache.json")
+        self.entries = LRUCache(
+            max_entries=int(os.getenv("LLM_CACHE_SIZE", "1024")) if self.enabled else 0,
+            ttl=self.ttl
+        )
+        self.store = None
+
+        if self.entries.enabled:
+            os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+            self.store = create_cache_store(self.cache_file)
+            self._load()
+
+    def _load(self) -> None:
+        """Load unexpired completions from the store, newest last."""
+        try:
+            stored = self.store.load()
+        except Exception as e:
+            log.error("Error loading LLM completion cache", error=str(e))
+            return
+
+        now = time.time()
+        live = []
+        for key, entry in stored.items():
+            expires_at = entry.get("expires_at", 0)
+            if expires_at and expires_at <= now:
+                self.store.delete(key)
+            else:
+                live.append((entry.get("stored_at", 0), key, entry))
+        live.sort()
+
+        # Entries the LRU cannot hold are dropped from the store as well
+        overflow = max(0, len(live) - self.entries.max_entries)
+        for _, key, _ in live[:overflow]:
+            self.store.delete(key)
+        for _, key, entry in live[overflow:]:
+            remaining = entry["expires_at"] - now if entry.get("expires_at") else 0
+            self.entries.set(key, entry["response"], ttl=remaining)
+
+        if len(self.entries):
+            log.info("Loaded cached LLM completions", entries=len(self.entries), path=self.store.path)
+
+    def is_cacheable(self, temperature: Optional[float]) -> bool:
+        """
+        Check whether a request with this temperature may be cached.
+
+        Args:
+            temperature: Sampling temperature (None means the provider default)
+
+        Returns:
+            True if the cache is enabled and the request is deterministic (or forced)
+        """
+        if not self.entries.enabled:
+            return False
+        return self.force or (temperature is not None and temperature <= 0)
+
+    @staticmethod
+    def make_key(provider: str, model: str, request: Any, temperature: Optional[float]) -> str:
+        """
+        Build a cache key from the request actually sent to the provider.
+
+        Args:
+            provider: LLM provider name
+            model: Provider model name
+            request: Effective messages (including any injected system prompt)
+            temperature: Sampling temperature
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            [provider, model, request, temperature],
+            sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached completion, or None."""
+        response = self.entries.get(key)
+        return None if response is LRUCache.MISSING else response
+
+    def set(self, key: str, response: str) -> None:
+        """Cache a completion in memory and persist it."""
+        if not self.entries.enabled:
+            return
+        self.entries.set(key, response)
+        now = time.time()
+        self.store.set(key, {
+            "response": response,
+            "stored_at": now,
+            "expires_at": now + self.ttl if self.ttl > 0 else 0,
+        })
+
+    def clear(self) -> None:
+        """Remove every cached completion."""
+        self.entries.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def flush(self) -> None:
+        """Persist buffered writes."""
+        if self.store is not None:
+            self.store.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit-rate statistics."""
+        return {"enabled": self.entries.enabled, "force": self.force, **self.entries.stats()}
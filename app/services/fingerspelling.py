@@ -0,0 +1,213 @@
+"""
+Fingerspelling Index
+Letter and digit clips used to spell out words that have no sign video.
+
+The index is filled before any request needs it and is never evicted:
+1. Bundled entries (data/fingerspelling_index.json) whose video file
+   exists under output/videos (letter clips are not shipped; put them in
+   output/videos/fingerspelling), or whose URL is absolute
+2. FINGERSPELL_URL_TEMPLATE, e.g. https://cdn.example.com/asl/{char}.mp4,
+   for characters the bundled index does not cover
+3. Digits resolved on a previous run (persisted cache store)
+4. Digits still missing are resolved at startup with one SignASL lookup
+   in the background. Letters are not: SignASL looks up words, so "A" and
+   "I" would resolve to the article and pronoun signs.
+
+Spelling a word is then a dict lookup per character, with no upstream call.
+"""
+
+import asyncio
+import json
+import os
+import string
+from typing import Dict, List, Optional
+
+from app.services.cache_store import create_cache_store
+from app.services.signasl_client import get_signasl_client
+from app.services.structured_log import get_logger
+
+log = get_logger(__name__)
+
+CHARACTERS = string.ascii_uppercase + string.digits
+
+# Characters whose SignASL word lookup is the sign used when spelling
+RESOLVABLE = string.digits
+
+
+class FingerspellingIndex:
+    """Preloaded letter/digit -> video URL index."""
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        index_file: str = "data/fingerspelling_index.json",
+        cache_file: str = "data/fingerspelling_cache.json",
+        max_length: int = 12,
+        videos_dir: str = "output/videos",
+        url_template: str = ""
+    ):
+        """
+        Args:
+            enabled: Whether missing words are fingerspelled
+            index_file: Bundled character -> URL index
+            cache_file: Path persisting characters resolved through SignASL
+            max_length: Longest word that is spelled out (longer ones stay missing)
+            videos_dir: Directory served at /videos
+            url_template: URL of each character's clip, with {char} in place
+                of the uppercase character (used for characters the bundled
+                index does not cover)
+        """
+        self.enabled = enabled
+        self.index_file = index_file
+        self.cache_file = cache_file
+        self.max_length = max_length
+        self.videos_dir = videos_dir
+        self.url_template = url_template
+        self.letters: Dict[str, str] = {}
+        self.spelled_words = 0
+        self._task: Optional[asyncio.Task] = None
+        self.store = None
+
+        if self.enabled:
+            self.store = create_cache_store(self.cache_file)
+            self._load()
+
+    def _usable(self, url: str) -> bool:
+        """Check whether a URL can be served: absolute, or a local file under /videos."""
+        if url.startswith(("http://", "https://")):
+            return True
+        if url.startswith("/videos/"):
+            return os.path.isfile(os.path.join(self.videos_dir, url[len("/videos/"):]))
+        return False
+
+    def _load(self) -> None:
+        """Fill the index from the bundled file and the persisted store."""
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, 'r') as f:
+                    bundled = json.load(f)
+                for char, url in bundled.items():
+                    if char.upper() in CHARACTERS and self._usable(url):
+                        self.letters[char.upper()] = url
+            except Exception as e:
+                log.warning("Could not read fingerspelling index", path=self.index_file, error=str(e))
+
+        if self.url_template:
+            for char in CHARACTERS:
+                self.letters.setdefault(char, self.url_template.format(char=char))
+
+        try:
+            for char, url in self.store.load().items():
+                # Letters resolved by earlier versions are word signs
+                if char in RESOLVABLE:
+                    self.letters.setdefault(char, url)
+        except Exception as e:
+            log.error("Error loading fingerspelling cache", error=str(e))
+
+        if self.letters:
+            log.info("Loaded fingerspelling clips", characters=len(self.letters), total=len(CHARACTERS))
+        letters = [char for char in string.ascii_uppercase if char not in self.letters]
+        if letters:
+            log.warning(
+                "No clips for fingerspelling letters; words using them stay missing",
+                letters="".join(letters), path=os.path.join(self.videos_dir, "fingerspelling")
+            )
+
+    def get_missing_characters(self) -> List[str]:
+        """Get the letters and digits without a clip."""
+        return [char for char in CHARACTERS if char not in self.letters]
+
+    def _get_resolvable_characters(self) -> List[str]:
+        """Get the missing characters SignASL can resolve."""
+        return [char for char in self.get_missing_characters() if char in RESOLVABLE]
+
+    async def resolve_missing(self) -> int:
+        """
+        Resolve missing digits through SignASL in one lookup.
+
+        Returns:
+            Number of characters added
+        """
+        missing = self._get_resolvable_characters()
+        if not missing:
+            return 0
+        fetched = await get_signasl_client().get_video_urls_async(missing)
+        added = {char: url for char, url in fetched.items() if url}
+        self.letters.update(added)
+        for char, url in added.items():
+            self.store.set(char, url)
+        self.store.flush()
+        log.info("Fingerspelling characters resolved", resolved=len(added), missing=len(missing))
+        return len(added)
+
+    def start(self) -> Optional[asyncio.Task]:
+        """Resolve missing characters in the background on the running event loop."""
+        if not self.enabled or not self._get_resolvable_characters():
+            return None
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def _run(self) -> None:
+        try:
+            await self.resolve_missing()
+        except Exception as e:
+            log.error("Fingerspelling preload failed", error=str(e))
+
+    async def stop(self) -> None:
+        """Cancel a running preload."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def spell(self, word: str, count: bool = True) -> Optional[List[str]]:
+        """
+        Get the clips spelling a word, one per character.
+
+        Args:
+            word: Uppercase word token
+            count: Count the word in spelled_words (False when re-reading
+                clips of an already answered lookup, e.g. to compose them)
+
+        Returns:
+            Video URLs in order, or None when disabled, too long, or a
+            character has no clip
+        """
+        if not self.enabled or not word or len(word) > self.max_length:
+            return None
+        try:
+            urls = [self.letters[char] for char in word.upper()]
+        except KeyError:
+            return None
+        if count:
+            self.spelled_words += 1
+        return urls
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get index coverage and usage statistics."""
+        return {
+            "enabled": self.enabled,
+            "characters": len(self.letters),
+            "missing": "".join(self.get_missing_characters()) if self.enabled else None,
+            "spelled_words": self.spelled_words,
+        }
+
+
+# Singleton instance
+_index = None
+
+
+def get_fingerspelling_index() -> FingerspellingIndex:
+    """Get singleton instance of FingerspellingIndex."""
+    global _index
+    if _index is None:
+        _index = FingerspellingIndex(
+            enabled=os.getenv("FINGERSPELL_ENABLED", "false").lower() == "true",
+            index_file=os.getenv("FINGERSPELL_INDEX", "data/fingerspelling_index.json"),
+            max_length=int(os.getenv("FINGERSPELL_MAX_LENGTH", "12")),
+            url_template=os.getenv("FINGERSPELL_URL_TEMPLATE", "")
+        )
+    return _index
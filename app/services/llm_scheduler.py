@@ -0,0 +1,189 @@
+"""
+LLM Request Scheduler
+In-process scheduler in front of the LLM provider:
+
+- coalescing: concurrent requests with an identical effective prompt share
+  one upstream call
+- micro-batching: distinct requests arriving within a short window are
+  collected and dispatched to the provider together. Batches are not
+  limited by default, since the provider's own concurrency limit already
+  caps concurrent calls and a batch only finishes with its slowest call;
+  with max_batches_in_flight set, later requests queue until a batch
+  finishes
+
+Queue depth, wait time and batch sizes are tracked for /health.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from app.services.singleflight import AsyncSingleFlight
+
+# Resolves a batch of requests; returns one result or exception per request
+BatchHandler = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+class LLMScheduler:
+    """Coalesces identical LLM requests and micro-batches distinct ones."""
+
+    def __init__(
+        self,
+        handler: BatchHandler,
+        coalesce: bool = True,
+        batch_window: float = 0.0,
+        max_batch_size: int = 8,
+        max_batches_in_flight: int = 0
+    ):
+        """
+        Args:
+            handler: Coroutine function resolving a list of requests
+            coalesce: Share one upstream call between identical in-flight requests
+            batch_window: Seconds to wait for more requests before dispatching
+                a batch (0 dispatches every request immediately)
+            max_batch_size: Max requests dispatched together
+            max_batches_in_flight: Max batches being resolved at once (0 for
+                no limit); the next batch is dispatched when one finishes
+        """
+        self.handler = handler
+        self.coalesce = coalesce
+        self.batch_window = batch_window
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_batches_in_flight = max(0, max_batches_in_flight)
+        self.single_flight = AsyncSingleFlight()
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._batches: Set[asyncio.Task] = set()
+
+        self.requests = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.batched_requests = 0
+        self.peak_queue_depth = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for their batch to be dispatched."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def submit(self, key: Hashable, request: Any) -> Any:
+        """
+        Resolve a request through the scheduler.
+
+        Args:
+            key: Identifies the effective prompt (identical keys are coalesced)
+            request: Request passed to the handler
+
+        Returns:
+            The handler's result for the request
+        """
+        self.requests += 1
+        if not self.coalesce:
+            return await self._schedule(request)
+        if key in self.single_flight:
+            self.coalesced += 1
+        return await self.single_flight.do(key, lambda: self._schedule(request))
+
+    async def _schedule(self, request: Any) -> Any:
+        """Dispatch a request now, or queue it for the next batch."""
+        if self.batch_window <= 0:
+            self._record_batch([0.0])
+            result = (await self.handler([request]))[0]
+            if isinstance(result, BaseException):
+                raise result
+            return result
+
+        self._ensure_dispatcher()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((time.monotonic(), request, future))
+        self.peak_queue_depth = max(self.peak_queue_depth, self._queue.qsize())
+        return await future
+
+    def _ensure_dispatcher(self) -> None:
+        """Start the batch dispatcher on the running event loop."""
+        if self._dispatcher is None or self._dispatcher.done() \
+                or self._dispatcher.get_loop() is not asyncio.get_running_loop():
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.max_batches_in_flight) if self.max_batches_in_flight else None
+            self._dispatcher = asyncio.ensure_future(self._dispatch_loop())
+
+    async def _dispatch_loop(self) -> None:
+        """Collect queued requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            if self._slots is not None:
+                # Requests keep queueing while earlier batches are in flight
+                await self._slots.acquire()
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            now = time.monotonic()
+            self._record_batch([now - enqueued for enqueued, _, _ in batch])
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: List[Tuple[float, Any, asyncio.Future]]) -> None:
+        """Resolve a batch and hand each result to its waiter."""
+        try:
+            results = await self.handler([request for _, request, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _record_batch(self, waits: List[float]) -> None:
+        self.batches += 1
+        self.batched_requests += len(waits)
+        self.total_wait += sum(waits)
+        self.max_wait = max(self.max_wait, *waits)
+
+    async def aclose(self) -> None:
+        """Stop the dispatcher and fail requests still waiting in the queue."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        while self._queue is not None and not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("LLM scheduler is shutting down"))
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing, queue-depth and wait-time statistics."""
+        return {
+            "coalesce": self.coalesce,
+            "batch_window_ms": round(self.batch_window * 1000, 3),
+            "max_batch_size": self.max_batch_size,
+            "max_batches_in_flight": self.max_batches_in_flight,
+            "batches_in_flight": len(self._batches),
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "in_flight": self.single_flight.in_flight(),
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "batches": self.batches,
+            "avg_batch_size": round(self.batched_requests / self.batches, 2) if self.batches else 0.0,
+            "avg_wait_ms": round(self.total_wait / self.batched_requests * 1000, 3) if self.batched_requests else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
@@ -1,10 +1,103 @@
-from typing import List
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Tuple
 from app.models.schemas import ChatMessage
+from app.services.completion_cache import CompletionCache
+from app.services.llm_scheduler import LLMScheduler
+from app.services.metrics import get_metrics
+from app.services.singleflight import SingleFlight
+from app.services.structured_log import get_logger
+from app.services.tracing import span
+from app.services.vocabulary import get_vocabulary_constraint
+import asyncio
+import httpx
 import os
+import re
 from dotenv import load_dotenv
 
 load_dotenv()
 
+log = get_logger(__name__)
+
+# HTTP statuses worth retrying (timeouts, conflicts, rate limits, server errors)
+RETRY_STATUSES = (408, 409, 429, 500, 502, 503, 504)
+
+# Env var prefix for each provider's timeout/retry/concurrency settings
+PROVIDER_ENV_PREFIXES = {
+    "openai": "OPENAI",
+    "anthropic": "ANTHROPIC",
+    "custom": "CUSTOM_LLM",
+}
+
+# Provider names used in error messages
+PROVIDER_LABELS = {
+    "openai": "OpenAI",
+    "anthropic": "Anthropic",
+    "custom": "Custom LLM",
+}
+
+# Connection pool shared by all async provider clients
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_llm_http_client() -> httpx.AsyncClient:
+    """Get the pooled HTTP client shared by the async LLM provider clients."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("LLM_POOL_SIZE", "100")),
+                max_keepalive_connections=int(os.getenv("LLM_KEEPALIVE_CONNECTIONS", "20")),
+                keepalive_expiry=float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))
+            )
+        )
+    return _http_client
+
+
+async def close_llm_http_client() -> None:
+    """Close the shared LLM connection pool."""
+    if _http_client is not None:
+        await _http_client.aclose()
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Check whether a provider SDK error is transient."""
+    status = getattr(error, "status_code", None)
+    if status is not None:
+        return status in RETRY_STATUSES
+    # openai/anthropic APIConnectionError and APITimeoutError have no status
+    return type(error).__name__ in ("APIConnectionError", "APITimeoutError") or isinstance(error, httpx.TransportError)
+
+
+class ProviderLimits:
+    """
+    Timeout, retry and concurrency settings for one LLM provider, read
+    from <PREFIX>_TIMEOUT, <PREFIX>_MAX_RETRIES, <PREFIX>_RETRY_BACKOFF
+    and <PREFIX>_MAX_CONCURRENCY.
+    """
+
+    def __init__(self, prefix: str):
+        self.timeout = float(os.getenv(f"{prefix}_TIMEOUT", "60"))
+        self.max_retries = int(os.getenv(f"{prefix}_MAX_RETRIES", "2"))
+        self.retry_backoff = float(os.getenv(f"{prefix}_RETRY_BACKOFF", "0.5"))
+        self.max_concurrency = int(os.getenv(f"{prefix}_MAX_CONCURRENCY", "16"))
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Caps concurrent in-flight requests to the provider."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def retry_delay(self, attempt: int, error: Exception) -> float:
+        """Exponential backoff, stretched to the provider's Retry-After if longer."""
+        delay = self.retry_backoff * (2 ** attempt)
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        try:
+            return max(delay, float(retry_after)) if retry_after else delay
+        except ValueError:
+            return delay
+
 
 class LLMService:
     """
@@ -15,15 +108,36 @@ class LLMService:
     - openai: OpenAI GPT models
     - anthropic: Anthropic Claude models
     - custom: Custom OpenAI-compatible endpoint
+
+    Deterministic requests (temperature 0) can be answered from an opt-in
+    completion cache (LLM_CACHE_ENABLED) without calling the provider.
+    Concurrent identical requests share one provider call, and distinct ones
+    can be micro-batched (LLM_BATCH_WINDOW_MS) by the request scheduler.
     """
 
     def __init__(self):
         self.provider = os.getenv("LLM_PROVIDER", "placeholder").lower()
         self.model_name = "gesturegpt-v1"
+        self.limits = ProviderLimits(PROVIDER_ENV_PREFIXES.get(self.provider, "LLM"))
 
         # Initialize provider-specific clients
         self._init_provider()
 
+        # Canned replies are already instant, so only real providers are cached
+        self.completion_cache = CompletionCache() if self.provider != "placeholder" else None
+
+        # Coalescing and micro-batching of provider calls
+        coalesce = os.getenv("LLM_COALESCE_ENABLED", "true").lower() == "true"
+        self.scheduler = LLMScheduler(
+            self._complete_batch,
+            coalesce=coalesce,
+            batch_window=float(os.getenv("LLM_BATCH_WINDOW_MS", "0")) / 1000,
+            max_batch_size=int(os.getenv("LLM_BATCH_MAX_SIZE", "8")),
+            max_batches_in_flight=int(os.getenv("LLM_BATCH_MAX_IN_FLIGHT", "0"))
+        )
+        self.single_flight = SingleFlight() if coalesce else None
+        self.metrics = get_metrics()
+
         # Fallback responses for placeholder mode
         # Note: Responses use ASL-friendly simplified English
         self.responses = {
@@ -43,30 +157,48 @@ class LLMService:
                 import openai
                 self.openai_client = openai.OpenAI(
                     api_key=os.getenv("OPENAI_API_KEY"),
-                    base_url=os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+                    base_url=os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
+                    timeout=self.limits.timeout,
+                    max_retries=self.limits.max_retries
+                )
+                # Retries for async calls are done by _request_async
+                self.openai_async_client = openai.AsyncOpenAI(
+                    api_key=os.getenv("OPENAI_API_KEY"),
+                    base_url=os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
+                    timeout=self.limits.timeout,
+                    max_retries=0,
+                    http_client=get_llm_http_client()
                 )
                 self.openai_model = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
-                print(f"✓ OpenAI provider initialized with model: {self.openai_model}")
+                log.info("OpenAI provider initialized", model=self.openai_model)
             except ImportError:
-                print("⚠ OpenAI package not installed. Install with: pip install openai")
+                log.warning("OpenAI package not installed. Install with: pip install openai")
                 self.provider = "placeholder"
             except Exception as e:
-                print(f"⚠ OpenAI initialization failed: {e}")
+                log.warning("OpenAI initialization failed", error=str(e))
                 self.provider = "placeholder"
 
         elif self.provider == "anthropic":
             try:
                 import anthropic
                 self.anthropic_client = anthropic.Anthropic(
-                    api_key=os.getenv("ANTHROPIC_API_KEY")
+                    api_key=os.getenv("ANTHROPIC_API_KEY"),
+                    timeout=self.limits.timeout,
+                    max_retries=self.limits.max_retries
+                )
+                self.anthropic_async_client = anthropic.AsyncAnthropic(
+                    api_key=os.getenv("ANTHROPIC_API_KEY"),
+                    timeout=self.limits.timeout,
+                    max_retries=0,
+                    http_client=get_llm_http_client()
                 )
                 self.anthropic_model = os.getenv("ANTHROPIC_MODEL", "claude-3-opus-20240229")
-                print(f"✓ Anthropic provider initialized with model: {self.anthropic_model}")
+                log.info("Anthropic provider initialized", model=self.anthropic_model)
             except ImportError:
-                print("⚠ Anthropic package not installed. Install with: pip install anthropic")
+                log.warning("Anthropic package not installed. Install with: pip install anthropic")
                 self.provider = "placeholder"
             except Exception as e:
-                print(f"⚠ Anthropic initialization failed: {e}")
+                log.warning("Anthropic initialization failed", error=str(e))
                 self.provider = "placeholder"
 
         elif self.provider == "custom":
@@ -74,19 +206,28 @@ class LLMService:
                 import openai
                 self.custom_client = openai.OpenAI(
                     api_key=os.getenv("CUSTOM_LLM_API_KEY", "not-needed"),
-                    base_url=os.getenv("CUSTOM_LLM_ENDPOINT")
+                    base_url=os.getenv("CUSTOM_LLM_ENDPOINT"),
+                    timeout=self.limits.timeout,
+                    max_retries=self.limits.max_retries
+                )
+                self.custom_async_client = openai.AsyncOpenAI(
+                    api_key=os.getenv("CUSTOM_LLM_API_KEY", "not-needed"),
+                    base_url=os.getenv("CUSTOM_LLM_ENDPOINT"),
+                    timeout=self.limits.timeout,
+                    max_retries=0,
+                    http_client=get_llm_http_client()
                 )
                 self.custom_model = os.getenv("CUSTOM_LLM_MODEL", "llama2")
-                print(f"✓ Custom LLM provider initialized: {os.getenv('CUSTOM_LLM_ENDPOINT')}")
+                log.info("Custom LLM provider initialized", endpoint=os.getenv("CUSTOM_LLM_ENDPOINT"))
             except ImportError:
-                print("⚠ OpenAI package required for custom endpoint. Install with: pip install openai")
+                log.warning("OpenAI package required for custom endpoint. Install with: pip install openai")
                 self.provider = "placeholder"
             except Exception as e:
-                print(f"⚠ Custom LLM initialization failed: {e}")
+                log.warning("Custom LLM initialization failed", error=str(e))
                 self.provider = "placeholder"
 
         else:
-            print(f"ℹ Using placeholder LLM provider (canned responses)")
+            log.info("Using placeholder LLM provider (canned responses)")
 
     def generate_response(self, messages: List[ChatMessage]) -> str:
         """
@@ -99,84 +240,349 @@ class LLMService:
             Generated response text
         """
         if self.provider == "openai":
-            return self._generate_openai(messages)
+            generate = self._generate_openai
         elif self.provider == "anthropic":
-            return self._generate_anthropic(messages)
+            generate = self._generate_anthropic
         elif self.provider == "custom":
-            return self._generate_custom(messages)
+            generate = self._generate_custom
         else:
             return self._generate_placeholder(messages)
 
+        def timed_generate() -> str:
+            with self.metrics.llm_latency.time(provider=self.provider, mode="complete"):
+                return generate(messages)
+
+        with span("llm", provider=self.provider):
+            # Concurrent identical prompts (e.g. from other threads) share one call
+            if self.single_flight is None:
+                return timed_generate()
+            return self.single_flight.do(self._request_key(messages, None), timed_generate)
+
+    async def generate_response_async(self, messages: List[ChatMessage], temperature: Optional[float] = None) -> str:
+        """
+        Async variant of generate_response for use inside request handlers.
+
+        Args:
+            messages: List of chat messages in the conversation
+            temperature: Sampling temperature (None uses the provider default)
+
+        Returns:
+            Generated response text
+        """
+        with span("llm", provider=self.provider):
+            return await self._generate_async(messages, temperature)
+
+    async def _generate_async(self, messages: List[ChatMessage], temperature: Optional[float]) -> str:
+        """Answer from the completion cache or the request scheduler"""
+        if self.provider not in PROVIDER_LABELS:
+            return self._generate_placeholder(messages)
+
+        request_key = self._request_key(messages, temperature)
+        cacheable = self.completion_cache.is_cacheable(temperature)
+        if cacheable:
+            cached = self.completion_cache.get(request_key)
+            if cached is not None:
+                return cached
+
+        try:
+            response = await self.scheduler.submit(request_key, (messages, temperature))
+        except Exception as e:
+            log.error("LLM API error", provider=self.provider, error=str(e))
+            return self._generate_placeholder(messages)
+
+        if cacheable and response:
+            self.completion_cache.set(request_key, response)
+        return response
+
+    async def _complete_batch(self, requests: List[Tuple[List[ChatMessage], Optional[float]]]) -> List[Any]:
+        """
+        Resolve a batch of requests dispatched by the scheduler.
+
+        None of the supported chat APIs accepts several conversations in one
+        call, so the batch is sent as concurrent requests (still capped by
+        the provider's concurrency limit).
+
+        Args:
+            requests: (messages, temperature) pairs
+
+        Returns:
+            The response text, or the exception raised, for each request
+        """
+        return await asyncio.gather(
+            *(self._complete(messages, temperature) for messages, temperature in requests),
+            return_exceptions=True
+        )
+
+    async def _complete(self, messages: List[ChatMessage], temperature: Optional[float]) -> str:
+        """Call the configured provider for one request"""
+        with self.metrics.llm_latency.time(provider=self.provider, mode="complete"):
+            if self.provider == "openai":
+                return await self._generate_openai_async(messages, temperature)
+            elif self.provider == "anthropic":
+                return await self._generate_anthropic_async(messages, temperature)
+            return await self._generate_custom_async(messages, temperature)
+
+    async def generate_response_stream(self, messages: List[ChatMessage], temperature: Optional[float] = None) -> AsyncIterator[str]:
+        """
+        Stream a text response as it is generated.
+
+        Args:
+            messages: List of chat messages in the conversation
+            temperature: Sampling temperature (None uses the provider default)
+
+        Yields:
+            Text deltas, in order
+        """
+        with span("llm", provider=self.provider, mode="stream"):
+            async for delta in self._generate_stream(messages, temperature):
+                yield delta
+
+    async def _generate_stream(self, messages: List[ChatMessage], temperature: Optional[float]) -> AsyncIterator[str]:
+        """Stream from the completion cache or the provider"""
+        cache_key = None
+        if self.completion_cache is not None and self.completion_cache.is_cacheable(temperature):
+            cache_key = self._request_key(messages, temperature)
+            cached = self.completion_cache.get(cache_key)
+            if cached is not None:
+                for delta in self._split_deltas(cached):
+                    yield delta
+                return
+
+        if self.provider == "openai":
+            stream = self._stream_openai(
+                self.openai_async_client, self.openai_model,
+                self._build_openai_messages(messages), temperature
+            )
+        elif self.provider == "anthropic":
+            stream = self._stream_anthropic(messages, temperature)
+        elif self.provider == "custom":
+            stream = self._stream_openai(
+                self.custom_async_client, self.custom_model,
+                [{"role": m.role, "content": m.content} for m in messages], temperature
+            )
+        else:
+            stream = self._stream_placeholder(messages)
+
+        produced = []
+        try:
+            async with self.limits.semaphore:
+                with self.metrics.llm_latency.time(provider=self.provider, mode="stream"):
+                    async for delta in stream:
+                        produced.append(delta)
+                        yield delta
+        except Exception as e:
+            log.error("LLM streaming error", provider=self.provider, error=str(e))
+            # Nothing sent yet: answer like the non-streaming fallback
+            if not produced:
+                async for delta in self._stream_placeholder(messages):
+                    yield delta
+            return
+
+        # Only complete replies are cached
+        if cache_key and produced:
+            self.completion_cache.set(cache_key, "".join(produced))
+
+    def _request_key(self, messages: List[ChatMessage], temperature: Optional[float]) -> str:
+        """
+        Identify a request by what is actually sent to the provider.
+
+        Returns:
+            Key used for the completion cache and for coalescing
+        """
+        if self.provider == "openai":
+            model, request = self.openai_model, self._build_openai_messages(messages)
+        elif self.provider == "anthropic":
+            request = self._build_anthropic_request(messages)
+            model = request.pop("model")
+        else:
+            model, request = self.custom_model, [{"role": m.role, "content": m.content} for m in messages]
+        return CompletionCache.make_key(self.provider, model, request, temperature)
+
+    def get_cache_stats(self) -> Optional[dict]:
+        """Get completion cache statistics (None for the placeholder provider)."""
+        return self.completion_cache.get_stats() if self.completion_cache else None
+
+    def get_scheduler_stats(self) -> dict:
+        """Get request coalescing and micro-batching statistics."""
+        return self.scheduler.get_stats()
+
+    async def aclose(self) -> None:
+        """Stop the request scheduler and flush the completion cache."""
+        await self.scheduler.aclose()
+        self.flush_cache()
+
+    def flush_cache(self) -> None:
+        """Persist buffered completion cache writes."""
+        if self.completion_cache:
+            self.completion_cache.flush()
+
+    @staticmethod
+    def _sampling_options(temperature: Optional[float], max_temperature: float = 2.0) -> dict:
+        """Build the temperature argument for a provider call (omitted when None)."""
+        if temperature is None:
+            return {}
+        return {"temperature": min(temperature, max_temperature)}
+
+    async def _stream_openai(self, client, model: str, api_messages: List[dict], temperature: Optional[float] = None) -> AsyncIterator[str]:
+        """Stream a response from an OpenAI-compatible endpoint"""
+        stream = await self._with_retries(
+            lambda: client.chat.completions.create(
+                model=model, messages=api_messages, stream=True,
+                **self._sampling_options(temperature)
+            )
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def _stream_anthropic(self, messages: List[ChatMessage], temperature: Optional[float] = None) -> AsyncIterator[str]:
+        """Stream a response from Anthropic Claude"""
+        stream = await self._with_retries(
+            lambda: self.anthropic_async_client.messages.create(
+                **self._build_anthropic_request(messages), stream=True,
+                **self._sampling_options(temperature, max_temperature=1.0)
+            )
+        )
+        async for event in stream:
+            if event.type == "content_block_delta" and getattr(event.delta, "text", None):
+                yield event.delta.text
+
+    async def _with_retries(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await a provider call, retrying transient failures with exponential backoff.
+
+        Args:
+            call: Zero-argument function returning the provider SDK awaitable
+
+        Returns:
+            The call's result
+        """
+        for attempt in range(self.limits.max_retries + 1):
+            try:
+                return await call()
+            except Exception as e:
+                if attempt >= self.limits.max_retries or not _is_retryable(e):
+                    raise
+                delay = self.limits.retry_delay(attempt, e)
+                log.warning("LLM request failed, retrying", provider=self.provider, error=str(e), delay=round(delay, 2))
+                await asyncio.sleep(delay)
+
+    async def _request_async(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await a provider call within the provider's concurrency limit, with retries."""
+        async with self.limits.semaphore:
+            return await self._with_retries(call)
+
+    async def _stream_placeholder(self, messages: List[ChatMessage]) -> AsyncIterator[str]:
+        """Stream the canned response one word at a time"""
+        for delta in self._split_deltas(self._generate_placeholder(messages)):
+            yield delta
+
+    @staticmethod
+    def _split_deltas(text: str) -> List[str]:
+        """Split a complete reply into word-sized stream deltas"""
+        return re.findall(r"\s*\S+\s*", text)
+
+    def _build_openai_messages(self, messages: List[ChatMessage]) -> List[dict]:
+        """Convert chat messages to OpenAI format, adding the ASL system prompt if not present"""
+        api_messages = [{"role": m.role, "content": m.content} for m in messages]
+
+        # Check if there's already a system message
+        has_system = any(m["role"] == "system" for m in api_messages)
+
+        if not has_system:
+            # Prepend ASL system prompt
+            asl_system_prompt = {
+                "role": "system",
+                "content": (
+                    "You are GestureGPT, a friendly and helpful AI assistant that communicates in ASL (American Sign Language) grammar. "
+                    "You are conversational, warm, and engaging. Have natural conversations with users!\n\n"
+                    "When responding:\n"
+                    "1. Be conversational and engaging - ask follow-up questions, show interest, share relevant information\n"
+                    "2. Answer questions fully but naturally\n"
+                    "3. Use ASL grammar rules:\n"
+                    "   - Use present tense verbs\n"
+                    "   - Drop articles (a, an, the)\n"
+                    "   - Drop 'to be' verbs (is, are, am, was, were)\n"
+                    "   - Use simple sentence structure: SUBJECT VERB OBJECT\n"
+                    "   - Keep responses concise but complete (max 20 words per sentence)\n"
+                    "   - Avoid using specific names that may not have sign videos available\n\n"
+                    "Examples:\n"
+                    "User: 'Hi'\n"
+                    "You: 'HELLO! I HAPPY MEET YOU. HOW YOU TODAY?'\n\n"
+                    "User: 'How are you?'\n"
+                    "You: 'I FEEL WONDERFUL THANK YOU! YOU FEEL HOW?'\n\n"
+                    "User: 'What is your name?'\n"
+                    "You: 'I ASSISTANT. I HELP PEOPLE LEARN SIGN LANGUAGE. WHAT YOUR NAME?'\n\n"
+                    "User: 'Why is the sky blue?'\n"
+                    "You: 'SKY BLUE BECAUSE SUNLIGHT SCATTER IN ATMOSPHERE. YOU INTERESTED SCIENCE?'\n\n"
+                    "Be friendly, helpful, and conversational while using ASL grammar!"
+                )
+            }
+            vocabulary_hint = get_vocabulary_constraint().prompt_hint()
+            if vocabulary_hint:
+                asl_system_prompt["content"] += "\n\n" + vocabulary_hint
+            api_messages = [asl_system_prompt] + api_messages
+
+        return api_messages
+
+    def _build_anthropic_request(self, messages: List[ChatMessage]) -> dict:
+        """Convert chat messages to Anthropic messages.create arguments"""
+        system_messages = [m.content for m in messages if m.role == "system"]
+        conversation = [
+            {"role": m.role, "content": m.content}
+            for m in messages if m.role != "system"
+        ]
+        return {
+            "model": self.anthropic_model,
+            "max_tokens": 1024,
+            "system": system_messages[0] if system_messages else None,
+            "messages": conversation,
+        }
+
     def _generate_openai(self, messages: List[ChatMessage]) -> str:
         """Generate response using OpenAI"""
         try:
-            # Add ASL system prompt if not present
-            api_messages = [{"role": m.role, "content": m.content} for m in messages]
-
-            # Check if there's already a system message
-            has_system = any(m["role"] == "system" for m in api_messages)
-
-            if not has_system:
-                # Prepend ASL system prompt
-                asl_system_prompt = {
-                    "role": "system",
-                    "content": (
-                        "You are GestureGPT, a friendly and helpful AI assistant that communicates in ASL (American Sign Language) grammar. "
-                        "You are conversational, warm, and engaging. Have natural conversations with users!\n\n"
-                        "When responding:\n"
-                        "1. Be conversational and engaging - ask follow-up questions, show interest, share relevant information\n"
-                        "2. Answer questions fully but naturally\n"
-                        "3. Use ASL grammar rules:\n"
-                        "   - Use present tense verbs\n"
-                        "   - Drop articles (a, an, the)\n"
-                        "   - Drop 'to be' verbs (is, are, am, was, were)\n"
-                        "   - Use simple sentence structure: SUBJECT VERB OBJECT\n"
-                        "   - Keep responses concise but complete (max 20 words per sentence)\n"
-                        "   - Avoid using specific names that may not have sign videos available\n\n"
-                        "Examples:\n"
-                        "User: 'Hi'\n"
-                        "You: 'HELLO! I HAPPY MEET YOU. HOW YOU TODAY?'\n\n"
-                        "User: 'How are you?'\n"
-                        "You: 'I FEEL WONDERFUL THANK YOU! YOU FEEL HOW?'\n\n"
-                        "User: 'What is your name?'\n"
-                        "You: 'I ASSISTANT. I HELP PEOPLE LEARN SIGN LANGUAGE. WHAT YOUR NAME?'\n\n"
-                        "User: 'Why is the sky blue?'\n"
-                        "You: 'SKY BLUE BECAUSE SUNLIGHT SCATTER IN ATMOSPHERE. YOU INTERESTED SCIENCE?'\n\n"
-                        "Be friendly, helpful, and conversational while using ASL grammar!"
-                    )
-                }
-                api_messages = [asl_system_prompt] + api_messages
-
             response = self.openai_client.chat.completions.create(
                 model=self.openai_model,
-                messages=api_messages
+                messages=self._build_openai_messages(messages)
             )
             return response.choices[0].message.content
         except Exception as e:
-            print(f"⚠ OpenAI API error: {e}")
+            log.error("LLM API error", provider="openai", error=str(e))
             return self._generate_placeholder(messages)
 
+    async def _generate_openai_async(self, messages: List[ChatMessage], temperature: Optional[float] = None) -> str:
+        """Generate response using OpenAI without blocking the event loop"""
+        response = await self._request_async(
+            lambda: self.openai_async_client.chat.completions.create(
+                model=self.openai_model,
+                messages=self._build_openai_messages(messages),
+                **self._sampling_options(temperature)
+            )
+        )
+        return response.choices[0].message.content
+
     def _generate_anthropic(self, messages: List[ChatMessage]) -> str:
         """Generate response using Anthropic Claude"""
         try:
-            # Convert messages to Anthropic format
-            system_messages = [m.content for m in messages if m.role == "system"]
-            conversation = [
-                {"role": m.role, "content": m.content}
-                for m in messages if m.role != "system"
-            ]
-
             response = self.anthropic_client.messages.create(
-                model=self.anthropic_model,
-                max_tokens=1024,
-                system=system_messages[0] if system_messages else None,
-                messages=conversation
+                **self._build_anthropic_request(messages)
             )
             return response.content[0].text
         except Exception as e:
-            print(f"⚠ Anthropic API error: {e}")
+            log.error("LLM API error", provider="anthropic", error=str(e))
             return self._generate_placeholder(messages)
 
+    async def _generate_anthropic_async(self, messages: List[ChatMessage], temperature: Optional[float] = None) -> str:
+        """Generate response using Anthropic Claude without blocking the event loop"""
+        response = await self._request_async(
+            lambda: self.anthropic_async_client.messages.create(
+                **self._build_anthropic_request(messages),
+                **self._sampling_options(temperature, max_temperature=1.0)
+            )
+        )
+        return response.content[0].text
+
     def _generate_custom(self, messages: List[ChatMessage]) -> str:
         """Generate response using custom OpenAI-compatible endpoint"""
         try:
@@ -186,9 +592,20 @@ class LLMService:
             )
             return response.choices[0].message.content
         except Exception as e:
-            print(f"⚠ Custom LLM API error: {e}")
+            log.error("LLM API error", provider="custom", error=str(e))
             return self._generate_placeholder(messages)
 
+    async def _generate_custom_async(self, messages: List[ChatMessage], temperature: Optional[float] = None) -> str:
+        """Generate response using custom OpenAI-compatible endpoint without blocking the event loop"""
+        response = await self._request_async(
+            lambda: self.custom_async_client.chat.completions.create(
+                model=self.custom_model,
+                messages=[{"role": m.role, "content": m.content} for m in messages],
+                **self._sampling_options(temperature)
+            )
+        )
+        return response.choices[0].message.content
+
     def _generate_placeholder(self, messages: List[ChatMessage]) -> str:
         """Generate response using placeholder/canned responses"""
         # Get the last user message
@@ -208,3 +625,15 @@ class LLMService:
             return f"Interesting question! You ask: '{user_messages[-1].content}'. I help you!"
         else:
             return f"I understand: '{user_messages[-1].content}'. Good! How I help more?"
+
+
+# Singleton instance
+_llm_service = None
+
+
+def get_llm_service() -> LLMService:
+    """Get or create the LLM service singleton"""
+    global _llm_service
+    if _llm_service is None:
+        _llm_service = LLMService()
+    return _llm_service
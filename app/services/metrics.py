@@ -0,0 +1,247 @@
+"""
+Metrics
+Prometheus-style counters and histograms for the request hot path,
+exposed in the text exposition format at /metrics.
+
+Metrics are off by default (METRICS_ENABLED). When disabled every
+observe()/inc() returns immediately and time() hands back a shared no-op
+context manager, so instrumented code pays one attribute check.
+
+Gauges (cache sizes) are read from callbacks when /metrics is scraped, so
+they cost nothing between scrapes.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Seconds; covers in-memory lookups up to slow LLM completions
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+FAST_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05)
+
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _NullTimer:
+    """Context manager used by disabled histograms."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    def __init__(self, histogram: "Histogram", labels: Dict[str, str]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), enabled: bool = False):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    type = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        if not self.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets, per label set."""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), enabled: bool = False,
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames, enabled)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [bucket counts..., +Inf count], sum
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        if not self.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            counts, total = entry
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            total[0] += value
+
+    def time(self, **labels: str):
+        """Time a block: with histogram.time(provider="openai"): ..."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, labels)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            values = [(key, list(counts), total[0]) for key, (counts, total) in self._values.items()]
+        for key, counts, total in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Value read from a callback at scrape time."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, callback: Callable[[], Optional[float]], enabled: bool = False):
+        super().__init__(name, help, (), enabled)
+        self.callback = callback
+
+    def render(self) -> List[str]:
+        try:
+            value = self.callback()
+        except Exception:
+            value = None
+        if value is None:
+            return []
+        return super().render() + [f"{self.name} {_format_value(value)}"]
+
+
+class Metrics:
+    """The application's metrics, rendered together at /metrics."""
+
+    def __init__(self, enabled: bool = False):
+        """
+        Args:
+            enabled: Whether observations are recorded
+        """
+        self.enabled = enabled
+        self.llm_latency = Histogram(
+            "gesturegpt_llm_request_duration_seconds",
+            "LLM completion latency (time to last token for streams)",
+            ("provider", "mode"), enabled
+        )
+        self.normalize_latency = Histogram(
+            "gesturegpt_normalize_duration_seconds",
+            "Text normalization time per call",
+            (), enabled, buckets=FAST_BUCKETS
+        )
+        self.lookup_latency = Histogram(
+            "gesturegpt_video_lookup_duration_seconds",
+            "Per-word video lookup latency by outcome (hit: cached, negative: "
+            "known or recently failed miss, miss: fetched from SignASL)",
+            ("result",), enabled
+        )
+        self.signasl_errors = Counter(
+            "gesturegpt_signasl_errors_total",
+            "SignASL lookups that failed without an answer, by error kind",
+            ("kind", "endpoint"), enabled
+        )
+        self.cache_flush_latency = Histogram(
+            "gesturegpt_cache_flush_duration_seconds",
+            "Time to persist a batch of buffered cache writes",
+            ("store",), enabled
+        )
+        self.cache_flush_entries = Counter(
+            "gesturegpt_cache_flush_entries_total",
+            "Cache entries persisted by flushes",
+            ("store",), enabled
+        )
+        self._metrics: List[_Metric] = [
+            self.llm_latency, self.normalize_latency, self.lookup_latency,
+            self.signasl_errors, self.cache_flush_latency, self.cache_flush_entries,
+        ]
+
+    def gauge(self, name: str, help: str, callback: Callable[[], Optional[float]]) -> None:
+        """Register a gauge read from callback at scrape time (None omits it)."""
+        self._metrics.append(Gauge(name, help, callback, self.enabled))
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Singleton instance
+_metrics = None
+
+
+def get_metrics() -> Metrics:
+    """Get singleton instance of Metrics."""
+    global _metrics
+    if _metrics is None:
+        _metrics = Metrics(enabled=os.getenv("METRICS_ENABLED", "false").lower() == "true")
+    return _metrics
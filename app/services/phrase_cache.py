@@ -0,0 +1,358 @@
+"""
+Phrase Cache
+Pre-rendered videos for sentences that are requested over and over (the
+placeholder LLM replies, greetings, kiosk prompts).
+
+Every normalized phrase that is looked up is counted. Once a phrase has
+been seen PHRASE_CACHE_MIN_HITS times (or is listed as a seed phrase) its
+clips are stitched in the background into output/videos/phrases, and the
+composed video and word timestamps are stored. Later requests for that
+phrase are answered from this entry without any SignASL lookup; the clip
+URLs are read from the repository's cache on every hit, so they follow
+the clip mirror (and its evictions), and an entry whose words lost their
+clips (e.g. after a cache clear) or whose video another worker evicted is
+dropped.
+
+Only phrases whose every word has a clip are pre-rendered, so an entry
+never needs to be refreshed when a missing word is resolved later. The
+composed files are bounded by a disk budget with least-recently-used
+eviction, and the index survives restarts.
+"""
+
+import asyncio
+import os
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set
+
+from app.services.cache_store import create_cache_store
+from app.services.structured_log import get_logger
+from app.services.text_normalizer import get_text_normalizer
+from app.services.video_composer import Composition, VideoComposer, get_video_composer
+from app.services.video_repository import VideoRepository, get_video_repository
+
+log = get_logger(__name__)
+
+
+class PhraseEntry:
+    """Clip URLs and pre-rendered video for one phrase and format.
+
+    The stored video_urls are those the phrase was rendered from; entries
+    returned by PhraseCache.get() carry the current ones.
+    """
+
+    def __init__(self, video_urls: List[str], composition: Composition, size: int):
+        self.video_urls = video_urls
+        self.composition = composition
+        self.size = size
+
+    def to_dict(self) -> dict:
+        return {
+            "video_urls": self.video_urls,
+            "composition": self.composition.to_dict(),
+            "size": self.size,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PhraseEntry":
+        composition = data["composition"]
+        return cls(
+            list(data["video_urls"]),
+            Composition(composition["url"], composition["format"], composition["timestamps"], composition["duration"]),
+            data["size"]
+        )
+
+
+class PhraseCache:
+    """Popularity-driven, size-bounded cache of pre-rendered phrases."""
+
+    def __init__(
+        self,
+        repository: VideoRepository,
+        composer: VideoComposer,
+        enabled: bool = False,
+        min_hits: int = 3,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_tracked: int = 10000,
+        max_words: int = 30,
+        subdir: str = "phrases",
+        index_file: str = "data/phrase_cache.json"
+    ):
+        """
+        Args:
+            repository: Repository resolving the clips of a phrase
+            composer: Composer stitching the clips
+            enabled: Whether phrases are counted and pre-rendered
+            min_hits: Lookups of a phrase before it is pre-rendered
+            max_bytes: Disk budget for pre-rendered videos
+            max_tracked: Max phrases with a popularity counter (counters
+                are halved when exceeded, so stale phrases age out)
+            max_words: Longest phrase that is pre-rendered
+            subdir: Subdirectory of the composer's videos_dir for phrase videos
+            index_file: Path persisting the phrase index
+        """
+        self.repository = repository
+        self.composer = composer
+        self.enabled = enabled
+        self.min_hits = max(1, min_hits)
+        self.max_bytes = max_bytes
+        self.max_tracked = max_tracked
+        self.max_words = max_words
+        self.subdir = subdir
+        self.normalizer = get_text_normalizer()
+
+        # (phrase, format) key -> entry, least recently used first
+        self.entries: "OrderedDict[str, PhraseEntry]" = OrderedDict()
+        self.counts: Dict[str, int] = {}
+        self.total_bytes = 0
+        self._rendering: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.hits = 0
+        self.misses = 0
+        self.rendered = 0
+        self.evictions = 0
+        self.invalidated = 0
+        self.failures = 0
+
+        self.store = None
+        if self.enabled:
+            self.store = create_cache_store(index_file)
+            self._load()
+
+    @staticmethod
+    def _key(normalized_text: str, format: str) -> str:
+        return f"{format}:{normalized_text}"
+
+    def _load(self) -> None:
+        """Load entries whose video is still on disk."""
+        try:
+            stored = self.store.load()
+        except Exception as e:
+            log.error("Error loading phrase cache", error=str(e))
+            return
+        for key, data in stored.items():
+            try:
+                entry = PhraseEntry.from_dict(data)
+            except (KeyError, TypeError):
+                self.store.delete(key)
+                continue
+            if not os.path.isfile(self._video_path(entry)):
+                self.store.delete(key)
+                continue
+            self.entries[key] = entry
+            self.total_bytes += entry.size
+        if self.entries:
+            log.info("Loaded pre-rendered phrases", phrases=len(self.entries), bytes=self.total_bytes)
+
+    def _video_path(self, entry: PhraseEntry) -> str:
+        return os.path.join(self.composer.videos_dir, entry.composition.url[len("/videos/"):])
+
+    def get(self, normalized_text: str, format: str = "mp4") -> Optional[PhraseEntry]:
+        """
+        Get the pre-rendered entry for a phrase, counting the request.
+
+        Args:
+            normalized_text: Space-separated uppercase tokens
+            format: Video format (mp4 or gif)
+
+        Returns:
+            The entry, or None if the phrase is not pre-rendered yet
+        """
+        if not self.enabled or not normalized_text:
+            return None
+        key = self._key(normalized_text, format)
+        entry = self.entries.get(key)
+        if entry is not None and not os.path.isfile(self._video_path(entry)):
+            # Evicted by another worker sharing the videos directory
+            self._forget(key)
+            self.invalidated += 1
+            entry = None
+        if entry is not None:
+            video_urls = self._current_urls(normalized_text)
+            if video_urls is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return PhraseEntry(video_urls, entry.composition, entry.size)
+            self._remove(key)
+            self.invalidated += 1
+        self.misses += 1
+        self._count(key, normalized_text, format)
+        return None
+
+    def count(self, normalized_text: str, format: str = "mp4") -> None:
+        """Count a request answered elsewhere (e.g. from a memo) towards pre-rendering."""
+        if not self.enabled or not normalized_text:
+            return
+        key = self._key(normalized_text, format)
+        if key not in self.entries:
+            self._count(key, normalized_text, format)
+
+    def _current_urls(self, normalized_text: str) -> Optional[List[str]]:
+        """Get the phrase's clip URLs as the repository serves them now (None if a word has none)."""
+        urls = []
+        for _, clips in self.repository.get_clips(normalized_text.split()):
+            if not clips:
+                return None
+            urls.extend(clips)
+        return urls
+
+    def peek(self, normalized_text: str, format: str = "mp4") -> Optional[PhraseEntry]:
+        """Get the pre-rendered entry for a phrase without counting a request."""
+        if not self.enabled:
+            return None
+        return self.entries.get(self._key(normalized_text, format))
+
+    def _count(self, key: str, normalized_text: str, format: str) -> None:
+        """Bump a phrase's popularity and pre-render it once it is hot."""
+        if len(normalized_text.split()) > self.max_words:
+            return
+        count = self.counts.get(key, 0) + 1
+        self.counts[key] = count
+        if len(self.counts) > self.max_tracked:
+            # Age every counter so new phrases can still become hot
+            self.counts = {k: c // 2 for k, c in self.counts.items() if c // 2 > 0}
+        if count >= self.min_hits:
+            self.schedule(normalized_text, format)
+
+    def schedule(self, normalized_text: str, format: str = "mp4") -> None:
+        """Pre-render a phrase in the background on the running event loop."""
+        key = self._key(normalized_text, format)
+        if not self.enabled or key in self.entries or key in self._rendering or not self.composer.available:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._rendering.add(key)
+        task = loop.create_task(self._render(key, normalized_text, format))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _render(self, key: str, normalized_text: str, format: str) -> None:
+        try:
+            words = normalized_text.split()
+            _, missing_words = await self.repository.lookup_words_async(words)
+            if missing_words:
+                # Needs min_hits more requests before it is tried again
+                self.counts.pop(key, None)
+                return
+            segments = self.repository.get_clips(words)
+            composition = await self.composer.compose(segments, format=format, subdir=self.subdir)
+            entry = PhraseEntry([url for _, clips in segments for url in clips], composition, 0)
+            entry.size = os.path.getsize(self._video_path(entry))
+            self._add(key, entry)
+        except Exception as e:
+            self.failures += 1
+            self.counts.pop(key, None)
+            log.warning("Could not pre-render phrase", phrase=normalized_text, error=str(e))
+        finally:
+            self._rendering.discard(key)
+
+    def _add(self, key: str, entry: PhraseEntry) -> None:
+        self.entries[key] = entry
+        self.total_bytes += entry.size
+        self.counts.pop(key, None)
+        self.store.set(key, entry.to_dict())
+        self.rendered += 1
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used phrases until the videos fit the budget."""
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def _forget(self, key: str) -> PhraseEntry:
+        """Drop an entry from the index, leaving its video alone."""
+        entry = self.entries.pop(key)
+        self.total_bytes -= entry.size
+        self.store.delete(key)
+        return entry
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and its video."""
+        entry = self._forget(key)
+        path = self._video_path(entry)
+        # Identical phrases in another format or spelling may share the file
+        if any(other.composition.url == entry.composition.url for other in self.entries.values()):
+            return
+        for stale in (path, path + ".json"):
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+    def seed(self, texts: Iterable[str], format: str = "mp4") -> int:
+        """
+        Pre-render phrases regardless of popularity (e.g. canned replies).
+
+        Args:
+            texts: Raw phrases; they are normalized like request text
+            format: Video format to render
+
+        Returns:
+            Number of phrases scheduled
+        """
+        scheduled = 0
+        for text in texts:
+            normalized_text = self.normalizer.normalize_to_string(text)
+            if normalized_text and self._key(normalized_text, format) not in self.entries:
+                self.schedule(normalized_text, format)
+                scheduled += 1
+        return scheduled
+
+    async def stop(self) -> None:
+        """Cancel running pre-renders and persist the index."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self.store is not None:
+            self.store.flush()
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get phrase hit rate, size and pre-render counters."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "phrases": len(self.entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "tracked": len(self.counts),
+            "rendering": len(self._rendering),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "rendered": self.rendered,
+            "evictions": self.evictions,
+            "invalidated": self.invalidated,
+            "failures": self.failures,
+        }
+
+
+def read_seed_phrases(path: str) -> List[str]:
+    """Read one phrase per line, skipping blanks and # comments."""
+    if not path or not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+# Singleton instance
+_cache = None
+
+
+def get_phrase_cache() -> PhraseCache:
+    """Get singleton instance of PhraseCache."""
+    global _cache
+    if _cache is None:
+        _cache = PhraseCache(
+            get_video_repository(),
+            get_video_composer(),
+            enabled=os.getenv("PHRASE_CACHE_ENABLED", "false").lower() == "true",
+            min_hits=int(os.getenv("PHRASE_CACHE_MIN_HITS", "3")),
+            max_bytes=int(float(os.getenv("PHRASE_CACHE_MAX_MB", "256")) * 1024 * 1024),
+            max_tracked=int(os.getenv("PHRASE_CACHE_MAX_TRACKED", "10000")),
+            max_words=int(os.getenv("PHRASE_CACHE_MAX_WORDS", "30"))
+        )
+    return _cache
@@ -3,9 +3,19 @@ Sign Language Service
 Looks up ASL videos from a repository based on normalized text.
 """
 
-from typing import List, Tuple
+import os
+from typing import AsyncIterator, List, Optional, Tuple
+from .lru_cache import LRUCache
+from .phrase_cache import get_phrase_cache
+from .structured_log import get_logger
 from .text_normalizer import get_text_normalizer
+from .video_composer import Composition, CompositionError, get_video_composer
 from .video_repository import get_video_repository
+from .vocabulary import get_vocabulary_constraint
+
+log = get_logger(__name__)
+
+SignResult = Tuple[List[str], List[str], str]
 
 
 class SignLanguageService:
@@ -16,19 +26,101 @@ class SignLanguageService:
     1. Normalizes input text to uppercase word tokens
     2. Looks up corresponding videos from the repository
     3. Returns video URLs and any missing words
+
+    Results are memoized per (text, format) in a bounded LRU with a TTL
+    (SIGN_MEMO_SIZE, SIGN_MEMO_TTL); the memo is cleared whenever the
+    repository's contents change.
+
+    With PHRASE_CACHE_ENABLED, popular phrases are pre-rendered and then
+    answered from the phrase cache without any SignASL lookup.
+
+    With VOCAB_MODE=rewrite, the signs of generated replies can use a
+    synonym with a cached video for words SignASL has none for.
     """
 
     def __init__(self):
         self.normalizer = get_text_normalizer()
         self.repository = get_video_repository()
+        self.vocabulary = get_vocabulary_constraint()
+        self.composer = get_video_composer()
+        self.phrases = get_phrase_cache()
+        self.memo = LRUCache(
+            max_entries=int(os.getenv("SIGN_MEMO_SIZE", "1024")),
+            ttl=float(os.getenv("SIGN_MEMO_TTL", "300"))
+        )
+        self._memo_version = self.repository.version
+
+    def _sync_memo(self) -> None:
+        """Drop memoized results computed against an older repository state."""
+        version = self.repository.version
+        if version != self._memo_version:
+            self.memo.clear()
+            self._memo_version = version
+
+    def _memo_get(self, text: str, format: str, rewrite: bool = False) -> Optional[SignResult]:
+        if not self.memo.enabled:
+            return None
+        self._sync_memo()
+        result = self.memo.get((text, format, rewrite))
+        if result is LRUCache.MISSING:
+            return None
+        video_urls, missing_words, normalized_text = result
+        return list(video_urls), list(missing_words), normalized_text
+
+    def _memo_set(self, text: str, format: str, result: SignResult, rewrite: bool = False) -> None:
+        if not self.memo.enabled:
+            return
+        video_urls, missing_words, normalized_text = result
+        # Words missing (or spelled out) because of a transient lookup
+        # failure are retried soon
+        if not all(
+            self.repository.is_negative(word) or self.repository.word_exists(word)
+            for word in normalized_text.split()
+        ):
+            return
+        # Words just found to have no video get a synonym next time
+        if rewrite and any(self.vocabulary.synonym(word) for word in missing_words):
+            return
+        self._sync_memo()
+        self.memo.set((text, format, rewrite), (tuple(video_urls), tuple(missing_words), normalized_text))
 
-    def generate_video(self, text: str, format: str = "mp4") -> Tuple[List[str], List[str], str]:
+    def get_memo_stats(self) -> dict:
+        """Get hit-rate statistics for the result memo."""
+        return self.memo.stats()
+
+    def _phrase_get(self, normalized_text: str, format: str) -> Optional[SignResult]:
+        """Answer from a pre-rendered phrase (no lookups), counting its popularity."""
+        if not self.phrases.enabled:
+            return None
+        entry = self.phrases.get(normalized_text, format)
+        if entry is None:
+            return None
+        return list(entry.video_urls), [], normalized_text
+
+    def _cached_result(self, text: str, format: str, rewrite: bool = False) -> Optional[SignResult]:
+        """Answer from the memo, still counting the phrase's popularity."""
+        memoized = self._memo_get(text, format, rewrite)
+        if memoized is not None:
+            self.phrases.count(memoized[2], format)
+        return memoized
+
+    def get_phrase_stats(self) -> dict:
+        """Get pre-rendered phrase cache statistics."""
+        return self.phrases.get_stats()
+
+    def get_vocabulary_stats(self) -> dict:
+        """Get vocabulary constraint mode and substitution counts."""
+        return self.vocabulary.get_stats()
+
+    def generate_video(self, text: str, format: str = "mp4", rewrite: bool = False) -> SignResult:
         """
         Lookup videos for the given text.
 
         Args:
             text: Input text to convert to sign language
             format: Video format (mp4 or gif) - currently only mp4 supported
+            rewrite: Sign words known to have no video with a synonym
+                (VOCAB_MODE=rewrite); the text itself is not changed
 
         Returns:
             Tuple of (video_urls, missing_words, normalized_text)
@@ -41,15 +133,131 @@ class SignLanguageService:
             >>> print(normalized)
             'HELLO HOW ARE YOU'
         """
+        memoized = self._cached_result(text, format, rewrite)
+        if memoized is not None:
+            return memoized
+
         # Normalize text to word tokens
         words = self.normalizer.normalize(text)
+        if rewrite:
+            words = self.vocabulary.rewrite_tokens(words)
         normalized_text = ' '.join(words)
 
+        phrase = self._phrase_get(normalized_text, format)
+        if phrase is not None:
+            self._memo_set(text, format, phrase, rewrite)
+            return phrase
+
         # Lookup videos from repository
         video_urls, missing_words = self.repository.lookup_words(words)
 
+        self._memo_set(text, format, (video_urls, missing_words, normalized_text), rewrite)
         return video_urls, missing_words, normalized_text
 
+    async def generate_video_async(self, text: str, format: str = "mp4", rewrite: bool = False) -> SignResult:
+        """
+        Async variant of generate_video for use inside request handlers.
+        Repository misses are awaited instead of blocking the event loop.
+
+        Args:
+            text: Input text to convert to sign language
+            format: Video format (mp4 or gif) - currently only mp4 supported
+            rewrite: Sign words known to have no video with a synonym
+                (VOCAB_MODE=rewrite); the text itself is not changed
+
+        Returns:
+            Tuple of (video_urls, missing_words, normalized_text)
+        """
+        memoized = self._cached_result(text, format, rewrite)
+        if memoized is not None:
+            return memoized
+
+        words = self.normalizer.normalize(text)
+        if rewrite:
+            words = self.vocabulary.rewrite_tokens(words)
+        normalized_text = ' '.join(words)
+
+        if self.phrases.enabled:
+            # Phrase hits read the clips from the cache backend
+            await self.repository.prefetch_async(words)
+            phrase = self._phrase_get(normalized_text, format)
+            if phrase is not None:
+                self._memo_set(text, format, phrase, rewrite)
+                return phrase
+
+        video_urls, missing_words = await self.repository.lookup_words_async(words)
+
+        self._memo_set(text, format, (video_urls, missing_words, normalized_text), rewrite)
+        return video_urls, missing_words, normalized_text
+
+    async def compose_video_async(self, normalized_text: str, format: str = "mp4") -> Optional[Composition]:
+        """
+        Stitch the clips of already looked-up text into one video.
+
+        Args:
+            normalized_text: Normalized text returned by generate_video_async
+            format: Video format (mp4 or gif)
+
+        Returns:
+            The composition, or None if it could not be made (the separate
+            clip URLs remain usable)
+        """
+        phrase = self.phrases.peek(normalized_text, format)
+        if phrase is not None:
+            return phrase.composition
+        if not self.composer.available:
+            return None
+
+        segments = await self.repository.get_clips_async(normalized_text.split())
+        if not any(clips for _, clips in segments):
+            return None
+        try:
+            return await self.composer.compose(segments, format=format)
+        except CompositionError as e:
+            log.warning("Video composition failed", error=str(e))
+            return None
+
+    def normalize_text(self, text: str) -> str:
+        """
+        Normalize text to ASL tokens without looking up any videos.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Space-separated uppercase tokens
+        """
+        return self.normalizer.normalize_to_string(text)
+
+    async def generate_video_stream(
+        self,
+        chunks: AsyncIterator[str],
+        format: str = "mp4"
+    ) -> AsyncIterator[Tuple[str, Optional[str]]]:
+        """
+        Normalize and look up streamed text incrementally.
+
+        Each word is tokenized once it is finished and resolved while the
+        rest of the text is still arriving, so lookups overlap generation.
+        Synonym rewriting (VOCAB_MODE) applies to the tokens looked up.
+
+        Args:
+            chunks: Async iterable of text chunks (e.g. LLM deltas)
+            format: Video format (mp4 or gif) - currently only mp4 supported
+
+        Yields:
+            (token, video URL or None when no video is available), in order
+        """
+        normalizer = self.normalizer.incremental()
+
+        async def token_batches() -> AsyncIterator[List[str]]:
+            async for chunk in chunks:
+                yield self.vocabulary.rewrite_tokens(normalizer.feed(chunk))
+            yield self.vocabulary.rewrite_tokens(normalizer.finish())
+
+        async for token, url in self.repository.lookup_stream(token_batches()):
+            yield token, url
+
     def get_available_words(self) -> List[str]:
         """Get list of all words available in the video repository."""
         videos = self.repository.get_all_videos()
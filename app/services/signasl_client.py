@@ -3,20 +3,210 @@ SignASL API Client
 Fetches video URLs from the SignASL scraper API.
 """
 
+import asyncio
 import os
+import httpx
 import requests
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List, Optional
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+from app.services.metrics import get_metrics
+from app.services.structured_log import get_logger
+
 load_dotenv()
 
+log = get_logger(__name__)
+
+# Upstream statuses worth retrying (gateway/overload errors)
+RETRY_STATUSES = (502, 503, 504)
+
+# Statuses meaning the upstream has no bulk endpoint
+BULK_UNSUPPORTED_STATUSES = (404, 405, 501)
+
+# Marker for per-word lookups that failed (as opposed to "no video")
+_FAILED = object()
+
+
+class SignASLError(Exception):
+    """
+    A SignASL lookup failed without a definite answer.
+
+    Attributes:
+        kind: One of "timeout", "connection", "status" or "error"
+    """
+
+    def __init__(self, kind: str, message: str = ""):
+        super().__init__(message or kind)
+        self.kind = kind
+
 
 class SignASLClient:
-    """Client for interacting with SignASL API."""
+    """
+    Client for interacting with SignASL API.
+
+    Owns one pooled keep-alive session per I/O model (requests for sync
+    callers, httpx for async callers) that is reused across lookups.
+    """
 
     def __init__(self):
         self.base_url = os.getenv("SIGNASL_API_URL", "http://signasl-api:8001")
-        self.timeout = 10
+        self.timeout = float(os.getenv("SIGNASL_TIMEOUT", "10"))
+
+        # Connection pool settings
+        self.pool_size = int(os.getenv("SIGNASL_POOL_SIZE", "20"))
+        self.pool_per_host = int(os.getenv("SIGNASL_POOL_PER_HOST", "20"))
+        self.keepalive_connections = int(os.getenv("SIGNASL_KEEPALIVE_CONNECTIONS", "10"))
+        self.keepalive_expiry = float(os.getenv("SIGNASL_KEEPALIVE_EXPIRY", "30"))
+        self.max_retries = int(os.getenv("SIGNASL_MAX_RETRIES", "2"))
+        self.retry_backoff = float(os.getenv("SIGNASL_RETRY_BACKOFF", "0.25"))
+
+        # Bulk lookups (one request for many words); disabled automatically
+        # when the upstream does not expose the bulk endpoint
+        self.bulk_enabled = os.getenv("SIGNASL_BULK_ENABLED", "true").lower() == "true"
+        self.bulk_max_words = max(1, int(os.getenv("SIGNASL_BULK_MAX_WORDS", "100")))
+        self.max_concurrency = max(1, int(os.getenv("SIGNASL_MAX_CONCURRENCY", "8")))
+
+        self.metrics = get_metrics()
+
+        self._session: Optional[requests.Session] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+
+    def _get_session(self) -> requests.Session:
+        """Lazily create the shared pooled requests session."""
+        if self._session is None:
+            retry = Retry(
+                total=self.max_retries,
+                backoff_factor=self.retry_backoff,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset(["GET", "POST"]),
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_size,
+                pool_maxsize=self.pool_per_host,
+                max_retries=retry
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Lazily create the shared async HTTP client (must be used from the event loop)."""
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=min(self.pool_size, self.pool_per_host),
+                    max_keepalive_connections=self.keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                )
+            )
+        return self._async_client
+
+    async def _request_async(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Send a request to a SignASL API path on the shared async client.
+        Transport errors and gateway statuses are retried with exponential backoff.
+        """
+        client = self._get_async_client()
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await client.request(method, path, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                    return response
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+            await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+
+    def _parse_video_response(self, word: str, status_code: int, data: Any) -> Optional[str]:
+        """
+        Extract the first video URL from a SignASL API response.
+
+        Raises:
+            SignASLError: If the status is neither a hit nor a definite miss
+        """
+        if status_code == 200:
+            # SignASL API returns {"word": "hello", "video_urls": ["https://...", ...]}
+            # Get the first video URL from the array
+            video_urls = data.get("video_urls", [])
+            return video_urls[0] if video_urls else None
+        elif status_code == 404:
+            return None
+        else:
+            log.warning("SignASL API returned an unexpected status", word=word, status=status_code)
+            self.metrics.signasl_errors.inc(kind="status", endpoint="single")
+            raise SignASLError("status", f"status {status_code}")
+
+    def fetch_video_url(self, word: str) -> Optional[str]:
+        """
+        Get video URL for a word, distinguishing misses from failures.
+
+        Args:
+            word: The word to get video for
+
+        Returns:
+            Video URL if found, None if SignASL has no video for the word
+
+        Raises:
+            SignASLError: On timeouts, connection errors and unexpected statuses
+        """
+        try:
+            response = self._get_session().get(
+                f"{self.base_url}/api/video-url/{word}",
+                timeout=self.timeout
+            )
+            data = response.json() if response.status_code == 200 else None
+            return self._parse_video_response(word, response.status_code, data)
+
+        except SignASLError:
+            raise
+        except requests.exceptions.Timeout as e:
+            log.warning("SignASL API timeout", word=word)
+            self.metrics.signasl_errors.inc(kind="timeout", endpoint="single")
+            raise SignASLError("timeout", str(e)) from e
+        except requests.exceptions.ConnectionError as e:
+            log.warning("Cannot connect to SignASL API", url=self.base_url)
+            self.metrics.signasl_errors.inc(kind="connection", endpoint="single")
+            raise SignASLError("connection", str(e)) from e
+        except Exception as e:
+            log.warning("SignASL API error", word=word, error=str(e))
+            self.metrics.signasl_errors.inc(kind="error", endpoint="single")
+            raise SignASLError("error", str(e)) from e
+
+    async def fetch_video_url_async(self, word: str) -> Optional[str]:
+        """
+        Async variant of fetch_video_url.
+
+        Raises:
+            SignASLError: On timeouts, connection errors and unexpected statuses
+        """
+        try:
+            response = await self._request_async("GET", f"/api/video-url/{word}")
+            data = response.json() if response.status_code == 200 else None
+            return self._parse_video_response(word, response.status_code, data)
+
+        except SignASLError:
+            raise
+        except httpx.TimeoutException as e:
+            log.warning("SignASL API timeout", word=word)
+            self.metrics.signasl_errors.inc(kind="timeout", endpoint="single")
+            raise SignASLError("timeout", str(e)) from e
+        except httpx.ConnectError as e:
+            log.warning("Cannot connect to SignASL API", url=self.base_url)
+            self.metrics.signasl_errors.inc(kind="connection", endpoint="single")
+            raise SignASLError("connection", str(e)) from e
+        except Exception as e:
+            log.warning("SignASL API error", word=word, error=str(e))
+            self.metrics.signasl_errors.inc(kind="error", endpoint="single")
+            raise SignASLError("error", str(e)) from e
 
     def get_video_url(self, word: str) -> Optional[str]:
         """
@@ -29,32 +219,213 @@ class SignASLClient:
             Video URL if found, None otherwise
         """
         try:
-            response = requests.get(
-                f"{self.base_url}/api/video-url/{word}",
-                timeout=self.timeout
+            return self.fetch_video_url(word)
+        except SignASLError:
+            return None
+
+    async def get_video_url_async(self, word: str) -> Optional[str]:
+        """
+        Get video URL for a word from SignASL API without blocking the event loop.
+
+        Args:
+            word: The word to get video for
+
+        Returns:
+            Video URL if found, None otherwise
+        """
+        try:
+            return await self.fetch_video_url_async(word)
+        except SignASLError:
+            return None
+
+    def _chunk_words(self, words: List[str]) -> List[List[str]]:
+        """Split words into bulk-request sized chunks."""
+        return [
+            words[i:i + self.bulk_max_words]
+            for i in range(0, len(words), self.bulk_max_words)
+        ]
+
+    def _parse_bulk_response(self, words: List[str], data: Any) -> Dict[str, Optional[str]]:
+        """
+        Map requested words to the first video URL in a bulk response.
+
+        The bulk endpoint returns {"results": {"hello": ["https://...", ...], ...}};
+        keys are matched case-insensitively and absent words map to None.
+        """
+        results = data.get("results", data) if isinstance(data, dict) else {}
+        by_upper = {str(key).upper(): value for key, value in results.items()}
+
+        urls: Dict[str, Optional[str]] = {}
+        for word in words:
+            video_urls = by_upper.get(word.upper()) or []
+            if isinstance(video_urls, str):
+                video_urls = [video_urls]
+            urls[word] = video_urls[0] if video_urls else None
+        return urls
+
+    def _disable_bulk(self, status_code: int) -> None:
+        """Fall back to per-word lookups for the rest of the process lifetime."""
+        self.bulk_enabled = False
+        log.info("SignASL API has no bulk endpoint, using per-word lookups", status=status_code)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the thread pool used for concurrent per-word fallback lookups."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="signasl-lookup"
             )
+        return self._executor
 
-            if response.status_code == 200:
-                data = response.json()
-                # SignASL API returns {"word": "hello", "video_urls": ["https://...", ...]}
-                # Get the first video URL from the array
-                video_urls = data.get("video_urls", [])
-                return video_urls[0] if video_urls else None
-            elif response.status_code == 404:
-                return None
-            else:
-                print(f"⚠ SignASL API returned status {response.status_code} for word: {word}")
+    def _get_video_urls_bulk(self, words: List[str]) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Resolve words with a single POST /api/video-urls request.
+
+        Returns:
+            Mapping of word to video URL (empty if the request failed),
+            or None if the upstream has no bulk endpoint
+        """
+        try:
+            response = self._get_session().post(
+                f"{self.base_url}/api/video-urls",
+                json={"words": words},
+                timeout=self.timeout
+            )
+            if response.status_code in BULK_UNSUPPORTED_STATUSES:
+                self._disable_bulk(response.status_code)
                 return None
+            if response.status_code != 200:
+                log.warning("SignASL API returned an unexpected status for bulk lookup", status=response.status_code, words=len(words))
+                self.metrics.signasl_errors.inc(kind="status", endpoint="bulk")
+                return {}
+            return self._parse_bulk_response(words, response.json())
 
         except requests.exceptions.Timeout:
-            print(f"⚠ SignASL API timeout for word: {word}")
-            return None
+            log.warning("SignASL API timeout for bulk lookup", words=len(words))
+            self.metrics.signasl_errors.inc(kind="timeout", endpoint="bulk")
+            return {}
         except requests.exceptions.ConnectionError:
-            print(f"⚠ Cannot connect to SignASL API at {self.base_url}")
-            return None
+            log.warning("Cannot connect to SignASL API", url=self.base_url)
+            self.metrics.signasl_errors.inc(kind="connection", endpoint="bulk")
+            return {}
         except Exception as e:
-            print(f"⚠ SignASL API error for word '{word}': {e}")
-            return None
+            log.warning("SignASL API error for bulk lookup", error=str(e))
+            self.metrics.signasl_errors.inc(kind="error", endpoint="bulk")
+            return {}
+
+    async def _get_video_urls_bulk_async(self, words: List[str]) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Async variant of _get_video_urls_bulk.
+
+        Returns:
+            Mapping of word to video URL (empty if the request failed),
+            or None if the upstream has no bulk endpoint
+        """
+        try:
+            response = await self._request_async("POST", "/api/video-urls", json={"words": words})
+            if response.status_code in BULK_UNSUPPORTED_STATUSES:
+                self._disable_bulk(response.status_code)
+                return None
+            if response.status_code != 200:
+                log.warning("SignASL API returned an unexpected status for bulk lookup", status=response.status_code, words=len(words))
+                self.metrics.signasl_errors.inc(kind="status", endpoint="bulk")
+                return {}
+            return self._parse_bulk_response(words, response.json())
+
+        except httpx.TimeoutException:
+            log.warning("SignASL API timeout for bulk lookup", words=len(words))
+            self.metrics.signasl_errors.inc(kind="timeout", endpoint="bulk")
+            return {}
+        except httpx.ConnectError:
+            log.warning("Cannot connect to SignASL API", url=self.base_url)
+            self.metrics.signasl_errors.inc(kind="connection", endpoint="bulk")
+            return {}
+        except Exception as e:
+            log.warning("SignASL API error for bulk lookup", error=str(e))
+            self.metrics.signasl_errors.inc(kind="error", endpoint="bulk")
+            return {}
+
+    def _fetch_or_failed(self, word: str) -> Any:
+        """Fetch one word for the per-word fallback, returning _FAILED on errors."""
+        try:
+            return self.fetch_video_url(word)
+        except SignASLError:
+            return _FAILED
+
+    def get_video_urls(self, words: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Get video URLs for many words.
+        Uses the bulk endpoint when available, otherwise falls back to
+        concurrent per-word requests (at most max_concurrency at a time).
+
+        Args:
+            words: Distinct words to get videos for
+
+        Returns:
+            Mapping of word to video URL, or None if SignASL has no video for it.
+            Words whose lookup failed (timeout, connection error, bad status)
+            are left out so callers can retry them later.
+        """
+        if not words:
+            return {}
+
+        if self.bulk_enabled and len(words) > 1:
+            urls: Dict[str, Optional[str]] = {}
+            for chunk in self._chunk_words(words):
+                chunk_urls = self._get_video_urls_bulk(chunk)
+                if chunk_urls is None:
+                    break
+                urls.update(chunk_urls)
+            else:
+                return urls
+
+        if len(words) == 1:
+            results = [self._fetch_or_failed(words[0])]
+        else:
+            results = list(self._get_executor().map(self._fetch_or_failed, words))
+        return {
+            word: url for word, url in zip(words, results)
+            if url is not _FAILED
+        }
+
+    async def get_video_urls_async(self, words: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Async variant of get_video_urls.
+
+        Args:
+            words: Distinct words to get videos for
+
+        Returns:
+            Mapping of word to video URL, or None if SignASL has no video for it.
+            Words whose lookup failed are left out.
+        """
+        if not words:
+            return {}
+
+        if self.bulk_enabled and len(words) > 1:
+            chunk_results = await asyncio.gather(
+                *(self._get_video_urls_bulk_async(chunk) for chunk in self._chunk_words(words))
+            )
+            if all(chunk_urls is not None for chunk_urls in chunk_results):
+                urls: Dict[str, Optional[str]] = {}
+                for chunk_urls in chunk_results:
+                    urls.update(chunk_urls)
+                return urls
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(word: str) -> Any:
+            async with semaphore:
+                try:
+                    return await self.fetch_video_url_async(word)
+                except SignASLError:
+                    return _FAILED
+
+        results = await asyncio.gather(*(fetch(word) for word in words))
+        return {
+            word: url for word, url in zip(words, results)
+            if url is not _FAILED
+        }
 
     def health_check(self) -> bool:
         """
@@ -64,7 +435,7 @@ class SignASLClient:
             True if API is healthy, False otherwise
         """
         try:
-            response = requests.get(
+            response = self._get_session().get(
                 f"{self.base_url}/health",
                 timeout=self.timeout
             )
@@ -72,6 +443,35 @@ class SignASLClient:
         except:
             return False
 
+    async def health_check_async(self) -> bool:
+        """
+        Check if SignASL API is available without blocking the event loop.
+
+        Returns:
+            True if API is healthy, False otherwise
+        """
+        try:
+            response = await self._get_async_client().get("/health")
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    def close(self) -> None:
+        """Close the pooled sync session and release its connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def aclose(self) -> None:
+        """Close both HTTP clients and release their connections."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+
 
 # Singleton instance
 _client = None
@@ -0,0 +1,246 @@
+"""
+Single-flight Request Coalescing
+Ensures only one in-flight call exists per key; concurrent callers for the
+same key wait for that call and share its result.
+
+Two flavours are provided:
+- SingleFlight: for threads (sync code paths)
+- AsyncSingleFlight: for coroutines on one event loop (async code paths)
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, List
+
+# Result placeholder for keys the leader's call did not return
+_MISSING = object()
+
+
+def _identity(item: Any) -> Hashable:
+    return item
+
+
+class SingleFlight:
+    """Coalesces concurrent calls across threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def in_flight(self) -> int:
+        """Number of keys currently being fetched."""
+        return len(self._calls)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether a call for key is in flight."""
+        return key in self._calls
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn once for key; concurrent callers with the same key get its result.
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument callable producing the result
+
+        Returns:
+            The result of the single in-flight call
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def do_many(
+        self,
+        items: List[Any],
+        fn: Callable[[List[Any]], Dict[Hashable, Any]],
+        key: Callable[[Any], Hashable] = _identity
+    ) -> Dict[Hashable, Any]:
+        """
+        Batch variant of do.
+
+        Items whose key is already in flight wait for that call; the rest are
+        passed to fn in a single call made by this thread.
+
+        Args:
+            items: Items to resolve
+            fn: Callable taking the items this caller leads and returning a
+                mapping of key to result (keys may be left out)
+            key: Maps an item to its coalescing key
+
+        Returns:
+            Mapping of key to result for every item that got a result
+        """
+        owned: List[Any] = []
+        owned_futures: Dict[Hashable, Future] = {}
+        waiting: Dict[Hashable, Future] = {}
+
+        with self._lock:
+            for item in items:
+                item_key = key(item)
+                if item_key in owned_futures or item_key in waiting:
+                    continue
+                future = self._calls.get(item_key)
+                if future is None:
+                    future = Future()
+                    self._calls[item_key] = future
+                    owned.append(item)
+                    owned_futures[item_key] = future
+                else:
+                    waiting[item_key] = future
+
+        results: Dict[Hashable, Any] = {}
+        if owned:
+            try:
+                results.update(fn(owned))
+            except BaseException as e:
+                for future in owned_futures.values():
+                    future.set_exception(e)
+                raise
+            else:
+                for item_key, future in owned_futures.items():
+                    future.set_result(results.get(item_key, _MISSING))
+            finally:
+                with self._lock:
+                    for item_key in owned_futures:
+                        self._calls.pop(item_key, None)
+
+        for item_key, future in waiting.items():
+            result = future.result()
+            if result is not _MISSING:
+                results[item_key] = result
+
+        return results
+
+
+def _fail_future(future: asyncio.Future, error: BaseException) -> None:
+    """
+    Propagate a leader's failure to its waiters.
+    A cancelled leader (e.g. client disconnect) must not cancel the waiters,
+    so they get a RuntimeError instead.
+    """
+    if isinstance(error, asyncio.CancelledError):
+        error = RuntimeError("Coalesced call was cancelled")
+    future.set_exception(error)
+    # Mark retrieved so an unobserved failure isn't logged
+    future.exception()
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent calls across coroutines of one event loop."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    def in_flight(self) -> int:
+        """Number of keys currently being fetched."""
+        return len(self._calls)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether a call for key is in flight."""
+        return key in self._calls
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn once for key; concurrent callers with the same key get its result.
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument coroutine function producing the result
+
+        Returns:
+            The result of the single in-flight call
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except BaseException as e:
+            _fail_future(future, e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._calls.pop(key, None)
+
+    async def do_many(
+        self,
+        items: List[Any],
+        fn: Callable[[List[Any]], Awaitable[Dict[Hashable, Any]]],
+        key: Callable[[Any], Hashable] = _identity
+    ) -> Dict[Hashable, Any]:
+        """
+        Batch variant of do.
+
+        Args:
+            items: Items to resolve
+            fn: Coroutine function taking the items this caller leads and
+                returning a mapping of key to result (keys may be left out)
+            key: Maps an item to its coalescing key
+
+        Returns:
+            Mapping of key to result for every item that got a result
+        """
+        loop = asyncio.get_running_loop()
+        owned: List[Any] = []
+        owned_futures: Dict[Hashable, asyncio.Future] = {}
+        waiting: Dict[Hashable, asyncio.Future] = {}
+
+        for item in items:
+            item_key = key(item)
+            if item_key in owned_futures or item_key in waiting:
+                continue
+            future = self._calls.get(item_key)
+            if future is None:
+                future = loop.create_future()
+                self._calls[item_key] = future
+                owned.append(item)
+                owned_futures[item_key] = future
+            else:
+                waiting[item_key] = future
+
+        results: Dict[Hashable, Any] = {}
+        if owned:
+            try:
+                results.update(await fn(owned))
+            except BaseException as e:
+                for future in owned_futures.values():
+                    _fail_future(future, e)
+                raise
+            else:
+                for item_key, future in owned_futures.items():
+                    future.set_result(results.get(item_key, _MISSING))
+            finally:
+                for item_key in owned_futures:
+                    self._calls.pop(item_key, None)
+
+        for item_key, future in waiting.items():
+            result = await asyncio.shield(future)
+            if result is not _MISSING:
+                results[item_key] = result
+
+        return results
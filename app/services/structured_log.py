@@ -0,0 +1,118 @@
+"""
+Structured Logging
+JSON-lines diagnostics for the services, one object per event:
+
+    {"ts": "...", "level": "warning", "logger": "app.services.signasl_client",
+     "msg": "SignASL API timeout", "word": "HELLO", "trace_id": "..."}
+
+The message is a fixed string and the variable parts are fields, so
+events can be grouped and filtered. Lines logged while a request is
+traced carry its trace_id.
+
+Configuration:
+- LOG_FORMAT: json (default) or text (one readable line per event)
+- LOG_LEVEL: debug, info (default), warning or error
+- LOG_SAMPLE_RATE: fraction of info/warning events kept (default 1.0),
+  to bound hot-path noise such as per-word upstream failures; errors
+  are always kept
+"""
+
+import json
+import logging
+import os
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Any
+
+from dotenv import load_dotenv
+
+from app.services.tracing import current_trace
+
+# Read LOG_* before the first module-level logger is created
+load_dotenv()
+
+_configured = False
+_sample_rate = 1.0
+
+
+class JSONFormatter(logging.Formatter):
+    """Format a record and its fields as one JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class TextFormatter(logging.Formatter):
+    """Format a record as "LEVEL logger: msg key=value ..."."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = " ".join(f"{key}={value}" for key, value in getattr(record, "fields", {}).items())
+        line = f"{record.levelname:<7} {record.name}: {record.getMessage()}"
+        return f"{line} {fields}" if fields else line
+
+
+def configure_logging() -> None:
+    """Install the handler for app.* loggers (once, from LOG_* variables)."""
+    global _configured, _sample_rate
+    if _configured:
+        return
+    _configured = True
+    _sample_rate = min(max(float(os.getenv("LOG_SAMPLE_RATE", "1.0")), 0.0), 1.0)
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(TextFormatter() if os.getenv("LOG_FORMAT", "json").lower() == "text" else JSONFormatter())
+    logger = logging.getLogger("app")
+    logger.handlers = [handler]
+    logger.setLevel(os.getenv("LOG_LEVEL", "info").upper())
+    logger.propagate = False
+
+
+class StructuredLogger:
+    """Logs a fixed message plus keyword fields."""
+
+    def __init__(self, name: str):
+        configure_logging()
+        self._logger = logging.getLogger(name)
+
+    def _log(self, level: int, msg: str, fields: dict) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
+        if level < logging.ERROR and _sample_rate < 1.0 and random.random() >= _sample_rate:
+            return
+        trace = current_trace()
+        if trace is not None:
+            fields["trace_id"] = trace.trace_id
+        self._logger.log(level, msg, extra={"fields": fields})
+
+    def debug(self, msg: str, **fields: Any) -> None:
+        self._log(logging.DEBUG, msg, fields)
+
+    def info(self, msg: str, **fields: Any) -> None:
+        self._log(logging.INFO, msg, fields)
+
+    def warning(self, msg: str, **fields: Any) -> None:
+        self._log(logging.WARNING, msg, fields)
+
+    def error(self, msg: str, **fields: Any) -> None:
+        self._log(logging.ERROR, msg, fields)
+
+
+def get_logger(name: str) -> StructuredLogger:
+    """
+    Get a structured logger.
+
+    Args:
+        name: Logger name (the module's __name__)
+
+    Returns:
+        StructuredLogger instance
+    """
+    return StructuredLogger(name)
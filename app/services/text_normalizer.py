@@ -1,12 +1,133 @@
 """
 Text Normalizer Service
 Converts text into normalized ASL word tokens for video lookup.
+
+Two tokenizers are available (TEXT_TOKENIZER):
+- nltk: NLTK word_tokenize, imported on first use (default)
+- fast: a handful of precompiled regex passes over the whole text that
+  follow NLTK's word rules for the uppercase alphanumeric tokens we keep.
+  Sentence ends are approximated rather than found with punkt, so texts
+  with abbreviations or unusual sentence breaks can tokenize differently.
 """
 
+import os
 import re
 from typing import List
-import nltk
-from nltk.tokenize import word_tokenize
+
+from app.services.metrics import get_metrics
+from app.services.structured_log import get_logger
+from app.services.tracing import span
+
+log = get_logger(__name__)
+
+# Punctuation NLTK's word tokenizer always pads with spaces
+_ALWAYS = r"«“‘„`;@#$%&?!»”’\"*()\[\]{}<>"
+
+# What follows a sentence end: closing punctuation, then whitespace or the
+# end of the text. Punkt finds the word before each candidate break by
+# searching back for ASCII whitespace only, so a break followed by other
+# whitespace (NBSP, U+2028...) is dropped when the next candidate comes
+# before any ASCII whitespace.
+_SENTENCE_END = (
+    r"[\]\)}>\"'»”’]*"
+    r"(?:$|(?![^\t\n\x0b\x0c\r ]*?[.?!](?:[)\";}\]*:@'({\[!?]|\s+\S))\s)"
+)
+
+# Punctuation padded before NLTK's trailing-quote rule runs; periods only
+# split as "..." or at the end of a sentence
+_BEFORE_QUOTE = r"[«“‘„`;@#$%&?!]|\.{2,}|[:,](?!\d)|\.(?=" + _SENTENCE_END + r")"
+
+# Every character that can separate words, replaced by a space in one pass.
+# The pattern starts with a single character class so the regex engine can
+# skip ahead to candidates; the context rules are checked after it. The
+# capture group keeps the second of two commas/colons attached to what
+# follows, as NLTK does. A quote before a single-letter word that isn't a
+# clitic ("l'a") is split off like NLTK's starting-quote rule does.
+_SEPARATORS = re.compile(
+    r"[" + _ALWAYS + r".:,'-](?:"
+    r"(?<=[" + _ALWAYS + r"])"
+    r"|(?<=[:,])([:,])|(?<=[:,])(?!\d)"
+    r"|(?<=\.)\.+|(?<=\.)(?=" + _SENTENCE_END + r")"
+    r"|(?<=')'|(?<=[^']')(?= |" + _BEFORE_QUOTE + r")"
+    r"|(?<=')(?i:(?!re|ve|ll|m|t|s|d|n)(?=\w\b))"
+    r"|(?<=-)-)"
+)
+
+# Whitespace after a sentence end (not an ellipsis or an abbreviation like
+# "U.S."). Punkt starts the next sentence at the following token and NLTK
+# pads every sentence with a plain space, so the gap only matters when it
+# holds other whitespace (tabs, newlines, NBSP...)
+_SENTENCE_GAP = re.compile(
+    r"((?<!\.)(?<!\.\w)\.|[?!][.?!]*)(?=" + _SENTENCE_END + r")([\"')\]}]*)\s+(?=\S)"
+)
+_ODD_SPACE = re.compile(r"[^\S ]")
+
+# Clitics split off the end of a word ("it's", "don't", "we'll"), in NLTK's
+# two passes; a space is inserted before each
+_CLITICS = (
+    re.compile(r"'(?<=[^' ]')(?=[sSmMdD]? )"),
+    re.compile(r"'(?<=[^' ]')(?=(?:ll|LL|re|RE|ve|VE) )|n(?<=[^' ]n)(?='t )|N(?<=[^' ]N)(?='T )"),
+)
+
+# Words NLTK splits in two ("cannot", "gonna", "'tis"), and substrings
+# that must be present for any of them to match
+_SPLIT_WORDS = re.compile(
+    r"(?i)\b(?:(can)(not)\b|(d)('ye)\b|(gim)(me)\b|(gon)(na)\b|(got)(ta)\b"
+    r"|(lem)(me)\b|(more)('n)\b|(wan)(na)(?=\s))| ('t)(is|was)\b"
+)
+_SPLIT_HINTS = ("cannot", "'ye", "gimme", "gonna", "gotta", "lemme", "'n", "wanna", " 't")
+
+
+def _split_word(match: "re.Match") -> str:
+    return " " + " ".join(part for part in match.groups() if part) + " "
+
+
+# Everything that isn't part of an uppercase alphanumeric token
+_NON_TOKEN = re.compile(r"[^A-Z0-9\s]+")
+
+# Trailing word of a text stream, which may still grow, and any whitespace
+# after it, which may still turn out to end the text. Words end at ASCII
+# whitespace, the only whitespace punkt looks back to.
+_UNFINISHED_WORD = re.compile(r"[^\t\n\x0b\x0c\r ]*[\t\n\x0b\x0c\r ]*$")
+
+# Stands in for the start of the next word after a streamed chunk, so rules
+# that look ahead don't mistake the end of the chunk for the end of the text
+_NEXT_WORD = "\x00"
+
+TOKENIZERS = ("nltk", "fast")
+
+
+def fast_tokenize(text: str, final: bool = True) -> List[str]:
+    """
+    Tokenize text into uppercase alphanumeric tokens without NLTK.
+
+    Follows NLTK word_tokenize followed by uppercasing and stripping
+    non-alphanumeric characters. Sentence ends are approximated as a
+    period, question or exclamation mark followed by whitespace rather
+    than found with punkt, which also knows abbreviations.
+
+    Args:
+        text: Input text
+        final: Whether the text ends here. Streamed chunks that end in
+            whitespace before the next word pass False.
+
+    Returns:
+        List of uppercase word tokens
+    """
+    if not final:
+        text += _NEXT_WORD
+    if _ODD_SPACE.search(text):
+        if final:
+            text = text.rstrip()
+        text = _SENTENCE_GAP.sub(r"\1\2 ", text)
+    text = " " + _SEPARATORS.sub(r" \1", text) + " "
+    if "'" in text:
+        for pattern in _CLITICS:
+            text = pattern.sub(r" \g<0>", text)
+    lowered = text.lower()
+    if any(hint in lowered for hint in _SPLIT_HINTS):
+        text = _SPLIT_WORDS.sub(_split_word, text)
+    return _NON_TOKEN.sub("", text.upper()).split()
 
 
 class TextNormalizer:
@@ -15,30 +136,59 @@ class TextNormalizer:
     Converts input text to uppercase word tokens suitable for sign language.
     """
 
-    def __init__(self):
-        """Initialize the text normalizer and download required NLTK data."""
-        self._ensure_nltk_data()
+    def __init__(self, tokenizer: str = None):
+        """
+        Initialize the text normalizer.
+
+        Args:
+            tokenizer: "nltk" or "fast" (defaults to TEXT_TOKENIZER)
+        """
+        tokenizer = (tokenizer or os.getenv("TEXT_TOKENIZER", "nltk")).lower()
+        if tokenizer not in TOKENIZERS:
+            log.warning("Unknown TEXT_TOKENIZER, using nltk", tokenizer=tokenizer)
+            tokenizer = "nltk"
+        self.tokenizer = tokenizer
+        self._word_tokenize = None
+        self.metrics = get_metrics()
 
     def _ensure_nltk_data(self):
-        """Download NLTK punkt tokenizer if not already present."""
+        """Import NLTK and download the punkt tokenizer if not already present."""
+        import nltk
+        from nltk.tokenize import word_tokenize
+
         try:
             nltk.data.find('tokenizers/punkt')
         except LookupError:
-            print("Downloading NLTK punkt tokenizer...")
+            log.info("Downloading NLTK punkt tokenizer")
             nltk.download('punkt', quiet=True)
+        self._word_tokenize = word_tokenize
+
+    def _nltk_tokenize(self, text: str) -> List[str]:
+        """Tokenize with NLTK word_tokenize, then uppercase and strip punctuation."""
+        if self._word_tokenize is None:
+            self._ensure_nltk_data()
 
-    def normalize(self, text: str) -> List[str]:
+        normalized_tokens = []
+        for token in self._word_tokenize(text):
+            # Convert to uppercase, keep only alphanumeric
+            token = _NON_TOKEN.sub('', token.upper())
+            if token:
+                normalized_tokens.append(token)
+        return normalized_tokens
+
+    def normalize(self, text: str, final: bool = True) -> List[str]:
         """
         Normalize text to ASL word tokens.
 
         Process:
-        1. Tokenize using NLTK word_tokenize
+        1. Tokenize (fast regex tokenizer or NLTK word_tokenize)
         2. Convert to uppercase
         3. Remove punctuation and special characters
         4. Filter out empty strings
 
         Args:
             text: Input text to normalize
+            final: Whether the text ends here (False for streamed chunks)
 
         Returns:
             List of uppercase word tokens
@@ -51,23 +201,10 @@ class TextNormalizer:
         if not text or not text.strip():
             return []
 
-        # Tokenize using NLTK
-        tokens = word_tokenize(text)
-
-        # Process tokens
-        normalized_tokens = []
-        for token in tokens:
-            # Convert to uppercase
-            token = token.upper()
-
-            # Remove punctuation and special characters, keep only alphanumeric
-            token = re.sub(r'[^A-Z0-9]', '', token)
-
-            # Add non-empty tokens
-            if token:
-                normalized_tokens.append(token)
-
-        return normalized_tokens
+        with self.metrics.normalize_latency.time(), span("normalize"):
+            if self.tokenizer == "nltk":
+                return self._nltk_tokenize(text)
+            return fast_tokenize(text, final)
 
     def normalize_to_string(self, text: str) -> str:
         """
@@ -87,6 +224,60 @@ class TextNormalizer:
         tokens = self.normalize(text)
         return ' '.join(tokens)
 
+    def incremental(self) -> "IncrementalNormalizer":
+        """Create an incremental normalizer for streamed text."""
+        return IncrementalNormalizer(self)
+
+
+class IncrementalNormalizer:
+    """
+    Normalizes text that arrives in chunks (e.g. streamed LLM output).
+
+    A word's tokens are emitted once the next word has started, so chunk
+    boundaries inside a word never split it. Feeding a whole text
+    and then calling finish() yields the same tokens as normalize().
+    """
+
+    def __init__(self, normalizer: TextNormalizer):
+        self.normalizer = normalizer
+        self._pending = ""
+        # Whitespace before the pending word; some rules look one character back
+        self._lead = ""
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Add a chunk of text.
+
+        Args:
+            chunk: Next piece of the text
+
+        Returns:
+            Tokens of the words finished before this chunk's last word
+        """
+        self._pending += chunk
+        boundary = _UNFINISHED_WORD.search(self._pending).start()
+        if boundary == 0:
+            return []
+        finished = self._lead + self._pending[:boundary]
+        self._lead, self._pending = self._pending[boundary - 1], self._pending[boundary:]
+        if _ODD_SPACE.match(self._lead) and any(
+            gap.end() == len(finished) for gap in _SENTENCE_GAP.finditer(finished + _NEXT_WORD)
+        ):
+            # The next sentence starts here, after a plain space
+            self._lead = " "
+        return self.normalizer.normalize(finished, final=False)
+
+    def finish(self) -> List[str]:
+        """
+        Mark the end of the text.
+
+        Returns:
+            Tokens of the last, unterminated word (if any)
+        """
+        finished = self._lead + self._pending
+        self._lead, self._pending = "", ""
+        return self.normalizer.normalize(finished)
+
 
 # Singleton instance
 _normalizer = None
@@ -0,0 +1,179 @@
+"""
+Request Tracing
+Opt-in per-request timing breakdown: where a request spent its time
+between the LLM, text normalization, video lookups and response building.
+
+A trace is started by the endpoint for the current request and held in a
+context variable, so services record spans without it being passed
+around. When no trace is active, span() returns a shared no-op context
+manager.
+
+Modes (TRACE_MODE):
+- off: never trace
+- request: trace requests that ask for it with "debug": true (default)
+- all: trace every request (Server-Timing header on every response; the
+  debug field is still only returned when requested)
+
+A finished trace is returned as a Server-Timing header and, on request,
+as the response's debug field.
+"""
+
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+MODES = ("off", "request", "all")
+
+_current: ContextVar[Optional["Trace"]] = ContextVar("gesturegpt_trace", default=None)
+
+
+class _NullSpan:
+    """Context manager used when no trace is active."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, trace: "Trace", name: str, attributes: Dict[str, Any]):
+        self.trace = trace
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.trace.add(self.name, self.started, time.perf_counter() - self.started, **self.attributes)
+
+
+class Trace:
+    """Spans recorded for one request."""
+
+    def __init__(self, max_spans: int = 500):
+        """
+        Args:
+            max_spans: Spans kept in detail (more are only aggregated)
+        """
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.started = time.perf_counter()
+        self.max_spans = max_spans
+        self.spans: List[Dict[str, Any]] = []
+        # name -> [total seconds, count], in first-seen order
+        self.totals: Dict[str, List[float]] = {}
+
+    def span(self, name: str, **attributes: Any) -> _Span:
+        """Time a block as a span of this trace."""
+        return _Span(self, name, attributes)
+
+    def add(self, name: str, started: float, duration: float, **attributes: Any) -> None:
+        """
+        Record a span measured by the caller.
+
+        Args:
+            name: Span name (e.g. "llm", "lookup")
+            started: time.perf_counter() value when the span started
+            duration: Span length in seconds
+            **attributes: Extra details shown in the debug field
+        """
+        total = self.totals.setdefault(name, [0.0, 0])
+        total[0] += duration
+        total[1] += 1
+        if len(self.spans) < self.max_spans:
+            self.spans.append({
+                "name": name,
+                "start_ms": round((started - self.started) * 1000, 3),
+                "duration_ms": round(duration * 1000, 3),
+                "attributes": attributes or None,
+            })
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 3)
+
+    def server_timing(self) -> str:
+        """
+        Render the Server-Timing header: one metric per span name (summed
+        durations; desc holds the count when a span repeats) plus total.
+        Words looked up in one batch overlap, so their sum can exceed total.
+        """
+        metrics = []
+        for name, (seconds, count) in self.totals.items():
+            metric = f"{name};dur={seconds * 1000:.3f}"
+            if count > 1:
+                metric += f';desc="{int(count)}x"'
+            metrics.append(metric)
+        metrics.append(f"total;dur={self.elapsed_ms():.3f}")
+        return ", ".join(metrics)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the trace as returned in the response's debug field."""
+        return {
+            "trace_id": self.trace_id,
+            "total_ms": self.elapsed_ms(),
+            "spans": self.spans,
+        }
+
+
+def get_trace_mode() -> str:
+    """Get TRACE_MODE (off, request or all)."""
+    mode = os.getenv("TRACE_MODE", "request").lower()
+    return mode if mode in MODES else "request"
+
+
+def current_trace() -> Optional[Trace]:
+    """Get the trace of the current request, if it is traced."""
+    return _current.get()
+
+
+def span(name: str, **attributes: Any):
+    """
+    Time a block as a span of the current request's trace.
+
+    Args:
+        name: Span name
+        **attributes: Extra details shown in the debug field
+
+    Returns:
+        Context manager (a no-op when the request is not traced)
+    """
+    trace = _current.get()
+    if trace is None:
+        return _NULL_SPAN
+    return _Span(trace, name, attributes)
+
+
+@contextmanager
+def request_trace(requested: bool = False) -> Iterator[Optional[Trace]]:
+    """
+    Trace the current request when TRACE_MODE and the request allow it.
+
+    Args:
+        requested: Whether the request asked for a trace ("debug": true)
+
+    Yields:
+        The active trace, or None when the request is not traced
+    """
+    mode = get_trace_mode()
+    if mode == "off" or (mode == "request" and not requested):
+        yield None
+        return
+    trace = Trace()
+    token = _current.set(trace)
+    try:
+        yield trace
+    finally:
+        try:
+            _current.reset(token)
+        except ValueError:
+            # Closed from another context (e.g. an abandoned stream)
+            pass
@@ -0,0 +1,433 @@
+"""
+Video Composer
+Stitches the clips resolved for a sentence into one mp4 or gif under
+output/videos, so clients fetch a single file instead of one per word.
+
+Compositions run ffmpeg on a bounded process pool. Each composition is
+named after a hash of its inputs, so repeated sentences reuse the file
+already on disk; a JSON sidecar keeps the per-word timestamps. The
+composed directory is bounded by a disk budget: files are evicted least
+recently used first, going by their access time on disk so every worker
+sees the same order.
+
+Clips may be local (/videos/... under output/videos) or remote URLs;
+remote clips are downloaded to a temporary directory by the worker.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from app.services.structured_log import get_logger
+
+log = get_logger(__name__)
+
+FORMATS = ("mp4", "gif")
+
+# Container duration as reported by "ffmpeg -i"
+_DURATION = re.compile(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+
+
+class CompositionError(Exception):
+    """Raised when clips cannot be composed into one video."""
+
+
+def _probe_duration(ffmpeg: str, path: str, timeout: float) -> float:
+    """Get a media file's duration in seconds (ffmpeg prints it for any input)."""
+    result = subprocess.run(
+        [ffmpeg, "-hide_banner", "-i", path],
+        capture_output=True, text=True, timeout=timeout
+    )
+    match = _DURATION.search(result.stderr)
+    if match is None:
+        raise CompositionError(f"Could not read duration of {path}: {result.stderr.strip()[-300:]}")
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def _build_filter(count: int, format: str, width: int, height: int, fps: int) -> str:
+    """Scale, pad and concatenate every input into one video stream."""
+    parts = [
+        f"[{i}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+        f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps}[v{i}]"
+        for i in range(count)
+    ]
+    parts.append("".join(f"[v{i}]" for i in range(count)) + f"concat=n={count}:v=1:a=0[out]")
+    if format == "gif":
+        parts.append("[out]split[a][b];[a]palettegen[palette];[b][palette]paletteuse[gif]")
+    return ";".join(parts)
+
+
+def compose_clips(
+    inputs: List[str],
+    output_path: str,
+    format: str,
+    ffmpeg: str = "ffmpeg",
+    width: int = 480,
+    height: int = 360,
+    fps: int = 25,
+    timeout: float = 120
+) -> List[float]:
+    """
+    Concatenate clips into one video file (runs in a pool worker).
+
+    Args:
+        inputs: Local file paths or http(s) URLs, in playback order
+        output_path: File to write (replaced atomically)
+        format: "mp4" or "gif"
+        ffmpeg: ffmpeg executable
+        width: Output frame width
+        height: Output frame height
+        fps: Output frame rate
+        timeout: Max seconds for each download and ffmpeg run
+
+    Returns:
+        Duration of each input in seconds, in order
+    """
+    workdir = tempfile.mkdtemp(prefix="compose-")
+    try:
+        paths = []
+        for i, source in enumerate(inputs):
+            if source.startswith(("http://", "https://")):
+                extension = os.path.splitext(source.split("?", 1)[0])[1] or ".mp4"
+                path = os.path.join(workdir, f"{i}{extension}")
+                with urllib.request.urlopen(source, timeout=timeout) as response, open(path, "wb") as f:
+                    shutil.copyfileobj(response, f)
+                paths.append(path)
+            else:
+                paths.append(source)
+
+        durations = [_probe_duration(ffmpeg, path, timeout) for path in paths]
+
+        command = [ffmpeg, "-y", "-v", "error"]
+        for path in paths:
+            command += ["-i", path]
+        command += ["-filter_complex", _build_filter(len(paths), format, width, height, fps)]
+        if format == "gif":
+            command += ["-map", "[gif]", "-loop", "0"]
+        else:
+            command += [
+                "-map", "[out]", "-an", "-c:v", "libx264", "-preset", "veryfast",
+                "-pix_fmt", "yuv420p", "-movflags", "+faststart"
+            ]
+        partial = os.path.join(workdir, f"output.{format}")
+        result = subprocess.run(command + [partial], capture_output=True, text=True, timeout=timeout)
+        if result.returncode != 0:
+            raise CompositionError(f"ffmpeg failed: {result.stderr.strip()[-500:]}")
+
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        shutil.move(partial, output_path + ".tmp")
+        os.replace(output_path + ".tmp", output_path)
+        return durations
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+class Composition:
+    """A composed video and when each word plays in it."""
+
+    def __init__(self, url: str, format: str, timestamps: List[Dict[str, object]], duration: float):
+        self.url = url
+        self.format = format
+        self.timestamps = timestamps
+        self.duration = duration
+
+    def to_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "format": self.format,
+            "timestamps": self.timestamps,
+            "duration": self.duration,
+        }
+
+
+class VideoComposer:
+    """Composes sentence videos on a bounded process pool."""
+
+    def __init__(
+        self,
+        videos_dir: str = "output/videos",
+        subdir: str = "composed",
+        max_workers: int = 2,
+        timeout: float = 120,
+        width: int = 480,
+        height: int = 360,
+        fps: int = 25,
+        ffmpeg: str = "ffmpeg",
+        max_bytes: int = 1024 ** 3
+    ):
+        """
+        Args:
+            videos_dir: Directory served at /videos
+            subdir: Subdirectory of videos_dir for composed files
+            max_workers: Max concurrent ffmpeg compositions
+            timeout: Max seconds for each download and ffmpeg run
+            width: Output frame width
+            height: Output frame height
+            fps: Output frame rate
+            ffmpeg: ffmpeg executable
+            max_bytes: Disk budget for the composed subdirectory
+        """
+        self.videos_dir = videos_dir
+        self.subdir = subdir
+        self.output_dir = os.path.join(videos_dir, subdir)
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.ffmpeg = ffmpeg
+        self.max_bytes = max_bytes
+        self._available: Optional[bool] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self.composed = 0
+        self.reused = 0
+        self.failures = 0
+        self.evictions = 0
+
+    @property
+    def available(self) -> bool:
+        """Whether ffmpeg can be found (checked once)."""
+        if self._available is None:
+            self._available = shutil.which(self.ffmpeg) is not None
+            if not self._available:
+                log.warning("ffmpeg not found, video composition disabled", ffmpeg=self.ffmpeg)
+        return self._available
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def _source_for(self, url: str) -> str:
+        """Map a /videos/... URL to its file, leaving remote URLs as they are."""
+        if url.startswith("/videos/"):
+            return os.path.join(self.videos_dir, url[len("/videos/"):])
+        return url
+
+    def composition_key(self, clips: List[str], format: str) -> str:
+        """Name a composition after its inputs and output settings."""
+        payload = json.dumps([format, self.width, self.height, self.fps, clips])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def _paths(self, key: str, format: str, subdir: Optional[str] = None) -> Tuple[str, str, str]:
+        """Get the output file, its sidecar and its /videos URL."""
+        subdir = subdir or self.subdir
+        filename = f"{key}.{format}"
+        output_path = os.path.join(self.videos_dir, subdir, filename)
+        return output_path, output_path + ".json", f"/videos/{subdir}/{filename}"
+
+    def get_existing(self, key: str, format: str, subdir: Optional[str] = None) -> Optional[Composition]:
+        """Get an already composed video, or None."""
+        output_path, sidecar_path, url = self._paths(key, format, subdir)
+        if not (os.path.isfile(output_path) and os.path.isfile(sidecar_path)):
+            return None
+        try:
+            with open(sidecar_path, 'r') as f:
+                meta = json.load(f)
+        except Exception:
+            return None
+        return Composition(url, format, meta["timestamps"], meta["duration"])
+
+    async def compose(
+        self,
+        segments: List[Tuple[str, List[str]]],
+        format: str = "mp4",
+        subdir: Optional[str] = None
+    ) -> Composition:
+        """
+        Stitch the clips of a sentence into one video.
+
+        Args:
+            segments: (word, clip URLs) pairs in order; a fingerspelled word
+                has one clip per letter, a missing word has none
+            format: "mp4" or "gif"
+            subdir: Subdirectory of videos_dir to write to (default: composed)
+
+        Returns:
+            The composition, with start/end seconds for each word shown
+
+        Raises:
+            CompositionError: When there is nothing to compose or ffmpeg fails
+        """
+        if format not in FORMATS:
+            raise CompositionError(f"Unsupported format: {format}")
+        clips = [url for _, urls in segments for url in urls]
+        if not clips:
+            raise CompositionError("No clips to compose")
+        if not self.available:
+            raise CompositionError(f"ffmpeg not found: {self.ffmpeg}")
+
+        key = self.composition_key(clips, format)
+        existing = self.get_existing(key, format, subdir)
+        if existing is not None:
+            self.reused += 1
+            if self._budgeted(subdir):
+                self._touch(self._paths(key, format, subdir)[0])
+            return existing
+
+        # Concurrent requests for the same sentence share one ffmpeg run
+        pending_key = f"{subdir or self.subdir}/{key}"
+        pending = self._pending.get(pending_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[pending_key] = future
+        try:
+            composition = await self._compose_new(key, segments, clips, format, subdir)
+        except BaseException as e:
+            future.set_exception(e if isinstance(e, Exception) else CompositionError("Composition cancelled"))
+            future.exception()
+            raise
+        else:
+            future.set_result(composition)
+            return composition
+        finally:
+            self._pending.pop(pending_key, None)
+
+    async def _compose_new(
+        self,
+        key: str,
+        segments: List[Tuple[str, List[str]]],
+        clips: List[str],
+        format: str,
+        subdir: Optional[str] = None
+    ) -> Composition:
+        output_path, sidecar_path, url = self._paths(key, format, subdir)
+        loop = asyncio.get_running_loop()
+        try:
+            durations = await loop.run_in_executor(
+                self._get_pool(), compose_clips,
+                [self._source_for(clip) for clip in clips], output_path, format,
+                self.ffmpeg, self.width, self.height, self.fps, self.timeout
+            )
+        except CompositionError:
+            self.failures += 1
+            raise
+        except Exception as e:
+            self.failures += 1
+            raise CompositionError(str(e)) from e
+
+        timestamps = []
+        position = 0.0
+        clip_index = 0
+        for word, urls in segments:
+            if not urls:
+                continue
+            length = sum(durations[clip_index:clip_index + len(urls)])
+            clip_index += len(urls)
+            timestamps.append({"word": word, "start": round(position, 3), "end": round(position + length, 3)})
+            position += length
+        duration = round(position, 3)
+
+        with open(sidecar_path + ".tmp", 'w') as f:
+            json.dump({"clips": clips, "timestamps": timestamps, "duration": duration}, f)
+        os.replace(sidecar_path + ".tmp", sidecar_path)
+
+        self.composed += 1
+        if self._budgeted(subdir):
+            await asyncio.to_thread(self._evict, output_path)
+        return Composition(url, format, timestamps, duration)
+
+    def _budgeted(self, subdir: Optional[str]) -> bool:
+        """Whether a subdirectory is bounded by max_bytes (others, like phrases, have their own budget)."""
+        return (subdir or self.subdir) == self.subdir
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        """Mark a composition as used, keeping its mtime (and so its ETag)."""
+        try:
+            os.utime(path, (time.time(), os.stat(path).st_mtime))
+        except OSError:
+            pass
+
+    def _evict(self, keep: str) -> None:
+        """
+        Delete least recently used compositions (and their sidecars) until
+        the composed directory fits its budget.
+
+        Args:
+            keep: The composition just written, never evicted
+        """
+        try:
+            names = os.listdir(self.output_dir)
+        except OSError:
+            return
+        videos = []
+        total = 0
+        for name in names:
+            path = os.path.join(self.output_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            total += stat.st_size
+            if name.endswith(FORMATS) and path != keep:
+                videos.append((stat.st_atime, path, stat.st_size))
+        if total <= self.max_bytes:
+            return
+        for _, path, size in sorted(videos):
+            try:
+                os.remove(path)
+            except OSError:
+                # Already evicted by another worker
+                continue
+            total -= size
+            try:
+                total -= os.path.getsize(path + ".json")
+                os.remove(path + ".json")
+            except OSError:
+                pass
+            self.evictions += 1
+            if total <= self.max_bytes:
+                break
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get composition counters."""
+        return {
+            "available": self.available,
+            "max_workers": self.max_workers,
+            "in_progress": len(self._pending),
+            "composed": self.composed,
+            "reused": self.reused,
+            "failures": self.failures,
+            "evictions": self.evictions,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# Singleton instance
+_composer = None
+
+
+def get_video_composer() -> VideoComposer:
+    """Get singleton instance of VideoComposer."""
+    global _composer
+    if _composer is None:
+        _composer = VideoComposer(
+            max_workers=int(os.getenv("COMPOSE_MAX_WORKERS", "2")),
+            timeout=float(os.getenv("COMPOSE_TIMEOUT", "120")),
+            width=int(os.getenv("COMPOSE_WIDTH", "480")),
+            height=int(os.getenv("COMPOSE_HEIGHT", "360")),
+            fps=int(os.getenv("COMPOSE_FPS", "25")),
+            ffmpeg=os.getenv("FFMPEG_PATH", "ffmpeg"),
+            max_bytes=int(float(os.getenv("VIDEO_COMPOSE_MAX_MB", "1024")) * 1024 * 1024)
+        )
+    return _composer
@@ -0,0 +1,277 @@
+"""
+Video Files
+Serves output/videos at /videos with the caching and partial-content
+behavior video players rely on:
+
+- Strong ETags: the content hash for content-addressed clips
+  (mirror/<hh>/<sha256>.<ext>), otherwise derived from mtime and size
+- Cache-Control: immutable for directories whose files never change
+  under the same name (mirrored and composed clips)
+- Conditional requests (If-None-Match / If-Modified-Since) answered
+  with 304, and If-Range honored
+- Range requests answered with 206 (or 416), so scrubbing and repeat
+  plays read only the bytes needed
+- Response headers precomputed once per file version
+
+Bodies are sent with the ASGI zero-copy / pathsend extensions when the
+server offers them, otherwise read in large chunks at an offset.
+"""
+
+import mimetypes
+import os
+import re
+import stat
+from email.utils import formatdate, parsedate
+from typing import List, Optional, Sequence, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from app.services.lru_cache import LRUCache
+
+# Name stem of content-addressed files (sha256 hex digest)
+_CONTENT_HASH = re.compile(r"^[0-9a-f]{64}$")
+_RANGE = re.compile(r"^\s*(\d*)\s*-\s*(\d*)\s*$")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a Range header into one inclusive byte span.
+
+    Several ranges are coalesced into the span covering all of them, which
+    RFC 9110 allows and keeps a single-part 206 response.
+
+    Args:
+        header: Range header value (e.g. "bytes=0-1023", "bytes=-500")
+        size: File size in bytes
+
+    Returns:
+        (start, end) inclusive, or None when the header should be ignored
+
+    Raises:
+        ValueError: When no requested range overlaps the file (416)
+    """
+    unit, _, ranges = header.partition("=")
+    if unit.strip().lower() != "bytes" or not ranges:
+        return None
+
+    spans = []
+    for part in ranges.split(","):
+        match = _RANGE.match(part)
+        if match is None:
+            return None
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+            if last and end < start:
+                return None
+        elif last:
+            # Suffix range: the final N bytes
+            start = max(size - int(last), 0)
+            end = size - 1
+            if int(last) == 0:
+                continue
+        else:
+            return None
+        if start >= size:
+            continue
+        spans.append((start, min(end, size - 1)))
+
+    if not spans:
+        raise ValueError("Range not satisfiable")
+    return min(start for start, _ in spans), max(end for _, end in spans)
+
+
+class VideoFileResponse(Response):
+    """A whole file or one byte range of it."""
+
+    chunk_size = 1024 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        headers: List[Tuple[bytes, bytes]],
+        status_code: int = 200,
+        span: Optional[Tuple[int, int]] = None,
+        size: int = 0
+    ):
+        """
+        Args:
+            path: File to send
+            headers: Complete raw response headers
+            status_code: 200 or 206
+            span: Inclusive byte range to send (None for the whole file)
+            size: File size in bytes
+        """
+        self.path = path
+        self.status_code = status_code
+        self.raw_headers = headers
+        self.offset, end = span if span is not None else (0, size - 1)
+        self.count = end - self.offset + 1
+        self.whole_file = span is None
+        self.background = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope["method"] == "HEAD" or self.count <= 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        extensions = scope.get("extensions") or {}
+        if self.whole_file and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": os.path.abspath(self.path)})
+            return
+
+        with open(self.path, "rb") as f:
+            if "http.response.zerocopy" in extensions:
+                await send({
+                    "type": "http.response.zerocopy",
+                    "file": f.fileno(),
+                    "offset": self.offset,
+                    "count": self.count,
+                    "more_body": False,
+                })
+                return
+
+            fd = f.fileno()
+            offset, remaining = self.offset, self.count
+            while remaining > 0:
+                chunk = await anyio.to_thread.run_sync(os.pread, fd, min(self.chunk_size, remaining), offset)
+                if not chunk:
+                    break
+                offset += len(chunk)
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                # File shrank while sending
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+class VideoFiles(StaticFiles):
+    """StaticFiles with strong ETags, immutable caching and range support."""
+
+    def __init__(
+        self,
+        directory: str,
+        immutable_dirs: Sequence[str] = ("mirror", "composed"),
+        max_age: int = 3600,
+        header_cache_size: int = 4096
+    ):
+        """
+        Args:
+            directory: Directory to serve
+            immutable_dirs: Top-level subdirectories whose files never change
+                under the same name
+            max_age: Cache-Control max-age for other files, in seconds
+            header_cache_size: Max files whose headers are kept precomputed
+        """
+        super().__init__(directory=directory)
+        self.root = os.path.realpath(directory)
+        self.immutable_dirs = tuple(immutable_dirs)
+        self.max_age = max_age
+        self.header_cache = LRUCache(max_entries=header_cache_size)
+        self.not_modified = 0
+        self.partial = 0
+
+    def _base_headers(self, full_path: str, stat_result: os.stat_result) -> Tuple[str, str, List[Tuple[bytes, bytes]]]:
+        """Get (etag, last-modified, headers without content-length) for a file version."""
+        key = (full_path, stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+        cached = self.header_cache.get(key)
+        if cached is not LRUCache.MISSING:
+            return cached
+
+        relative = os.path.relpath(full_path, self.root)
+        stem, _ = os.path.splitext(os.path.basename(full_path))
+        if _CONTENT_HASH.match(stem):
+            etag = f'"{stem}"'
+        else:
+            etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        if relative.split(os.sep, 1)[0] in self.immutable_dirs:
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            cache_control = f"public, max-age={self.max_age}"
+        last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+
+        media_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+        headers = [
+            (b"content-type", media_type.encode("latin-1")),
+            (b"accept-ranges", b"bytes"),
+            (b"etag", etag.encode("latin-1")),
+            (b"last-modified", last_modified.encode("latin-1")),
+            (b"cache-control", cache_control.encode("latin-1")),
+        ]
+        entry = (etag, last_modified, headers)
+        self.header_cache.set(key, entry)
+        return entry
+
+    @staticmethod
+    def _etag_matches(etag: str, header: str) -> bool:
+        """Weak comparison, as If-None-Match uses."""
+        if header.strip() == "*":
+            return True
+        return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+    def file_response(
+        self,
+        full_path: str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200
+    ) -> Response:
+        if status_code != 200 or not stat.S_ISREG(stat_result.st_mode):
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        request_headers = Headers(scope=scope)
+        etag, last_modified, headers = self._base_headers(full_path, stat_result)
+        size = stat_result.st_size
+
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            not_modified = self._etag_matches(etag, if_none_match)
+        else:
+            since = parsedate(request_headers.get("if-modified-since", ""))
+            not_modified = since is not None and since >= parsedate(last_modified)
+        if not_modified:
+            self.not_modified += 1
+            return Response(status_code=304, headers={
+                name.decode("latin-1"): value.decode("latin-1")
+                for name, value in headers if name != b"content-type"
+            })
+
+        range_header = request_headers.get("range")
+        if range_header and size > 0:
+            if_range = request_headers.get("if-range")
+            # If-Range requires a strong match: same ETag or exact date
+            if if_range is None or if_range.strip() in (etag, last_modified):
+                try:
+                    span = parse_range(range_header, size)
+                except ValueError:
+                    return Response(status_code=416, headers={
+                        "content-range": f"bytes */{size}",
+                        "accept-ranges": "bytes",
+                    })
+                if span is not None:
+                    start, end = span
+                    self.partial += 1
+                    return VideoFileResponse(full_path, headers + [
+                        (b"content-range", f"bytes {start}-{end}/{size}".encode("latin-1")),
+                        (b"content-length", str(end - start + 1).encode("latin-1")),
+                    ], status_code=206, span=span, size=size)
+
+        return VideoFileResponse(
+            full_path, headers + [(b"content-length", str(size).encode("latin-1"))], size=size
+        )
+
+    def get_stats(self) -> dict:
+        """Get conditional/partial response counters."""
+        return {
+            "not_modified": self.not_modified,
+            "partial": self.partial,
+            "header_cache": self.header_cache.stats(),
+        }
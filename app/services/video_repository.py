@@ -3,11 +3,23 @@ Video Repository Service
 Manages ASL video lookups from SignASL API with local caching.
 """
 
+import asyncio
 import json
 import os
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from pathlib import Path
+from app.services.cache_backend import CacheBackend, create_cache_backend
+from app.services.cache_store import create_cache_store
+from app.services.clip_mirror import create_clip_mirror
+from app.services.fingerspelling import get_fingerspelling_index
+from app.services.metrics import get_metrics
 from app.services.signasl_client import get_signasl_client
+from app.services.singleflight import AsyncSingleFlight, SingleFlight
+from app.services.structured_log import get_logger
+from app.services.tracing import current_trace
+
+log = get_logger(__name__)
 
 
 class VideoInfo:
@@ -30,46 +42,302 @@ class VideoRepository:
     """
     Repository for ASL video lookups.
     Uses SignASL API with local caching for performance.
+
+    Two cache tiers are kept:
+    - positive cache: word -> video URL, kept forever
+    - negative cache: words SignASL has no video for, kept for a TTL
+
+    Lookup failures (timeouts, connection errors) are not negative-cached;
+    they only back off for a short retry window kept in memory.
+
+    Concurrent misses for the same word are coalesced into one SignASL fetch.
+    The positive cache lives in a CacheBackend, which can be shared by all
+    workers (VIDEO_CACHE_SHARED_BACKEND); the negative cache is per worker.
+
+    With FINGERSPELL_ENABLED, words still without a video are spelled out
+    from the preloaded letter/digit index instead of being reported missing.
+    With VIDEO_MIRROR_ENABLED, returned clip URLs point at local mirrored
+    copies under /videos once they have been downloaded.
     """
 
-    def __init__(self, cache_file: str = "data/video_cache.json"):
+    def __init__(self, cache_file: str = "data/video_cache.json", negative_cache_file: Optional[str] = None):
         """
         Initialize the video repository.
 
         Args:
-            cache_file: Path to JSON file for caching video URLs
+            cache_file: Path for caching video URLs (the extension follows
+                VIDEO_CACHE_BACKEND, e.g. data/video_cache.db for sqlite)
+            negative_cache_file: Path for caching words without videos
+                (defaults to video_negative_cache.json next to cache_file)
         """
         self.cache_file = cache_file
-        self.cache: Dict[str, str] = {}
+        self.negative_cache_file = negative_cache_file or os.path.join(
+            os.path.dirname(cache_file), "video_negative_cache.json"
+        )
+        self.cache: CacheBackend = create_cache_backend()
+        self.negative_cache: Dict[str, float] = {}
+        self.negative_ttl = float(os.getenv("VIDEO_NEGATIVE_CACHE_TTL", "86400"))
+        self.error_retry_after = float(os.getenv("VIDEO_ERROR_RETRY_AFTER", "30"))
+        self._error_until: Dict[str, float] = {}
+        # Bumped whenever cached results change, so derived caches can invalidate
+        self.version = 0
         self.signasl = get_signasl_client()
+        self._inflight = SingleFlight()
+        self._inflight_async = AsyncSingleFlight()
+        self.fingerspelling = get_fingerspelling_index()
+        self.mirror = create_clip_mirror(on_change=self._on_mirror_change)
+        self.metrics = get_metrics()
+        self.store = create_cache_store(self.cache_file)
+        self.negative_store = create_cache_store(self.negative_cache_file)
         self._load_cache()
 
     def _load_cache(self) -> None:
-        """Load video cache from JSON file."""
-        if not os.path.exists(self.cache_file):
-            print(f"Video cache not found, starting fresh")
-            self.cache = {}
-            return
+        """Load video cache and negative cache from their stores."""
+        self.version += 1
+        self._error_until = {}
+        self._load_negative_cache()
 
         try:
-            with open(self.cache_file, 'r') as f:
-                self.cache = json.load(f)
-            print(f"Loaded {len(self.cache)} cached videos from {self.cache_file}")
+            entries = self.store.load()
+            self.cache.load(entries)
+            if entries:
+                log.info("Loaded cached videos", entries=len(entries), path=self.store.path, cache=self.cache.name)
+            else:
+                log.info("Video cache not found, starting fresh")
         except json.JSONDecodeError as e:
-            print(f"Error loading video cache: {e}")
-            self.cache = {}
+            log.error("Error loading video cache", error=str(e))
         except Exception as e:
-            print(f"Unexpected error loading video cache: {e}")
-            self.cache = {}
+            log.error("Unexpected error loading video cache", error=str(e))
+
+    def _load_negative_cache(self) -> None:
+        """Load unexpired negative cache entries from their store."""
+        self.negative_cache = {}
+
+        try:
+            entries = self.negative_store.load()
+            now = time.time()
+            self.negative_cache = {
+                word: float(expires_at)
+                for word, expires_at in entries.items()
+                if float(expires_at) > now
+            }
+            if self.negative_cache:
+                log.info("Loaded negative cache entries", entries=len(self.negative_cache), path=self.negative_store.path)
+        except Exception as e:
+            log.error("Error loading negative video cache", error=str(e))
+            self.negative_cache = {}
 
     def _save_cache(self) -> None:
-        """Save video cache to JSON file."""
+        """Flush buffered video cache writes to disk."""
         try:
-            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
-            with open(self.cache_file, 'w') as f:
-                json.dump(self.cache, f, indent=2)
+            self.store.flush()
         except Exception as e:
-            print(f"Error saving video cache: {e}")
+            log.error("Error saving video cache", error=str(e))
+
+    def _save_negative_cache(self) -> None:
+        """Flush buffered negative cache writes to disk."""
+        try:
+            self.negative_store.flush()
+        except Exception as e:
+            log.error("Error saving negative video cache", error=str(e))
+
+    def flush(self) -> None:
+        """Persist all buffered cache writes now (e.g. on shutdown)."""
+        self._save_cache()
+        self._save_negative_cache()
+
+    def _should_fetch(self, word_upper: str, now: float) -> bool:
+        """Check whether an uncached word may be fetched from SignASL now."""
+        expires_at = self.negative_cache.get(word_upper)
+        if expires_at is not None:
+            if expires_at > now:
+                return False
+            self.negative_cache.pop(word_upper, None)
+            self.negative_store.delete(word_upper)
+
+        retry_at = self._error_until.get(word_upper)
+        if retry_at is not None:
+            if retry_at > now:
+                return False
+            self._error_until.pop(word_upper, None)
+
+        return True
+
+    def _collect_misses(self, words: List[str]) -> List[str]:
+        """
+        Get the distinct words that are not cached, in first-seen order.
+        Words in the negative cache or in an error retry window are skipped.
+
+        Args:
+            words: List of words to look up
+
+        Returns:
+            Deduplicated list of words that need a SignASL fetch
+        """
+        now = time.time()
+        misses = []
+        seen = set()
+        for word in words:
+            word_upper = word.upper()
+            if word_upper in self.cache or word_upper in seen:
+                continue
+            seen.add(word_upper)
+            if self._should_fetch(word_upper, now):
+                misses.append(word)
+        return misses
+
+    def _store_fetched(self, requested: List[str], fetched: Dict[str, Optional[str]]) -> Dict[str, str]:
+        """
+        Record SignASL results in the persistent store and negative cache.
+        Writes are buffered by the stores and flushed in batches.
+
+        Args:
+            requested: Words that were sent to SignASL
+            fetched: Mapping of word to fetched URL (None when SignASL has no video);
+                words missing from the mapping failed to resolve
+
+        Returns:
+            Resolved word -> URL entries, for the caller to add to the cache
+            backend (in one call, off the event loop when it blocks)
+        """
+        now = time.time()
+        if fetched:
+            self.version += 1
+
+        found = {}
+        for word in requested:
+            word_upper = word.upper()
+            if word not in fetched:
+                # Transient failure: retry soon, don't persist
+                self._error_until[word_upper] = now + self.error_retry_after
+            elif fetched[word]:
+                found[word_upper] = fetched[word]
+                self.store.set(word_upper, fetched[word])
+                if self.negative_cache.pop(word_upper, None) is not None:
+                    self.negative_store.delete(word_upper)
+            elif self.negative_ttl > 0:
+                self.negative_cache[word_upper] = now + self.negative_ttl
+                self.negative_store.set(word_upper, self.negative_cache[word_upper])
+        return found
+
+    def _fetch_misses(self, misses: List[str]) -> None:
+        """
+        Fetch uncached words from SignASL and record the results.
+        Concurrent callers share one in-flight fetch per word.
+        """
+        def fetch(words: List[str]) -> Dict[str, Optional[str]]:
+            # Another leader may have resolved some words since they were collected
+            words = [word for word in words if word.upper() not in self.cache]
+            fetched = self.signasl.get_video_urls(words)
+            self.cache.update(self._store_fetched(words, fetched))
+            return {word.upper(): url for word, url in fetched.items()}
+
+        self._inflight.do_many(misses, fetch, key=str.upper)
+
+    async def _fetch_misses_async(self, misses: List[str]) -> None:
+        """
+        Async variant of _fetch_misses.
+        Concurrent coroutines share one in-flight fetch per word.
+        """
+        async def fetch(words: List[str]) -> Dict[str, Optional[str]]:
+            words = [word for word in words if word.upper() not in self.cache]
+            fetched = await self.signasl.get_video_urls_async(words)
+            found = self._store_fetched(words, fetched)
+            if found:
+                if self.cache.blocking:
+                    await asyncio.to_thread(self.cache.update, found)
+                else:
+                    self.cache.update(found)
+            return {word.upper(): url for word, url in fetched.items()}
+
+        await self._inflight_async.do_many(misses, fetch, key=str.upper)
+
+    async def prefetch_async(self, words: List[str]) -> None:
+        """
+        Read words' cache entries off the event loop when the cache backend
+        does network I/O (Redis), so the lookups that follow hit its local
+        copy instead of blocking. A no-op for in-process backends.
+
+        Args:
+            words: Words about to be looked up
+        """
+        if self.cache.blocking and words:
+            await asyncio.to_thread(self.cache.get_many, [word.upper() for word in words])
+
+    def _timed(self) -> bool:
+        """Whether lookups are timed (metrics enabled or the request is traced)."""
+        return self.metrics.enabled or current_trace() is not None
+
+    def _observe_lookup(self, word: str, started: float, duration: float, result: str) -> None:
+        """Record one word's lookup latency in the metrics and the request trace."""
+        self.metrics.lookup_latency.observe(duration, result=result)
+        trace = current_trace()
+        if trace is not None:
+            trace.add("lookup", started, duration, word=word, result=result)
+
+    def _observe_lookups(self, words: List[str], misses: List[str], started: float, collected: float) -> None:
+        """
+        Record per-word lookup latency by outcome.
+
+        Cached and negative words share the time spent checking the local
+        tiers; fetched words waited for the whole lookup.
+        """
+        finished = time.perf_counter()
+        local = (collected - started) / max(len(words), 1)
+        fetched = {word.upper() for word in misses}
+        for word in words:
+            word_upper = word.upper()
+            if word_upper in fetched:
+                self._observe_lookup(word_upper, started, finished - started, "miss")
+            elif word_upper in self.cache:
+                self._observe_lookup(word_upper, started, local, "hit")
+            else:
+                self._observe_lookup(word_upper, started, local, "negative")
+
+    def _assemble_results(self, words: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Split words into cached video URLs and missing words, keeping token order.
+        Words without a video are fingerspelled when the fallback is enabled.
+        """
+        found_urls = []
+        missing_words = []
+
+        for word in words:
+            clips = self._clips_for(word)
+            if clips:
+                found_urls.extend(clips)
+            else:
+                missing_words.append(word)
+
+        return found_urls, missing_words
+
+    def _clips_for(self, word: str, count: bool = True) -> List[str]:
+        """Get the cached clip for a word, its fingerspelling, or nothing."""
+        url = self.cache.get(word.upper())
+        clips = [url] if url else self.fingerspelling.spell(word.upper(), count=count) or []
+        return [self.mirror.rewrite(clip) for clip in clips]
+
+    def _on_mirror_change(self) -> None:
+        """Mirrored URLs replace remote ones, so derived caches must refresh."""
+        self.version += 1
+
+    def get_clips(self, words: List[str]) -> List[Tuple[str, List[str]]]:
+        """
+        Get the clips for already looked-up words, without fetching.
+
+        Args:
+            words: Words in order
+
+        Returns:
+            (word, clip URLs) per word; empty when the word has no video
+        """
+        # The lookup that resolved these words already counted any spelling
+        return [(word, self._clips_for(word, count=False)) for word in words]
+
+    async def get_clips_async(self, words: List[str]) -> List[Tuple[str, List[str]]]:
+        """Async variant of get_clips that keeps backend reads off the event loop."""
+        await self.prefetch_async(words)
+        return self.get_clips(words)
 
     def lookup_word(self, word: str) -> Optional[str]:
         """
@@ -82,26 +350,57 @@ class VideoRepository:
         Returns:
             Video URL if found, None otherwise
         """
+        timed = self._timed()
+        started = time.perf_counter() if timed else 0.0
         # Normalize to uppercase for case-insensitive lookup
         word_upper = word.upper()
 
         # Check cache first
-        if word_upper in self.cache:
-            return self.cache[word_upper]
+        url = self.cache.get(word_upper)
+        if url or not self._should_fetch(word_upper, time.time()):
+            if timed:
+                self._observe_lookup(word_upper, started, time.perf_counter() - started, "hit" if url else "negative")
+            return url
 
         # Fetch from SignASL API
-        url = self.signasl.get_video_url(word)
-        if url:
-            # Cache the result
-            self.cache[word_upper] = url
-            self._save_cache()
+        self._fetch_misses([word])
+        if timed:
+            self._observe_lookup(word_upper, started, time.perf_counter() - started, "miss")
+        return self.cache.get(word_upper)
+
+    async def lookup_word_async(self, word: str) -> Optional[str]:
+        """
+        Async variant of lookup_word.
+        Cache hits return immediately; misses await the SignASL API.
+
+        Args:
+            word: The word to look up
+
+        Returns:
+            Video URL if found, None otherwise
+        """
+        timed = self._timed()
+        started = time.perf_counter() if timed else 0.0
+        await self.prefetch_async([word])
+        word_upper = word.upper()
+
+        url = self.cache.get(word_upper)
+        if url or not self._should_fetch(word_upper, time.time()):
+            if timed:
+                self._observe_lookup(word_upper, started, time.perf_counter() - started, "hit" if url else "negative")
             return url
 
-        return None
+        await self._fetch_misses_async([word])
+        if timed:
+            self._observe_lookup(word_upper, started, time.perf_counter() - started, "miss")
+        return self.cache.get(word_upper)
 
     def lookup_words(self, words: List[str]) -> Tuple[List[str], List[str]]:
         """
         Lookup multiple words.
+        Cache misses are deduplicated and resolved together through the
+        SignASL bulk lookup; words already being fetched by another request
+        are waited on instead of fetched again.
 
         Args:
             words: List of words to look up
@@ -109,17 +408,133 @@ class VideoRepository:
         Returns:
             Tuple of (found_video_urls, missing_words)
         """
-        found_urls = []
-        missing_words = []
+        timed = self._timed()
+        started = time.perf_counter() if timed else 0.0
+        misses = self._collect_misses(words)
+        collected = time.perf_counter() if timed else 0.0
+        if misses:
+            self._fetch_misses(misses)
+        if timed:
+            self._observe_lookups(words, misses, started, collected)
+
+        return self._assemble_results(words)
+
+    async def lookup_words_async(self, words: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Async variant of lookup_words.
+        Cache misses are deduplicated and resolved together through the
+        SignASL bulk lookup; words already being fetched by another request
+        are waited on instead of fetched again.
 
-        for word in words:
-            url = self.lookup_word(word)
-            if url:
-                found_urls.append(url)
-            else:
-                missing_words.append(word)
+        Args:
+            words: List of words to look up
 
-        return found_urls, missing_words
+        Returns:
+            Tuple of (found_video_urls, missing_words)
+        """
+        timed = self._timed()
+        started = time.perf_counter() if timed else 0.0
+        await self.prefetch_async(words)
+        misses = self._collect_misses(words)
+        collected = time.perf_counter() if timed else 0.0
+        if misses:
+            await self._fetch_misses_async(misses)
+        if timed:
+            self._observe_lookups(words, misses, started, collected)
+
+        return self._assemble_results(words)
+
+    async def _resolve_batch_async(self, words: List[str]) -> List[Optional[str]]:
+        """Resolve a batch of words, fetching the uncached ones, and return their URLs in order."""
+        timed = self._timed()
+        started = time.perf_counter() if timed else 0.0
+        await self.prefetch_async(words)
+        misses = self._collect_misses(words)
+        collected = time.perf_counter() if timed else 0.0
+        if misses:
+            await self._fetch_misses_async(misses)
+        if timed:
+            self._observe_lookups(words, misses, started, collected)
+        return [self.cache.get(word.upper()) for word in words]
+
+    async def lookup_stream(
+        self,
+        batches: AsyncIterator[List[str]]
+    ) -> AsyncIterator[Tuple[str, Optional[str]]]:
+        """
+        Resolve words as they arrive, overlapping lookups with the producer.
+
+        Each batch is resolved in the background as soon as it is received
+        (cached words immediately, misses in one concurrent fetch), while
+        the next batch is awaited. Results are yielded in input order.
+
+        Args:
+            batches: Async iterable of word lists (e.g. tokens per streamed chunk)
+
+        Yields:
+            (word, video URL or None) for every word, in order; a
+            fingerspelled word yields one (word, letter URL) per character
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                async for words in batches:
+                    if not words:
+                        continue
+                    await self.prefetch_async(words)
+                    if self._collect_misses(words):
+                        pending = asyncio.ensure_future(self._resolve_batch_async(words))
+                    else:
+                        pending = loop.create_future()
+                        pending.set_result([self.cache.get(word.upper()) for word in words])
+                    queue.put_nowait((words, pending))
+            finally:
+                queue.put_nowait(None)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                words, pending = item
+                try:
+                    urls = await pending
+                except BaseException:
+                    pending.cancel()
+                    raise
+                for word, url in zip(words, urls):
+                    letters = None if url else self.fingerspelling.spell(word.upper())
+                    if letters:
+                        for letter_url in letters:
+                            yield word, self.mirror.rewrite(letter_url)
+                    else:
+                        yield word, self.mirror.rewrite(url) if url else None
+            # Re-raise a failure of the producer (e.g. the text stream)
+            await producer
+        finally:
+            producer.cancel()
+            while not queue.empty():
+                item = queue.get_nowait()
+                if item is not None:
+                    item[1].cancel()
+
+    def add_videos(self, videos: Dict[str, str]) -> None:
+        """
+        Add known word -> URL entries without querying SignASL
+        (e.g. when seeding from a bundled index).
+
+        Args:
+            videos: Mapping of word to video URL
+        """
+        for word, url in videos.items():
+            word_upper = word.upper()
+            if self.cache.get(word_upper) != url:
+                self.cache[word_upper] = url
+                self.store.set(word_upper, url)
+                self.version += 1
 
     def get_all_videos(self) -> List[VideoInfo]:
         """
@@ -139,18 +554,57 @@ class VideoRepository:
 
         return videos
 
+    def get_cache_backend_name(self) -> str:
+        """Get the name of the video cache backend (local, mmap or redis)."""
+        return self.cache.name
+
     def get_total_videos(self) -> int:
         """Get total number of cached videos."""
         return len(self.cache)
 
     def reload_cache(self) -> None:
-        """Reload video cache from disk."""
+        """Reload video cache and negative cache from disk."""
+        self.flush()
         self._load_cache()
 
     def clear_cache(self) -> None:
-        """Clear the video cache."""
-        self.cache = {}
-        self._save_cache()
+        """
+        Clear the video cache (for shared backends, in every worker; Redis
+        near caches follow within VIDEO_CACHE_REDIS_NEAR_TTL seconds).
+        """
+        self.cache.clear()
+        self.store.clear()
+        self.version += 1
+
+    def get_negative_words(self) -> Dict[str, float]:
+        """
+        Get words SignASL has no video for, with their expiry times.
+
+        Returns:
+            Mapping of word to Unix timestamp when it will be retried
+        """
+        now = time.time()
+        return {
+            word: expires_at
+            for word, expires_at in self.negative_cache.items()
+            if expires_at > now
+        }
+
+    def get_total_negative(self) -> int:
+        """Get total number of unexpired negative cache entries."""
+        return len(self.get_negative_words())
+
+    def is_negative(self, word: str) -> bool:
+        """Check if a word is negative-cached (known to have no video)."""
+        expires_at = self.negative_cache.get(word.upper())
+        return expires_at is not None and expires_at > time.time()
+
+    def clear_negative_cache(self) -> None:
+        """Clear the negative cache and error retry windows so all words are fetched again."""
+        self.negative_cache = {}
+        self._error_until = {}
+        self.negative_store.clear()
+        self.version += 1
 
     def word_exists(self, word: str) -> bool:
         """
@@ -0,0 +1,204 @@
+"""
+Vocabulary Constraint
+Steers generated replies toward words that already have sign videos, so
+fewer words end up in missing_videos or need a SignASL lookup.
+
+Modes (VOCAB_MODE):
+- off: no constraint (default)
+- prompt: the ASL system prompt lists known words the model should prefer
+- rewrite: in the sign tokens of a reply, words SignASL is known to have
+  no video for (negative-cached) are replaced by a synonym from
+  data/asl_synonyms.json whose video is cached; the reply text shown to
+  the user is left unchanged
+- both: prompt and rewrite
+
+Both only consult the repository's caches, never SignASL.
+"""
+
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+from app.services.structured_log import get_logger
+from app.services.video_repository import VideoRepository, get_video_repository
+
+log = get_logger(__name__)
+
+MODES = ("off", "prompt", "rewrite", "both")
+
+
+class VocabularyConstraint:
+    """Prompt hint and synonym rewriting based on the cached vocabulary."""
+
+    def __init__(
+        self,
+        repository: VideoRepository,
+        mode: str = "off",
+        synonyms_file: str = "data/asl_synonyms.json",
+        word_lists: Optional[List[str]] = None,
+        prompt_words: int = 200,
+        prompt_refresh: float = 3600
+    ):
+        """
+        Args:
+            repository: Repository whose cached words form the vocabulary
+            mode: off, prompt, rewrite or both
+            synonyms_file: Uncovered word -> replacement candidates
+            word_lists: Word-frequency files ranking the prompt vocabulary
+            prompt_words: Max words listed in the prompt hint
+            prompt_refresh: Min seconds between prompt hint rebuilds
+        """
+        if mode not in MODES:
+            log.warning("Unknown VOCAB_MODE, using off", mode=mode)
+            mode = "off"
+        self.repository = repository
+        self.mode = mode
+        self.synonyms_file = synonyms_file
+        self.word_lists = word_lists or []
+        self.prompt_words = prompt_words
+        self.prompt_refresh = prompt_refresh
+        self.synonyms = self._load_synonyms() if self.rewrite_enabled else {}
+        self.substitutions = 0
+        self._hint: Optional[str] = None
+        self._hint_version = -1
+        self._hint_built_at = 0.0
+        self._hint_words = 0
+
+    @property
+    def prompt_enabled(self) -> bool:
+        return self.mode in ("prompt", "both")
+
+    @property
+    def rewrite_enabled(self) -> bool:
+        return self.mode in ("rewrite", "both")
+
+    def _load_synonyms(self) -> Dict[str, List[str]]:
+        """Load the synonym table, or an empty one if it is unavailable."""
+        if not os.path.exists(self.synonyms_file):
+            log.warning("Synonym file not found", path=self.synonyms_file)
+            return {}
+        try:
+            with open(self.synonyms_file, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            log.warning("Could not read synonym file", path=self.synonyms_file, error=str(e))
+            return {}
+        return {
+            word.upper(): [candidate.upper() for candidate in candidates]
+            for word, candidates in data.items()
+            if not word.startswith("_")
+        }
+
+    def _ranked_words(self) -> List[str]:
+        """Words from the word-frequency lists, in file order."""
+        words: Dict[str, None] = {}
+        for path in self.word_lists:
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        words.setdefault(line.split()[0].upper(), None)
+        return list(words)
+
+    def prompt_hint(self) -> Optional[str]:
+        """
+        Get the prompt sentence listing known words, or None when disabled.
+
+        The hint is rebuilt at most every prompt_refresh seconds, and only
+        when the repository changed, so the system prompt stays stable
+        (and cacheable) between rebuilds.
+        """
+        if not self.prompt_enabled or self.prompt_words <= 0:
+            return None
+        version = self.repository.version
+        stale = version != self._hint_version and time.monotonic() - self._hint_built_at >= self.prompt_refresh
+        if self._hint is None or stale:
+            known = {video.word for video in self.repository.get_all_videos()}
+            ranked = [word for word in self._ranked_words() if word in known]
+            ranked += sorted(known.difference(ranked))
+            words = ranked[:self.prompt_words]
+            self._hint = (
+                "Prefer these words, which have sign videos: " + ", ".join(words) + "."
+                if words else ""
+            )
+            self._hint_words = len(words)
+            self._hint_version = version
+            self._hint_built_at = time.monotonic()
+        return self._hint or None
+
+    def synonym(self, token: str) -> Optional[str]:
+        """
+        Get the synonym a token would be replaced by, without counting it.
+
+        Only tokens SignASL is known to have no video for are replaced;
+        a word that was simply never looked up may well have one.
+
+        Args:
+            token: Uppercase word token
+
+        Returns:
+            A synonym with a cached video, or None
+        """
+        if not self.rewrite_enabled or token not in self.synonyms or not self.repository.is_negative(token):
+            return None
+        for candidate in self.synonyms[token]:
+            if self.repository.word_exists(candidate):
+                return candidate
+        return None
+
+    def substitute(self, token: str) -> str:
+        """
+        Replace a token without a video by a synonym that has one.
+
+        Args:
+            token: Uppercase word token
+
+        Returns:
+            The synonym, or the token itself
+        """
+        candidate = self.synonym(token)
+        if candidate is None:
+            return token
+        self.substitutions += 1
+        return candidate
+
+    def rewrite_tokens(self, tokens: List[str]) -> List[str]:
+        """Apply substitute() to each token."""
+        if not self.rewrite_enabled:
+            return tokens
+        return [self.substitute(token) for token in tokens]
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get mode and substitution statistics."""
+        return {
+            "mode": self.mode,
+            "synonyms": len(self.synonyms),
+            "substitutions": self.substitutions,
+            "prompt_words": self._hint_words,
+        }
+
+
+# Singleton instance
+_constraint = None
+
+
+def get_vocabulary_constraint() -> VocabularyConstraint:
+    """Get or create the vocabulary constraint configured from the environment."""
+    global _constraint
+    if _constraint is None:
+        _constraint = VocabularyConstraint(
+            get_video_repository(),
+            mode=os.getenv("VOCAB_MODE", "off").lower(),
+            synonyms_file=os.getenv("VOCAB_SYNONYMS_FILE", "data/asl_synonyms.json"),
+            word_lists=[
+                path.strip()
+                for path in os.getenv("VIDEO_WARMUP_WORDLISTS", "data/common_words.txt").split(",")
+                if path.strip()
+            ],
+            prompt_words=int(os.getenv("VOCAB_PROMPT_WORDS", "200")),
+            prompt_refresh=float(os.getenv("VOCAB_PROMPT_REFRESH", "3600"))
+        )
+    return _constraint
@@ -0,0 +1,81 @@
+"""
+Word lookup benchmark
+Measures VideoRepository.lookup_words against the local SignASL stand-in,
+with and without the bulk endpoint.
+
+Usage:
+    python scripts/benchmark_lookup.py --words 20 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+import uvicorn
+
+from signasl_stub import create_app
+
+
+def start_stub(port: int, latency: float, bulk: bool) -> uvicorn.Server:
+    """Run the stand-in in a background thread and wait until it accepts requests."""
+    config = uvicorn.Config(
+        create_app(latency=latency, bulk=bulk, known_all=True),
+        host="127.0.0.1", port=port, log_level="warning"
+    )
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+def run(label: str, port: int, words, latency: float, bulk: bool, rounds: int) -> None:
+    os.environ["SIGNASL_API_URL"] = f"http://127.0.0.1:{port}"
+    server = start_stub(port, latency, bulk)
+
+    from app.services.signasl_client import SignASLClient
+    from app.services.video_repository import VideoRepository
+
+    timings = {"sync": [], "async": []}
+    for _ in range(rounds):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = VideoRepository(cache_file=os.path.join(tmp, "cache.json"))
+            repo.signasl = SignASLClient()
+            start = time.perf_counter()
+            repo.lookup_words(words)
+            timings["sync"].append(time.perf_counter() - start)
+
+            repo.clear_cache()
+            start = time.perf_counter()
+            asyncio.run(repo.lookup_words_async(words))
+            timings["async"].append(time.perf_counter() - start)
+
+    for mode, values in timings.items():
+        print(f"{label:<10} {mode:<6} {len(words)} misses: "
+              f"mean {1000 * sum(values) / len(values):8.1f} ms  min {1000 * min(values):8.1f} ms")
+
+    server.should_exit = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold-cache word lookups")
+    parser.add_argument("--words", type=int, default=20, help="Distinct cache misses per sentence")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated upstream delay (seconds)")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    words = [f"WORD{i}" for i in range(args.words)]
+    run("bulk", args.port, words, args.latency, bulk=True, rounds=args.rounds)
+    run("per-word", args.port + 1, words, args.latency, bulk=False, rounds=args.rounds)
+
+
+if __name__ == "__main__":
+    main()
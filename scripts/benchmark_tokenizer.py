@@ -0,0 +1,192 @@
+"""
+Tokenizer check and benchmark
+Verifies that the fast tokenizer produces the same tokens as the NLTK
+tokenizer on a fixed corpus plus randomly generated sentences, then times
+both.
+
+When NLTK's punkt data is not installed, an untrained punkt sentence
+tokenizer stands in for the English model; it splits the same way except
+after abbreviations, so texts with dotted abbreviations are then skipped.
+
+Usage:
+    python scripts/benchmark_tokenizer.py --fuzz 5000 --iterations 2000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.text_normalizer import fast_tokenize
+
+# Single sentences covering punctuation, clitics, quotes, numbers and unicode
+SENTENCES = [
+    "Hello, how are you?",
+    "Hello! How are you today?",
+    "I'm doing well, thank you for asking!",
+    "Nice to meet you! My name is ASL Assistant.",
+    "Good morning! I hope you're having a wonderful day.",
+    "Don't worry, we can't and won't stop; they'd've said so.",
+    "It's John's car, isn't it? Y'all shouldn't've.",
+    "I cannot go, I'm gonna stay. Gimme that, lemme see, I wanna go now.",
+    "'Tis the season, 'twas the night. More'n enough, d'ye hear?",
+    "The U.S. economy grew 3.5% in Q3... or so they say.",
+    "Call me at 555-1234 or email test@example.com (or not).",
+    "Prices: $1,000,000.00 vs. €2,50 -- quite a gap!",
+    "She said \"hello\" and ''goodbye'' then `left`.",
+    "Rock'n'roll o'clock l'amour ma'am.",
+    "He's here; she'll come: at 10:30, 11:45pm.",
+    "Well-known co-operation e-mail state-of-the-art.",
+    "Unicode quotes: “smart” ‘single’ «guillemets» don’t it’s.",
+    "Straße café naïve résumé ﬁne Ⅻ ½ ²",
+    "Tabs\tand\nnewlines  and   spaces",
+    "Emoji 👋 hello 🤟 love #ASL @friend *bold* [link] {brace} <tag>",
+    "What?! No!! Really?!?",
+    "a,b a:b a;b a/b a\\b a|b a+b a=b a~b a^b",
+    "1,2 1:2 3.14 1.2.3 v2.0 2nd 3rd",
+    "DON'T CAN'T I'M YOU'RE WE'VE THEY'LL SHE'D",
+    "DoN't wOn't It'S",
+    "cannot-do wannabe gonna, gotta. wanna",
+    "the dogs' bones and the cats' toys",
+    "It is what it is.",
+    "end with quote.'",
+    "end with paren.)",
+    "trailing comma,",
+    "trailing colon:",
+    "...",
+    "'",
+    "",
+]
+
+# Multi-sentence texts, including sentence ends before non-ASCII whitespace
+PARAGRAPHS = [
+    "I don't know. You don't either. We'll see.",
+    "Mr. Smith's car is here. It's red. Dr. Jones isn't.",
+    "Thanks for your message! I'm here to help translate your words into ASL. What would you like to say?",
+    "It's late.\u00a0OK, we're done.\u2028They'll see.\tI'm off!\u3000",
+]
+
+# Dotted abbreviations ("U.S.", "e.g."), which only the English punkt model knows
+ABBREVIATION = re.compile(r"\b(?:\w\.){2,}")
+
+# Typical assistant reply text for the benchmark
+PROSE = (
+    "ASL is a complete, natural language that has the same linguistic properties as spoken "
+    "languages, with grammar that differs from English. It is expressed by movements of the "
+    "hands and face, and it's the primary language of many North Americans who are deaf or "
+    "hard of hearing. "
+)
+
+FRAGMENTS = [
+    "hello", "don't", "can't", "it's", "I'm", "you're", "we'll", "they've", "she'd",
+    "cannot", "gonna", "wanna", "gimme", "'tis", "o'clock", "l'a", "more'n", "d'ye",
+    "U.S.", "e.g.", "3.14", "1,000", "10:30", "well-known", "a--b", "x...y",
+    "don’t", "“quote”", "«x»", "(paren)", "[br]", "{c}", "<t>", "#tag", "@me", "50%",
+    "$5", "a&b", "wow!", "why?", "semi;", "col:", "com,", "'single'", "\"double\"",
+    "''two''", "`tick`", "*star*", "café", "Straße", "naïve", "_under_", "x_y",
+    "dogs'", "'s", "n't", "'ll", "ABC", "mixed123", "42",
+]
+JOINERS = [" ", " ", " ", "  ", ", ", "; ", " - ", "\t", "\n", "-", "'", ",", ":"]
+
+
+def random_sentence(rng: random.Random) -> str:
+    """Build a random sentence from tricky fragments; mid-sentence periods are avoided."""
+    words = [rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 12))]
+    text = words[0]
+    for word in words[1:]:
+        text += rng.choice(JOINERS) + word
+    return text + rng.choice(["", ".", "?", "!", "...", ".\"", ".'"])
+
+
+def reference_tokenizer():
+    """Return NLTK-based reference tokenization and whether it uses the English punkt model."""
+    import nltk
+    from nltk.tokenize import NLTKWordTokenizer, PunktSentenceTokenizer, word_tokenize
+
+    try:
+        nltk.data.find('tokenizers/punkt')
+        tokenize = word_tokenize
+        english_model = True
+    except LookupError:
+        print("⚠ NLTK punkt data not found; splitting sentences with an untrained punkt tokenizer")
+        sentences, words = PunktSentenceTokenizer(), NLTKWordTokenizer()
+
+        def tokenize(text):
+            return [token for sentence in sentences.tokenize(text) for token in words.tokenize(sentence)]
+        english_model = False
+
+    def reference(text):
+        tokens = []
+        for token in tokenize(text):
+            token = "".join(c for c in token.upper() if "A" <= c <= "Z" or "0" <= c <= "9")
+            if token:
+                tokens.append(token)
+        return tokens
+
+    return reference, english_model
+
+
+def check(fuzz: int, seed: int) -> int:
+    """Compare fast and NLTK tokens; returns the number of mismatches."""
+    reference, english_model = reference_tokenizer()
+    rng = random.Random(seed)
+
+    cases = SENTENCES + PARAGRAPHS + [random_sentence(rng) for _ in range(fuzz)]
+    if not english_model:
+        cases = [text for text in cases if not ABBREVIATION.search(text)]
+
+    mismatches = 0
+    for text in cases:
+        expected = reference(text)
+        actual = fast_tokenize(text)
+        if expected != actual:
+            mismatches += 1
+            if mismatches <= 20:
+                print(f"✗ {text!r}\n    nltk: {expected}\n    fast: {actual}")
+
+    print(f"Checked {len(cases)} texts: {mismatches} mismatches")
+    return mismatches
+
+
+def benchmark(iterations: int) -> None:
+    """Time both tokenizers on short, typical and punctuation-heavy texts."""
+    reference, _ = reference_tokenizer()
+    samples = {
+        "short": SENTENCES[0],
+        "reply": " ".join(PARAGRAPHS[2:3] + [PROSE]),
+        "long": PROSE * 20,
+        "tricky": " ".join(SENTENCES) * 10,
+    }
+    for label, text in samples.items():
+        timings = {}
+        for name, fn in (("nltk", reference), ("fast", fast_tokenize)):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                fn(text)
+            timings[name] = (time.perf_counter() - start) / iterations * 1e6
+        print(
+            f"{label:>6} ({len(text):>5} chars): nltk {timings['nltk']:9.1f}us  "
+            f"fast {timings['fast']:8.1f}us  ({timings['nltk'] / timings['fast']:.1f}x)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and benchmark the fast tokenizer against NLTK")
+    parser.add_argument("--fuzz", type=int, default=5000, help="Random sentences to compare")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=2000, help="Benchmark iterations per sample")
+    parser.add_argument("--no-benchmark", action="store_true")
+    args = parser.parse_args()
+
+    mismatches = check(args.fuzz, args.seed)
+    if not args.no_benchmark:
+        benchmark(args.iterations)
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
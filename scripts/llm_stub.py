@@ -0,0 +1,165 @@
+"""
+OpenAI-compatible LLM stand-in
+A local fake chat completions server for testing the LLM provider clients
+(timeouts, retries, concurrency limits, streaming) without a real model.
+
+Routes:
+- GET  /v1/models
+- POST /v1/chat/completions   (stream=true sends SSE chunks)
+- GET  /stats                 (request counts and peak concurrency)
+
+The reply echoes the last user message in ASL-style uppercase.
+
+Usage:
+    python scripts/llm_stub.py --port 8002 --latency 0.2 --fail-rate 0.3
+    LLM_PROVIDER=openai OPENAI_BASE_URL=http://localhost:8002/v1 OPENAI_API_KEY=dummy uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import List, Optional
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+
+class StubMessage(BaseModel):
+    role: str
+    content: str
+
+
+class StubCompletionRequest(BaseModel):
+    model: str = "stub-model"
+    messages: List[StubMessage]
+    stream: bool = False
+    temperature: Optional[float] = None
+
+
+def create_app(
+    latency: float = 0.0,
+    token_delay: float = 0.0,
+    fail_rate: float = 0.0,
+    fail_status: int = 503,
+    seed: Optional[int] = None
+) -> FastAPI:
+    """
+    Build the stand-in app.
+
+    Args:
+        latency: Delay before the first byte of each response, in seconds
+        token_delay: Delay between streamed chunks, in seconds
+        fail_rate: Fraction of requests answered with fail_status
+        fail_status: HTTP status for simulated failures
+        seed: Random seed for reproducible failures
+    """
+    rng = random.Random(seed)
+    app = FastAPI(title="LLM stand-in")
+    app.state.stats = {"requests": 0, "failures": 0, "in_flight": 0, "peak_in_flight": 0}
+
+    def reply_for(messages: List[StubMessage]) -> str:
+        user_messages = [m.content for m in messages if m.role == "user"]
+        last = user_messages[-1] if user_messages else "hello"
+        return f"YOU SAY {last.upper()}. I UNDERSTAND."
+
+    @app.get("/stats")
+    async def stats():
+        return app.state.stats
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "stub-model", "object": "model", "owned_by": "stub"}]}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: StubCompletionRequest):
+        stats = app.state.stats
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        stats["peak_in_flight"] = max(stats["peak_in_flight"], stats["in_flight"])
+        try:
+            if latency:
+                await asyncio.sleep(latency)
+            if fail_rate and rng.random() < fail_rate:
+                stats["failures"] += 1
+                return JSONResponse(
+                    status_code=fail_status,
+                    content={"error": {"message": "Simulated failure", "type": "server_error"}}
+                )
+        finally:
+            if not request.stream:
+                stats["in_flight"] -= 1
+
+        completion_id = f"chatcmpl-stub-{stats['requests']}"
+        created = int(time.time())
+        reply = reply_for(request.messages)
+
+        if not request.stream:
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": request.model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": reply},
+                    "finish_reason": "stop"
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": len(reply.split()), "total_tokens": 0}
+            }
+
+        async def events():
+            try:
+                for word in reply.split(" "):
+                    if token_delay:
+                        await asyncio.sleep(token_delay)
+                    yield "data: " + json.dumps({
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": request.model,
+                        "choices": [{"index": 0, "delta": {"content": word + " "}, "finish_reason": None}]
+                    }) + "\n\n"
+                yield "data: " + json.dumps({
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": request.model,
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]
+                }) + "\n\n"
+                yield "data: [DONE]\n\n"
+            finally:
+                stats["in_flight"] -= 1
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local OpenAI-compatible LLM stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay before each response (seconds)")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="Delay between streamed chunks (seconds)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument("--fail-status", type=int, default=503, help="HTTP status of simulated failures")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    app = create_app(
+        latency=args.latency,
+        token_delay=args.token_delay,
+        fail_rate=args.fail_rate,
+        fail_status=args.fail_status,
+        seed=args.seed
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Fixture clip generator
+Renders short placeholder clips (a colored card with the word) for the
+words in data/video_index.json and, optionally, the fingerspelling
+letters, so composition and video serving can be exercised offline.
+
+Usage:
+    python scripts/make_fixture_clips.py                # words from the bundled index
+    python scripts/make_fixture_clips.py --letters      # also output/videos/fingerspelling/A-Z, 0-9
+    python scripts/make_fixture_clips.py --words HELLO,GOOD --duration 0.5
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import string
+import subprocess
+import sys
+from typing import List
+
+
+def render_clip(ffmpeg: str, path: str, label: str, duration: float, size: str) -> None:
+    """Render one clip, with the label drawn on it when drawtext is available."""
+    color = "0x" + hashlib.md5(label.encode("utf-8")).hexdigest()[:6]
+    source = f"color=c={color}:s={size}:d={duration}:r=25"
+    base = [ffmpeg, "-y", "-v", "error", "-f", "lavfi", "-i", source]
+    encode = ["-c:v", "libx264", "-pix_fmt", "yuv420p", "-movflags", "+faststart", path]
+    text = label.replace(":", "\\:").replace("'", "")
+    drawtext = f"drawtext=text='{text}':fontcolor=white:fontsize=48:x=(w-tw)/2:y=(h-th)/2"
+    if subprocess.run(base + ["-vf", drawtext] + encode, capture_output=True).returncode != 0:
+        # No font/drawtext support: plain colored card
+        subprocess.run(base + encode, check=True, capture_output=True)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Render placeholder sign clips for local testing")
+    parser.add_argument("--index", default="data/video_index.json", help="Word -> /videos/... index")
+    parser.add_argument("--words", default="", help="Comma-separated words (default: every word in --index)")
+    parser.add_argument("--letters", action="store_true", help="Also render fingerspelling letters and digits")
+    parser.add_argument("--videos-dir", default="output/videos")
+    parser.add_argument("--duration", type=float, default=1.0)
+    parser.add_argument("--size", default="320x240")
+    parser.add_argument("--ffmpeg", default=os.getenv("FFMPEG_PATH", "ffmpeg"))
+    args = parser.parse_args(argv)
+
+    clips = {}
+    if args.words:
+        for word in args.words.split(","):
+            clips[word.strip().upper()] = f"/videos/{word.strip().upper()}.mp4"
+    else:
+        with open(args.index, 'r') as f:
+            clips.update({word.upper(): url for word, url in json.load(f).items()})
+    if args.letters:
+        for char in string.ascii_uppercase + string.digits:
+            clips[f"letter {char}"] = f"/videos/fingerspelling/{char}.mp4"
+
+    rendered = 0
+    for label, url in clips.items():
+        if not url.startswith("/videos/"):
+            continue
+        path = os.path.join(args.videos_dir, url[len("/videos/"):])
+        if os.path.exists(path):
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        render_clip(args.ffmpeg, path, label.replace("letter ", ""), args.duration, args.size)
+        rendered += 1
+
+    print(f"Rendered {rendered} clips into {args.videos_dir} ({len(clips) - rendered} already present)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Redis stand-in
+A tiny in-memory server speaking enough of the Redis protocol (RESP) to
+exercise the redis video cache backend in tests and benchmarks.
+
+Supported commands: HELLO (RESP2/RESP3), PING, GET, INCR/INCRBY, HGET, HMGET, HSET,
+HDEL, HLEN, HGETALL, HKEYS, DEL, plus CLIENT/SELECT (acknowledged and
+ignored).
+
+Usage:
+    python scripts/redis_stub.py --port 6379
+    VIDEO_CACHE_SHARED_BACKEND=redis VIDEO_CACHE_REDIS_URL=redis://localhost:6379/0 uvicorn app.main:app --workers 4
+"""
+
+import argparse
+import asyncio
+from typing import Dict, List, Optional
+
+
+class RedisStub:
+    """In-memory hash store answering RESP requests."""
+
+    def __init__(self):
+        self.hashes: Dict[bytes, Dict[bytes, bytes]] = {}
+        self.strings: Dict[bytes, bytes] = {}
+
+    def handle(self, command: List[bytes], session: Dict[str, int]) -> bytes:
+        name = command[0].upper()
+        args = command[1:]
+
+        if name == b"HELLO":
+            session["proto"] = int(args[0]) if args else 2
+            info = [b"server", b"redis", b"version", b"7.0.0", b"proto", session["proto"]]
+            if session["proto"] == 3:
+                return _map(info)
+            return _array(info)
+        if name == b"PING":
+            return b"+PONG\r\n"
+        if name in (b"CLIENT", b"SELECT"):
+            return b"+OK\r\n"
+        if name == b"GET":
+            value = self.strings.get(args[0])
+            if value is None:
+                return b"_\r\n" if session["proto"] == 3 else b"$-1\r\n"
+            return _bulk(value)
+        if name in (b"INCR", b"INCRBY"):
+            value = int(self.strings.get(args[0], b"0")) + (int(args[1]) if len(args) > 1 else 1)
+            self.strings[args[0]] = str(value).encode()
+            return _int(value)
+        if name == b"HMGET":
+            table = self.hashes.get(args[0], {})
+            null = b"_\r\n" if session["proto"] == 3 else b"$-1\r\n"
+            values = [table.get(field) for field in args[1:]]
+            return b"*" + str(len(values)).encode() + b"\r\n" + b"".join(
+                null if value is None else _bulk(value) for value in values
+            )
+        if name == b"HGET":
+            value = self.hashes.get(args[0], {}).get(args[1])
+            if value is None:
+                # RESP3 has a dedicated null type
+                return b"_\r\n" if session["proto"] == 3 else b"$-1\r\n"
+            return _bulk(value)
+        if name == b"HSET":
+            table = self.hashes.setdefault(args[0], {})
+            added = 0
+            for field, value in zip(args[1::2], args[2::2]):
+                added += field not in table
+                table[field] = value
+            return _int(added)
+        if name == b"HDEL":
+            table = self.hashes.get(args[0], {})
+            return _int(sum(table.pop(field, None) is not None for field in args[1:]))
+        if name == b"HLEN":
+            return _int(len(self.hashes.get(args[0], {})))
+        if name == b"HGETALL":
+            table = self.hashes.get(args[0], {})
+            items = [item for pair in table.items() for item in pair]
+            return _map(items) if session["proto"] == 3 else _array(items)
+        if name == b"HKEYS":
+            return _array(list(self.hashes.get(args[0], {})))
+        if name == b"DEL":
+            return _int(sum(
+                (self.hashes.pop(key, None) or self.strings.pop(key, None)) is not None for key in args
+            ))
+        return b"-ERR unknown command '" + name + b"'\r\n"
+
+    async def serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        session = {"proto": 2}
+        try:
+            while True:
+                command = await _read_command(reader)
+                if command is None:
+                    break
+                writer.write(self.handle(command, session))
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+async def _read_command(reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+    line = await reader.readline()
+    if not line:
+        return None
+    if not line.startswith(b"*"):
+        # Inline command (e.g. from telnet)
+        return line.strip().split()
+    parts = []
+    for _ in range(int(line[1:])):
+        size = int((await reader.readline())[1:])
+        parts.append((await reader.readexactly(size + 2))[:-2])
+    return parts
+
+
+def _bulk(value) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, int):
+        return _int(value)
+    return b"$" + str(len(value)).encode() + b"\r\n" + value + b"\r\n"
+
+
+def _int(value: int) -> bytes:
+    return b":" + str(value).encode() + b"\r\n"
+
+
+def _array(values: List) -> bytes:
+    return b"*" + str(len(values)).encode() + b"\r\n" + b"".join(_bulk(v) for v in values)
+
+
+def _map(flat_pairs: List) -> bytes:
+    """RESP3 map from a flat [key, value, key, value, ...] list."""
+    return b"%" + str(len(flat_pairs) // 2).encode() + b"\r\n" + b"".join(_bulk(v) for v in flat_pairs)
+
+
+async def serve(host: str, port: int) -> None:
+    stub = RedisStub()
+    server = await asyncio.start_server(stub.serve_client, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local Redis stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
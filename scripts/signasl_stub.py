@@ -0,0 +1,121 @@
+"""
+SignASL API stand-in
+A local fake of the SignASL scraper API for tests and benchmarks.
+
+Serves the same routes as the real service:
+- GET  /health
+- GET  /api/video-url/{word}
+- POST /api/video-urls   (bulk lookup, disable with --no-bulk)
+
+Usage:
+    python scripts/signasl_stub.py --port 8001 --latency 0.05
+    SIGNASL_API_URL=http://localhost:8001 uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+DEFAULT_VOCABULARY_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "video_index.json")
+
+
+class BulkLookupRequest(BaseModel):
+    words: List[str]
+
+
+def load_vocabulary(path: str) -> List[str]:
+    """Load known words from a JSON index (keys) or a one-word-per-line text file."""
+    with open(path, 'r') as f:
+        if path.endswith(".json"):
+            return list(json.load(f).keys())
+        return [line.split()[0] for line in f if line.strip() and not line.startswith("#")]
+
+
+def create_app(
+    vocabulary: Optional[Iterable[str]] = None,
+    latency: float = 0.0,
+    bulk: bool = True,
+    known_all: bool = False,
+    video_host: str = "https://stub.signasl.local"
+) -> FastAPI:
+    """
+    Build the stand-in app.
+
+    Args:
+        vocabulary: Words that have videos (case-insensitive)
+        latency: Simulated upstream delay per request, in seconds
+        bulk: Whether to expose the bulk endpoint
+        known_all: Treat every word as having a video
+        video_host: Host used to build fake video URLs
+    """
+    known = {word.upper() for word in (vocabulary or [])}
+    app = FastAPI(title="SignASL API stand-in")
+    app.state.stats = {"single_requests": 0, "bulk_requests": 0, "words_resolved": 0}
+
+    def resolve(word: str) -> List[str]:
+        if known_all or word.upper() in known:
+            return [f"{video_host}/videos/{word.lower()}.mp4"]
+        return []
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/stats")
+    async def stats():
+        return app.state.stats
+
+    @app.get("/api/video-url/{word}")
+    async def video_url(word: str):
+        app.state.stats["single_requests"] += 1
+        app.state.stats["words_resolved"] += 1
+        if latency:
+            await asyncio.sleep(latency)
+        urls = resolve(word)
+        if not urls:
+            raise HTTPException(status_code=404, detail=f"No video for {word}")
+        return {"word": word.lower(), "video_urls": urls}
+
+    if bulk:
+        @app.post("/api/video-urls")
+        async def video_urls(request: BulkLookupRequest):
+            app.state.stats["bulk_requests"] += 1
+            app.state.stats["words_resolved"] += len(request.words)
+            if latency:
+                await asyncio.sleep(latency)
+            results: Dict[str, List[str]] = {
+                word.lower(): resolve(word) for word in request.words
+            }
+            return {"results": results}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local SignASL API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated delay per request (seconds)")
+    parser.add_argument("--vocabulary", default=DEFAULT_VOCABULARY_FILE, help="JSON index or word list of known words")
+    parser.add_argument("--all", action="store_true", help="Treat every word as having a video")
+    parser.add_argument("--no-bulk", action="store_true", help="Do not expose the bulk endpoint")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    app = create_app(
+        vocabulary=load_vocabulary(args.vocabulary),
+        latency=args.latency,
+        bulk=not args.no_bulk,
+        known_all=args.all
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Shared mmap video cache: probing, overflow and clears across workers."""
+
+import zlib
+
+import pytest
+
+from app.services.cache_backend import MmapCacheBackend
+
+SLOTS = 8
+
+
+def _colliding_keys(count: int, slots: int = SLOTS):
+    """Keys that all hash to the same slot."""
+    keys = []
+    index = 0
+    while len(keys) < count:
+        key = f"WORD{index}"
+        if zlib.crc32(key.encode()) % slots == 0:
+            keys.append(key)
+        index += 1
+    return keys
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "video_cache.mmap")
+
+
+def test_colliding_keys_probe_past_each_other(path):
+    cache = MmapCacheBackend(path, slots=SLOTS)
+    first, second, third = _colliding_keys(3)
+    cache[first] = "/videos/1.mp4"
+    cache[second] = "/videos/2.mp4"
+    cache[third] = "/videos/3.mp4"
+    assert [cache.get(key) for key in (first, second, third)] == ["/videos/1.mp4", "/videos/2.mp4", "/videos/3.mp4"]
+
+    # A tombstone keeps later keys on the chain reachable, and is reused
+    del cache[second]
+    assert second not in cache
+    assert cache[third] == "/videos/3.mp4"
+    cache[second] = "/videos/2b.mp4"
+    assert cache[second] == "/videos/2b.mp4"
+    assert len(cache) == 3
+
+    cache[first] = "/videos/1b.mp4"
+    assert cache[first] == "/videos/1b.mp4"
+    assert len(cache) == 3
+
+
+def test_workers_share_entries(path):
+    first = MmapCacheBackend(path, slots=SLOTS)
+    second = MmapCacheBackend(path)
+    first["HELLO"] = "/videos/hello.mp4"
+    assert second.slots == SLOTS
+    assert second["HELLO"] == "/videos/hello.mp4"
+    del second["HELLO"]
+    assert "HELLO" not in first
+
+
+def test_oversized_and_full_entries_overflow(path):
+    cache = MmapCacheBackend(path, slots=SLOTS)
+    long_key = "K" * (MmapCacheBackend.MAX_KEY + 1)
+    cache[long_key] = "/videos/long.mp4"
+    cache["LONGURL"] = "/" + "v" * MmapCacheBackend.MAX_VALUE
+    for index in range(SLOTS):
+        cache[f"WORD{index}"] = f"/videos/{index}.mp4"
+
+    stats = cache.stats()
+    assert stats["load_factor"] <= MmapCacheBackend.MAX_LOAD
+    assert stats["overflow_entries"] == 2 + SLOTS - int(MmapCacheBackend.MAX_LOAD * SLOTS)
+    assert len(cache) == SLOTS + 2
+    assert all(cache[f"WORD{index}"] == f"/videos/{index}.mp4" for index in range(SLOTS))
+    assert cache[long_key] == "/videos/long.mp4"
+
+
+def test_clear_reaches_other_workers_overflow(path):
+    first = MmapCacheBackend(path, slots=SLOTS)
+    second = MmapCacheBackend(path)
+    first["HELLO"] = "/videos/hello.mp4"
+    first["K" * 100] = "/videos/long.mp4"
+    assert len(first) == 2
+
+    second.clear()
+    assert "HELLO" not in first
+    assert first.get("K" * 100) is None
+    assert len(first) == 0
+
+    # Entries added after the clear are kept
+    first["K" * 100] = "/videos/long.mp4"
+    first["BYE"] = "/videos/bye.mp4"
+    assert first.get("K" * 100) == "/videos/long.mp4"
+    assert second["BYE"] == "/videos/bye.mp4"
+
+
+def test_reopen_keeps_entries(path):
+    cache = MmapCacheBackend(path, slots=SLOTS)
+    cache["HELLO"] = "/videos/hello.mp4"
+    cache.close()
+    assert dict(MmapCacheBackend(path).items()) == {"HELLO": "/videos/hello.mp4"}
+
+
+def test_rejects_foreign_file(path):
+    with open(path, "wb") as f:
+        f.write(b"x" * 128)
+    with pytest.raises(ValueError):
+        MmapCacheBackend(path)
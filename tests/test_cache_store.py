@@ -0,0 +1,90 @@
+"""File-backed cache stores shared by several workers."""
+
+import multiprocessing
+
+import pytest
+
+from app.services.cache_store import AppendLogStore, CacheStore, JSONFileStore, SQLiteStore, fcntl
+
+STORES = [JSONFileStore, AppendLogStore, SQLiteStore]
+
+
+def _write_keys(store_class, path: str, worker: int, count: int) -> None:
+    store = store_class(path, flush_batch_size=10)
+    for index in range(count):
+        store.set(f"W{worker}-{index}", {"video_url": f"/videos/{worker}/{index}.mp4"})
+        if index % 10 == 9:
+            store.flush()
+    store.close()
+
+
+@pytest.mark.parametrize("store_class", STORES)
+def test_round_trip(tmp_path, store_class):
+    path = str(tmp_path / "cache")
+    store = store_class(path)
+    store.set("HELLO", {"video_url": "/videos/hello.mp4"})
+    store.set("BYE", {"video_url": "/videos/bye.mp4"})
+    store.flush()
+    store.delete("BYE")
+    store.close()
+
+    assert store_class(path).load() == {"HELLO": {"video_url": "/videos/hello.mp4"}}
+
+
+@pytest.mark.parametrize("store_class", [JSONFileStore, AppendLogStore])
+def test_flush_merges_other_writers(tmp_path, store_class):
+    path = str(tmp_path / "cache")
+    first, second = store_class(path), store_class(path)
+    first.load()
+    second.load()
+
+    first.set("HELLO", 1)
+    first.flush()
+    second.set("BYE", 2)
+    second.flush()
+    second.delete("HELLO")
+    second.flush()
+    first.set("THANKS", 3)
+    first.flush()
+
+    assert store_class(path).load() == {"BYE": 2, "THANKS": 3}
+
+
+def test_log_compaction_keeps_other_writers_records(tmp_path):
+    path = str(tmp_path / "cache.log")
+    first = AppendLogStore(path, compact_min_records=5, compact_ratio=1.0)
+    second = AppendLogStore(path)
+    second.set("OTHER", 0)
+    second.flush()
+
+    for round_ in range(10):
+        first.set("HELLO", round_)
+        first.flush()
+
+    assert AppendLogStore(path).load() == {"HELLO": 9, "OTHER": 0}
+    with open(path) as f:
+        assert len(f.readlines()) < 10
+
+
+@pytest.mark.skipif(fcntl is None, reason="file stores are single-writer without fcntl")
+@pytest.mark.parametrize("store_class", STORES)
+def test_concurrent_workers_keep_every_key(tmp_path, store_class):
+    path = str(tmp_path / "cache")
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_write_keys, args=(store_class, path, worker, 200)) for worker in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+        assert worker.exitcode == 0
+
+    assert len(store_class(path).load()) == 4 * 200
+
+
+def test_base_class_is_abstract(tmp_path):
+    class Incomplete(CacheStore):
+        def _read_all(self):
+            return {}
+
+    with pytest.raises(TypeError):
+        Incomplete(str(tmp_path / "cache"))
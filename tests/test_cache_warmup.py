@@ -0,0 +1,77 @@
+"""
+Startup warm-up seeding and the single-worker prefetch lock.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.services.cache_warmup import CacheWarmer, fcntl
+
+
+class Repository:
+    def __init__(self):
+        self.videos = {}
+        self.looked_up = []
+
+    def add_videos(self, videos):
+        self.videos.update(videos)
+
+    def word_exists(self, word):
+        return word in self.videos
+
+    def is_negative(self, word):
+        return False
+
+    async def lookup_words_async(self, words):
+        self.looked_up += words
+        return [], []
+
+
+def make_warmer(tmp_path, repository, **kwargs):
+    index_file = tmp_path / "index.json"
+    index_file.write_text(json.dumps({
+        "hello": "https://cdn.example.com/hello.mp4",
+        "good": "/videos/GOOD.mp4",
+        "bye": "/videos/BYE.mp4",
+    }))
+    (tmp_path / "GOOD.mp4").write_bytes(b"clip")
+    words_file = tmp_path / "words.txt"
+    words_file.write_text("THE\nHELLO\n")
+    return CacheWarmer(
+        repository, index_file=str(index_file), word_lists=[str(words_file)],
+        videos_dir=str(tmp_path), lock_file=str(tmp_path / "warmup.lock"), **kwargs
+    )
+
+
+def test_seeds_remote_and_existing_local_clips(tmp_path):
+    repository = Repository()
+    assert make_warmer(tmp_path, repository).seed() == 2
+    assert repository.videos == {"HELLO": "https://cdn.example.com/hello.mp4", "GOOD": "/videos/GOOD.mp4"}
+
+
+def test_prefetches_unseeded_index_words_first(tmp_path):
+    repository = Repository()
+    warmer = make_warmer(tmp_path, repository)
+    warmer.seed()
+    assert warmer.get_prefetch_candidates() == ["BYE", "THE"]
+
+
+@pytest.mark.skipif(fcntl is None, reason="needs advisory file locks")
+def test_only_one_worker_prefetches(tmp_path):
+    first, second = Repository(), Repository()
+    holder = make_warmer(tmp_path, first)
+    assert holder._acquire_lock()
+    try:
+        warmer = make_warmer(tmp_path, second)
+        asyncio.run(warmer.run())
+        assert warmer.status["state"] == "skipped"
+        assert warmer.status["seeded"] == 2
+        assert second.looked_up == []
+    finally:
+        holder._release_lock()
+
+    asyncio.run(warmer.run())
+    assert warmer.status["state"] == "done"
+    assert second.looked_up == ["BYE", "THE"]
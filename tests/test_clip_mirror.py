@@ -0,0 +1,39 @@
+"""
+Clip mirror URLs when another worker evicted the file.
+"""
+
+import os
+
+from app.services.clip_mirror import ClipMirror
+
+URL = "https://example.com/hello.mp4"
+NAME = "ab" * 32 + ".mp4"
+
+
+def mirror_with_clip(tmp_path):
+    videos_dir = tmp_path / "videos"
+    path = videos_dir / "mirror" / NAME[:2] / NAME
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"clip")
+    index_file = str(tmp_path / "mirror.json")
+    writer = ClipMirror(enabled=True, videos_dir=str(videos_dir), index_file=index_file)
+    writer.store.set(URL, NAME)
+    writer.store.flush()
+    return ClipMirror(enabled=True, videos_dir=str(videos_dir), index_file=index_file), str(path)
+
+
+def test_returns_mirror_url_while_file_exists(tmp_path):
+    mirror, _ = mirror_with_clip(tmp_path)
+    assert mirror.rewrite(URL) == f"/videos/mirror/{NAME[:2]}/{NAME}"
+
+
+def test_falls_back_to_source_when_file_was_evicted(tmp_path):
+    mirror, path = mirror_with_clip(tmp_path)
+    os.remove(path)
+
+    assert mirror.rewrite(URL) == URL
+    assert URL not in mirror.index
+    assert NAME not in mirror.files
+    assert mirror.total_bytes == 0
+    mirror.store.flush()
+    assert URL not in mirror.store.load()
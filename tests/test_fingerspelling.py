@@ -0,0 +1,60 @@
+"""
+Fingerspelling index sources.
+"""
+
+import asyncio
+
+from app.services import fingerspelling
+from app.services.fingerspelling import FingerspellingIndex
+
+
+def make_index(tmp_path, **kwargs):
+    """Index with bundled entries for A (no file) and B (file present)."""
+    (tmp_path / "fingerspelling").mkdir(exist_ok=True)
+    (tmp_path / "fingerspelling" / "B.mp4").write_bytes(b"clip")
+    index_file = tmp_path / "index.json"
+    index_file.write_text('{"A": "/videos/fingerspelling/A.mp4", "B": "/videos/fingerspelling/B.mp4"}')
+    return FingerspellingIndex(
+        enabled=True, index_file=str(index_file), cache_file=str(tmp_path / "cache.json"),
+        videos_dir=str(tmp_path), **kwargs
+    )
+
+
+def test_bundled_clips_must_exist(tmp_path):
+    index = make_index(tmp_path)
+    assert index.letters == {"B": "/videos/fingerspelling/B.mp4"}
+    assert index.spell("AB") is None
+    assert index.spell("BB") == ["/videos/fingerspelling/B.mp4"] * 2
+
+
+def test_url_template_covers_the_rest(tmp_path):
+    index = make_index(tmp_path, url_template="https://cdn.example.com/{char}.mp4")
+    assert index.spell("AB1") == [
+        "https://cdn.example.com/A.mp4", "/videos/fingerspelling/B.mp4", "https://cdn.example.com/1.mp4"
+    ]
+
+
+def test_only_digits_are_resolved_through_signasl(tmp_path, monkeypatch):
+    requested = []
+
+    class Client:
+        async def get_video_urls_async(self, words):
+            requested.extend(words)
+            return {word: f"https://signasl.example/{word}.mp4" for word in words}
+
+    monkeypatch.setattr(fingerspelling, "get_signasl_client", Client)
+    index = make_index(tmp_path)
+    asyncio.run(index.resolve_missing())
+    assert requested == list("0123456789")
+    assert "A" not in index.letters
+
+
+def test_ignores_persisted_letters(tmp_path):
+    index = make_index(tmp_path)
+    index.store.set("I", "https://signasl.example/I.mp4")
+    index.store.set("7", "https://signasl.example/7.mp4")
+    index.store.flush()
+    reloaded = make_index(tmp_path)
+    assert "I" not in reloaded.letters
+    assert reloaded.letters["7"] == "https://signasl.example/7.mp4"
+
@@ -0,0 +1,49 @@
+"""
+Micro-batches dispatched while an earlier batch is still in flight.
+"""
+
+import asyncio
+import time
+
+from app.services.llm_scheduler import LLMScheduler
+
+
+async def handler(requests):
+    async def one(delay):
+        await asyncio.sleep(delay)
+        return delay
+    return await asyncio.gather(*(one(delay) for delay in requests))
+
+
+async def fast_reply_latency(scheduler):
+    """Seconds a fast request takes when submitted behind a slow batch."""
+    slow = asyncio.ensure_future(scheduler.submit("slow", 0.5))
+    await asyncio.sleep(0.05)
+    start = time.monotonic()
+    await scheduler.submit("fast", 0.0)
+    elapsed = time.monotonic() - start
+    await slow
+    await scheduler.aclose()
+    return elapsed
+
+
+def test_slow_batch_does_not_hold_back_later_ones():
+    scheduler = LLMScheduler(handler, batch_window=0.01)
+    assert asyncio.run(fast_reply_latency(scheduler)) < 0.3
+
+
+def test_max_batches_in_flight_queues_later_batches():
+    scheduler = LLMScheduler(handler, batch_window=0.01, max_batches_in_flight=1)
+    assert asyncio.run(fast_reply_latency(scheduler)) >= 0.3
+
+
+def test_batches_requests_within_window():
+    async def main():
+        scheduler = LLMScheduler(handler, coalesce=False, batch_window=0.02, max_batch_size=4)
+        results = await asyncio.gather(*(scheduler.submit(i, 0.01) for i in range(8)))
+        await scheduler.aclose()
+        return results, scheduler.get_stats()
+
+    results, stats = asyncio.run(main())
+    assert results == [0.01] * 8
+    assert stats["batches"] == 2
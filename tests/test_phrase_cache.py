@@ -0,0 +1,44 @@
+"""
+Pre-rendered phrases whose video another worker evicted.
+"""
+
+import os
+from types import SimpleNamespace
+
+from app.services.phrase_cache import PhraseCache, PhraseEntry
+from app.services.video_composer import Composition
+
+
+class Repository:
+    def get_clips(self, words):
+        return [(word, [f"/videos/{word.lower()}.mp4"]) for word in words]
+
+
+def cache_with_phrase(tmp_path):
+    composer = SimpleNamespace(videos_dir=str(tmp_path / "videos"), available=True)
+    cache = PhraseCache(Repository(), composer, enabled=True, index_file=str(tmp_path / "phrases.json"))
+    path = tmp_path / "videos" / "phrases" / "hello.mp4"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"video")
+    composition = Composition("/videos/phrases/hello.mp4", "mp4", [], 1.0)
+    cache._add(cache._key("HELLO YOU", "mp4"), PhraseEntry(["/videos/hello.mp4"], composition, 5))
+    return cache, str(path)
+
+
+def test_hit_while_video_exists(tmp_path):
+    cache, _ = cache_with_phrase(tmp_path)
+    entry = cache.get("HELLO YOU")
+    assert entry.composition.url == "/videos/phrases/hello.mp4"
+    assert entry.video_urls == ["/videos/hello.mp4", "/videos/you.mp4"]
+
+
+def test_drops_entry_when_video_was_evicted(tmp_path):
+    cache, path = cache_with_phrase(tmp_path)
+    os.remove(path)
+
+    assert cache.get("HELLO YOU") is None
+    assert cache.entries == {}
+    assert cache.total_bytes == 0
+    assert cache.invalidated == 1
+    cache.store.flush()
+    assert cache.store.load() == {}
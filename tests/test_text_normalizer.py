@@ -0,0 +1,129 @@
+"""
+Fast tokenizer equivalence with NLTK.
+
+The reference is NLTK's word_tokenize with the English punkt model when it
+is installed. Without it, an untrained punkt sentence tokenizer stands in;
+it only splits differently after abbreviations, which these texts avoid.
+"""
+
+import random
+
+import pytest
+
+from app.services.text_normalizer import TextNormalizer, fast_tokenize
+
+# Whitespace NLTK treats differently from a plain space
+UNICODE_SPACES = ["\t", "\n", "\r\n", "\x0b", "\x0c", "\x1c", "\x85", "\xa0", " ", " ", "　"]
+
+SENTENCES = [
+    "Hello, how are you?",
+    "I'm doing well, thank you for asking!",
+    "Don't worry, we can't and won't stop; they'd've said so.",
+    "It's John's car, isn't it? Y'all shouldn't've.",
+    "I cannot go, I'm gonna stay. Gimme that, lemme see, I wanna go now.",
+    "'Tis the season, 'twas the night. More'n enough, d'ye hear?",
+    "She said \"hello\" and ''goodbye'' then `left`.",
+    "Rock'n'roll o'clock l'amour ma'am.",
+    "Unicode quotes: “smart” ‘single’ «guillemets» don’t it’s.",
+    "the dogs' bones and the cats' toys",
+    "What?! No!! Really?!?",
+    "end with quote.'",
+]
+
+# Sentence ends and clitics next to whitespace other than a plain space
+UNICODE_TEXTS = [
+    "it's.\xa0ok",
+    "it's. ok",
+    "it's\xa0ok",
+    "it's ok",
+    "I'm　",
+    "we'll\t",
+    "don't.\"\n",
+    "why?\t'tis the season",
+    "It's late.\xa0'Tis true.",
+    "you're. gimme why? ok",
+    "It's late. OK, we're done. They'll see.\tI'm off!　",
+]
+
+FRAGMENTS = [
+    "hello", "don't", "can't", "it's", "I'm", "you're", "we'll", "they've", "she'd",
+    "cannot", "gonna", "wanna", "gimme", "'tis", "o'clock", "l'a", "more'n", "d'ye",
+    "1,000", "10:30", "well-known", "a--b", "don’t", "“quote”", "(paren)", "#tag",
+    "wow!", "why?", "semi;", "col:", "com,", "'single'", "\"double\"", "''two''",
+    "café", "dogs'", "'s", "n't", "'ll", "ABC", "42",
+]
+JOINERS = [" ", " ", "  ", ", ", " - ", "-", "'", ":"] + UNICODE_SPACES
+ENDINGS = ["", ".", "?", "!", "...", ".\"", ".'"]
+
+
+@pytest.fixture(scope="module")
+def reference():
+    """NLTK tokens, uppercased and stripped to alphanumerics."""
+    nltk = pytest.importorskip("nltk")
+    from nltk.tokenize import NLTKWordTokenizer, PunktSentenceTokenizer, word_tokenize
+
+    try:
+        nltk.data.find("tokenizers/punkt")
+        tokenize = word_tokenize
+    except LookupError:
+        sentences, words = PunktSentenceTokenizer(), NLTKWordTokenizer()
+
+        def tokenize(text):
+            return [token for sentence in sentences.tokenize(text) for token in words.tokenize(sentence)]
+
+    def tokens(text):
+        stripped = ("".join(c for c in token.upper() if "A" <= c <= "Z" or "0" <= c <= "9") for token in tokenize(text))
+        return [token for token in stripped if token]
+
+    return tokens
+
+
+def random_text(rng: random.Random) -> str:
+    """One to three random sentences joined by random whitespace."""
+    text = ""
+    for _ in range(rng.randint(1, 3)):
+        words = [rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 6))]
+        sentence = words[0]
+        for word in words[1:]:
+            sentence += rng.choice(JOINERS) + word
+        text += sentence + rng.choice(ENDINGS) + rng.choice([" "] + UNICODE_SPACES)
+    return text
+
+
+@pytest.mark.parametrize("text", SENTENCES + UNICODE_TEXTS)
+def test_matches_nltk(reference, text):
+    assert fast_tokenize(text) == reference(text)
+
+
+@pytest.mark.parametrize("space", UNICODE_SPACES)
+def test_clitics_next_to_unicode_whitespace(reference, space):
+    for text in (f"it's{space}ok", f"it's.{space}ok", f"they'll{space}", f"ok.{space}'tis so"):
+        assert fast_tokenize(text) == reference(text), repr(text)
+
+
+def test_random_texts_match_nltk(reference):
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = random_text(rng)
+        assert fast_tokenize(text) == reference(text), repr(text)
+
+
+def test_incremental_matches_whole_text():
+    normalizer = TextNormalizer("fast")
+    rng = random.Random(1)
+    for _ in range(500):
+        text = random_text(rng)
+        incremental = normalizer.incremental()
+        tokens = []
+        position = 0
+        while position < len(text):
+            size = rng.randint(1, 6)
+            tokens += incremental.feed(text[position:position + size])
+            position += size
+        tokens += incremental.finish()
+        assert tokens == normalizer.normalize(text), repr(text)
+
+
+def test_defaults_to_nltk(monkeypatch):
+    monkeypatch.delenv("TEXT_TOKENIZER", raising=False)
+    assert TextNormalizer().tokenizer == "nltk"
@@ -0,0 +1,50 @@
+"""
+Composed video disk budget and running without ffmpeg.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from app.services.video_composer import CompositionError, VideoComposer
+
+
+def write_composition(directory, name, size, accessed):
+    path = directory / f"{name}.mp4"
+    path.write_bytes(b"v" * size)
+    (directory / f"{name}.mp4.json").write_text("{}")
+    os.utime(path, (accessed, 1000))
+    return str(path)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    composer = VideoComposer(videos_dir=str(tmp_path), max_bytes=2500)
+    directory = tmp_path / "composed"
+    directory.mkdir()
+    oldest = write_composition(directory, "a", 1000, 100)
+    used = write_composition(directory, "b", 1000, 300)
+    newest = write_composition(directory, "c", 1000, 200)
+
+    composer._evict(newest)
+
+    assert not os.path.exists(oldest)
+    assert not os.path.exists(oldest + ".json")
+    assert os.path.exists(used) and os.path.exists(newest)
+    assert composer.evictions == 1
+
+
+def test_touch_keeps_modification_time(tmp_path):
+    path = write_composition(tmp_path, "a", 10, 100)
+    VideoComposer._touch(path)
+    stat = os.stat(path)
+    assert stat.st_mtime == 1000
+    assert stat.st_atime > 100
+
+
+def test_compose_without_ffmpeg(tmp_path):
+    composer = VideoComposer(videos_dir=str(tmp_path), ffmpeg="no-such-ffmpeg")
+    assert not composer.available
+    with pytest.raises(CompositionError):
+        asyncio.run(composer.compose([("HELLO", ["/videos/hello.mp4"])]))
+    assert composer.failures == 0
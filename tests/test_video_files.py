@@ -0,0 +1,129 @@
+"""Range and conditional request handling for /videos."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.services.video_files import IMMUTABLE_CACHE_CONTROL, VideoFiles, parse_range
+
+BODY = bytes(range(256)) * 40
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-99", (0, 99)),
+    ("bytes=100-", (100, 999)),
+    ("bytes=-100", (900, 999)),
+    ("bytes=-5000", (0, 999)),
+    ("bytes=990-5000", (990, 999)),
+    ("bytes=0-9, 20-29", (0, 29)),
+    ("bytes=500-599,-100", (500, 999)),
+    ("bytes = 10 - 19", (10, 19)),
+    ("BYTES=0-0", (0, 0)),
+])
+def test_parse_range(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", ["items=0-9", "bytes=", "bytes=abc", "bytes=-", "bytes=9-0", "bytes=0-9,x"])
+def test_parse_range_ignores_invalid_headers(header):
+    assert parse_range(header, 1000) is None
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=2000-3000", "bytes=-0", "bytes=1000-1999,-0"])
+def test_parse_range_unsatisfiable(header):
+    with pytest.raises(ValueError):
+        parse_range(header, 1000)
+
+
+@pytest.fixture
+def client(tmp_path):
+    (tmp_path / "clips").mkdir()
+    (tmp_path / "clips" / "hello.mp4").write_bytes(BODY)
+    (tmp_path / "mirror").mkdir()
+    (tmp_path / "mirror" / ("ab" * 32 + ".mp4")).write_bytes(BODY)
+    app = FastAPI()
+    files = VideoFiles(directory=str(tmp_path))
+    app.mount("/videos", files)
+    with TestClient(app) as test_client:
+        test_client.files = files
+        yield test_client
+
+
+def test_full_response_headers(client):
+    response = client.get("/videos/clips/hello.mp4")
+    assert response.status_code == 200
+    assert response.content == BODY
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-length"] == str(len(BODY))
+    assert response.headers["cache-control"] == "public, max-age=3600"
+
+    mirrored = client.get("/videos/mirror/" + "ab" * 32 + ".mp4")
+    assert mirrored.headers["etag"] == '"' + "ab" * 32 + '"'
+    assert mirrored.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+
+def test_range_returns_partial_content(client):
+    response = client.get("/videos/clips/hello.mp4", headers={"Range": "bytes=100-199"})
+    assert response.status_code == 206
+    assert response.content == BODY[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{len(BODY)}"
+    assert response.headers["content-length"] == "100"
+
+    suffix = client.get("/videos/clips/hello.mp4", headers={"Range": "bytes=-10"})
+    assert suffix.status_code == 206
+    assert suffix.content == BODY[-10:]
+    assert client.files.partial == 2
+
+
+def test_unsatisfiable_range_returns_416(client):
+    response = client.get("/videos/clips/hello.mp4", headers={"Range": f"bytes={len(BODY)}-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(BODY)}"
+
+
+def test_invalid_range_returns_whole_file(client):
+    response = client.get("/videos/clips/hello.mp4", headers={"Range": "bytes=abc"})
+    assert response.status_code == 200
+    assert response.content == BODY
+
+
+def test_if_none_match_returns_304(client):
+    etag = client.get("/videos/clips/hello.mp4").headers["etag"]
+
+    response = client.get("/videos/clips/hello.mp4", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    weak = client.get("/videos/clips/hello.mp4", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert weak.status_code == 304
+
+    changed = client.get("/videos/clips/hello.mp4", headers={"If-None-Match": '"other"'})
+    assert changed.status_code == 200
+    assert client.files.not_modified == 2
+
+
+def test_if_modified_since_returns_304(client):
+    last_modified = client.get("/videos/clips/hello.mp4").headers["last-modified"]
+    response = client.get("/videos/clips/hello.mp4", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    older = client.get("/videos/clips/hello.mp4", headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"})
+    assert older.status_code == 200
+
+
+def test_if_range_mismatch_returns_whole_file(client):
+    etag = client.get("/videos/clips/hello.mp4").headers["etag"]
+
+    matching = client.get("/videos/clips/hello.mp4", headers={"Range": "bytes=0-9", "If-Range": etag})
+    assert matching.status_code == 206
+
+    stale = client.get("/videos/clips/hello.mp4", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.content == BODY
+
+
+def test_head_sends_no_body(client):
+    response = client.head("/videos/clips/hello.mp4", headers={"Range": "bytes=0-9"})
+    assert response.status_code == 206
+    assert response.content == b""
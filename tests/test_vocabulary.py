@@ -0,0 +1,48 @@
+"""
+Synonym substitution in sign tokens.
+"""
+
+import json
+
+from app.services.vocabulary import VocabularyConstraint
+
+
+class Repository:
+    version = 0
+
+    def __init__(self, videos, negative):
+        self.videos = videos
+        self.negative = negative
+
+    def word_exists(self, word):
+        return word in self.videos
+
+    def is_negative(self, word):
+        return word in self.negative
+
+
+def make_constraint(tmp_path, repository):
+    synonyms_file = tmp_path / "synonyms.json"
+    synonyms_file.write_text(json.dumps({"_comment": "test", "glad": ["happy"], "huge": ["big"]}))
+    return VocabularyConstraint(repository, mode="rewrite", synonyms_file=str(synonyms_file))
+
+
+def test_substitutes_only_words_known_to_have_no_video(tmp_path):
+    repository = Repository(videos={"HAPPY", "BIG"}, negative={"GLAD"})
+    constraint = make_constraint(tmp_path, repository)
+    # HUGE was never looked up, so SignASL may still have it
+    assert constraint.rewrite_tokens(["I", "AM", "GLAD", "HUGE"]) == ["I", "AM", "HAPPY", "HUGE"]
+    assert constraint.substitutions == 1
+
+
+def test_keeps_token_without_a_cached_synonym(tmp_path):
+    repository = Repository(videos=set(), negative={"GLAD"})
+    constraint = make_constraint(tmp_path, repository)
+    assert constraint.synonym("GLAD") is None
+    assert constraint.rewrite_tokens(["GLAD"]) == ["GLAD"]
+
+
+def test_off_mode_leaves_tokens(tmp_path):
+    repository = Repository(videos={"HAPPY"}, negative={"GLAD"})
+    constraint = VocabularyConstraint(repository, mode="off")
+    assert constraint.rewrite_tokens(["GLAD"]) == ["GLAD"]